@@ -4,21 +4,28 @@
 # Email: ryomawithlst@gmail/outlook.com
 
 
-import math
-
-
 class BinaryMaxHeap:
     """二叉最大堆
-    
+
+    堆存放在从0开始编号的数组中：索引i的父节点为 `(i-1)//2` ，左右子节点为 `2i+1` 和 `2i+2` 。
+
+    各操作的运行时间：
+        - build_max_heap: :math:`O(n)`
+        - insert: :math:`O(\\lg n)` ，新元素放到数组末尾后向上调整
+        - extract_max: :math:`O(\\lg n)` ，将堆顶与最后一个元素交换后弹出，再将新的堆顶向下调整
+
     Example:
         >>> binary_max_heap = BinaryMaxHeap()
         >>> array = [5, 2, 7, 1, 8, 10, 3]
         >>> binary_max_heap.build_max_heap(array)
         >>> binary_max_heap.extract_max(array)
         10
+        >>> binary_max_heap.insert(array, 9)
+        >>> [binary_max_heap.extract_max(array) for _ in range(len(array))]
+        [9, 8, 7, 5, 3, 2, 1]
         >>> array2 = [(5, "i1"), (2, "i2"), (7, "i3"), (1, "i4"), (8, "i5"), (10, "i6"), (3, "i7")]
         >>> binary_max_heap.build_max_heap(array2, without_data=False)
-        >>> binary_max_heap.extract_max(array2)
+        >>> binary_max_heap.extract_max(array2, without_data=False)
         (10, 'i6')
     """
 
@@ -26,80 +33,115 @@ class BinaryMaxHeap:
     def get_parent_index(index: int):
         """计算父节点索引
         """
-        return index/2 if math.fmod(index,2) == 0 else (index-1)/2
+        return (index - 1) >> 1
 
     @staticmethod
     def get_left_child_index(index: int):
         """计算左子节点索引
         """
-        return 2*index
+        return 2*index + 1
 
     @staticmethod
     def get_right_child_index(index: int):
         """计算右子节点索引
         """
-        return 2*index + 1
+        return 2*index + 2
+
+    @staticmethod
+    def get_key(item):
+        """without_data为False时，取出元素中用于比较的值(元组的第一个元素)
+        """
+        return item[0]
 
     def max_heapify(self, array: list, index: int, heap_size: int, without_data=True):
         """最大堆堆化处理，维护最大堆的性质
-        
+
         最大堆性质：父节点必须大于等于左右子节点
-        
-        根据最大堆的性质将指定索引处的数调整到堆的它合适的位置:
-            - 将指定index处的值x与其左右孩子的进行比较，将最大的孩子与其交换位置，以满足最大堆性质，并再次递归处理x
-            - 当指定index处的值x比其左右孩子的都大，则不用再递归
+
+        根据最大堆的性质将指定索引处的数x调整到堆的它合适的位置(向下调整)：
+            - 将x取出，只要x的较大的孩子比x大，就将这个孩子上移一层，并继续与下一层比较
+            - 当x不小于它的两个孩子时，将x放入空出的位置
+
+        迭代实现，每层只移动一次元素，而不是交换两个元素。
 
         时间复杂度：:math:`O(lg n)`,n表示堆大小
-        
+
         Args:
             array (list): 存放堆数据的数组
             index (int): 指定的索引
             heap_size (int): 当前堆有效元素个数。(array[0:heap_size-1]中存放的才是堆上有效的元素)
             without_data (bool): 如果为False，则期望每个元素应是一个二元元组，并将元组第一个元素作为值进行比较，默认为True
         """
-        left = self.get_left_child_index(index)
-        right = self.get_right_child_index(index)
-        
-        largest_index = index
-        if without_data is False:
-            if left <= heap_size-1 and array[left][0] > array[index][0]:
-                largest_index = left
-            if right <= heap_size-1 and array[right][0] > array[largest_index][0]:
-                largest_index = right
-        else:
-            if left <= heap_size-1 and array[left] > array[index]:
-                largest_index = left
-            if right <= heap_size-1 and array[right] > array[largest_index]:
-                largest_index = right
-
-        if largest_index != index:     # 如果父节点不是最大的，那么与对应最大的子节点交换位置，并继续递归判断下一级
-            array[index], array[largest_index] = array[largest_index], array[index]
-            self.max_heapify(array, largest_index, heap_size, without_data)
+        key = None if without_data else self.get_key
+        item = array[index]
+        value = item if key is None else key(item)
+        child = 2*index + 1
+        while child < heap_size:
+            child_value = array[child] if key is None else key(array[child])
+            right = child + 1
+            if right < heap_size:
+                right_value = array[right] if key is None else key(array[right])
+                if child_value < right_value:
+                    child, child_value = right, right_value
+            if not value < child_value:
+                break
+            array[index] = array[child]
+            index = child
+            child = 2*index + 1
+        array[index] = item
+
+    def sift_up(self, array: list, index: int, without_data=True):
+        """将指定索引处的数向上调整：只要父节点比它小，就将父节点下移一层
+        """
+        key = None if without_data else self.get_key
+        item = array[index]
+        value = item if key is None else key(item)
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_value = array[parent] if key is None else key(array[parent])
+            if not parent_value < value:
+                break
+            array[index] = array[parent]
+            index = parent
+        array[index] = item
 
     def build_max_heap(self, array: list, without_data=True):
         """构建最大堆
-        
+
         自底向上的对所有的非叶子节点的数进行最大堆堆化处理。(叶子节点的数会在处理其父节点时进行被处理)
-        
-        因为二叉堆可以可以看成一颗近似的完全二叉树，所以`index >= len(array)//2 + 1` 的都是叶子节点
-        
+
+        因为二叉堆可以可以看成一颗近似的完全二叉树，所以`index >= len(array)//2` 的都是叶子节点
+
         时间复杂度：:math:`O(n)`
-        
+
         Args:
             array (list): 存放堆数据的数组
             without_data (bool): 如果为False，则期望每个元素应是一个二元元组，并将元组第一个元素作为值进行比较，默认为True
         """
-        for index in range(len(array)//2, -1, -1):
+        for index in range(len(array)//2 - 1, -1, -1):
             self.max_heapify(array, index, len(array), without_data)
 
-    def extract_max(self, array: list):
+    def insert(self, array: list, item, without_data=True):
+        """插入一个元素：放到数组末尾，再向上调整
+        """
+        array.append(item)
+        self.sift_up(array, len(array) - 1, without_data)
+
+    def extract_max(self, array: list, without_data=True):
         """弹出最大值
-        
-        这时假定执行该方法之前，对array已经进行了build_max_heap操作
+
+        这时假定执行该方法之前，对array已经进行了build_max_heap操作。
+        将堆顶与最后一个元素交换，弹出数组末尾的最大值，再对新的堆顶进行向下调整
         """
-        return array.pop(0)
+        last = array.pop()
+        if not array:
+            return last
+        max_item = array[0]
+        array[0] = last
+        self.max_heapify(array, 0, len(array), without_data)
+        return max_item
 
 
 if __name__ == '__main__':
     import doctest
-    doctest.testmod()
\ No newline at end of file
+    doctest.testmod()
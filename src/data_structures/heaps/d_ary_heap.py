@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../../")
+
+from array import array
+
+import numpy as np
+
+from data_structures.heaps.binary_min_heap import BinaryMinHeap
+
+
+class DAryMinHeap(BinaryMinHeap):
+    """d叉最小堆
+
+    与 `BinaryMinHeap` 的接口相同，只是每个节点有d个子节点：索引i的父节点为 `(i-1)//d` ，子节点为 `di+1 ~ di+d` 。
+    树高为 :math:`\\log_d n` ，插入(向上调整)时比较的次数更少；弹出(向下调整)时每层要在d个子节点中选出最小的一个，
+    但这d个子节点在数组中是相邻的。
+
+    各操作的运行时间：
+        - build_min_heap: :math:`O(n)`
+        - insert: :math:`O(\\log_d n)`
+        - extract_min: :math:`O(d\\log_d n)`
+
+    Example:
+        >>> heap = DAryMinHeap(4)
+        >>> array = [5, 2, 7, 1, 8, 10, 3, 6, 4]
+        >>> heap.build_min_heap(array)
+        >>> heap.insert(array, 0)
+        >>> [heap.extract_min(array) for _ in range(len(array))]
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 10]
+        >>> array2 = [(5, "i1"), (2, "i2"), (7, "i3"), (1, "i4"), (8, "i5")]
+        >>> heap.build_min_heap(array2, without_data=False)
+        >>> heap.extract_min(array2, without_data=False)
+        (1, 'i4')
+    """
+
+    heapq_compatible = False
+
+    def __init__(self, d=4):
+        """
+        Args:
+            d: 每个节点的子节点个数，至少为2
+        """
+        if d < 2:
+            raise ValueError("d must be at least 2: {}".format(d))
+        self.d = d
+
+    def get_parent_index(self, index: int):
+        """计算父节点索引
+        """
+        return (index - 1) // self.d
+
+    def get_left_child_index(self, index: int):
+        """计算第一个子节点的索引
+        """
+        return self.d*index + 1
+
+    def get_right_child_index(self, index: int):
+        """计算最后一个子节点的索引
+        """
+        return self.d*index + self.d
+
+    def min_heapify(self, array: list, index: int, heap_size: int, without_data=True):
+        """向下调整：每层在至多d个相邻的子节点中选出最小的一个，比x小时将其上移一层
+        """
+        d = self.d
+        key = None if without_data else self.get_key
+        item = array[index]
+        value = item if key is None else key(item)
+        child = d*index + 1
+        while child < heap_size:
+            children = array[child:child + d] if child + d <= heap_size else array[child:heap_size]
+            if key is not None:
+                children = [key(x) for x in children]
+            best_value = min(children)
+            best = child + children.index(best_value)
+            if not best_value < value:
+                break
+            array[index] = array[best]
+            index = best
+            child = d*index + 1
+        array[index] = item
+
+    def sift_up(self, array: list, index: int, without_data=True):
+        """将指定索引处的数向上调整：只要父节点比它大，就将父节点下移一层
+        """
+        d = self.d
+        key = None if without_data else self.get_key
+        item = array[index]
+        value = item if key is None else key(item)
+        while index > 0:
+            parent = (index - 1) // d
+            parent_value = array[parent] if key is None else key(array[parent])
+            if not value < parent_value:
+                break
+            array[index] = array[parent]
+            index = parent
+        array[index] = item
+
+
+def aligned_empty(length, dtype, alignment=64):
+    """返回长度为length的未初始化NumPy数组，其首地址按alignment字节(默认为一个缓存行)对齐
+    """
+    dtype = np.dtype(dtype)
+    raw = np.empty(length * dtype.itemsize + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + length * dtype.itemsize].view(dtype)
+
+
+class AlignedDAryHeap:
+    """按缓存行对齐的d叉索引最小堆
+
+    用于元素为非负整数编号(如定时器、任务编号)、权重值为浮点数的大规模队列，接口与 `IndexedPriorityQueue` 相同，
+    但数据不再保存在Python列表中：
+        - 权重值保存在首地址按64字节对齐的float64缓冲区中，元素编号保存在int64缓冲区中(都是NumPy数组，通过memoryview访问)
+        - 位置表是一个 `array('l')` ，第h个元素为编号h在堆数组中的位置，不在堆中时为-1
+
+    布局：根节点放在位置 `d-1` ，位置p的子节点为 `d(p-d+2) ~ d(p-d+2)+d-1` ，父节点为 `p//d + d-2` 。
+    这样每个节点的d个子节点的起始位置都是d的倍数，d=8时恰好占满一个缓存行，d=4时占半个缓存行，
+    向下调整时每层只访问一个缓存行(LaMarca和Ladner提出的对齐d叉堆)。
+    d=2时即为从1开始编号的BFS顺序(Eytzinger布局)。
+
+    Example:
+        >>> queue = AlignedDAryHeap(d=4)
+        >>> for item, priority in [(0, 5), (1, 3), (2, 8), (3, 1), (4, 9), (5, 2)]:
+        ...     queue.put(item, priority)
+        >>> queue.peek()
+        (1.0, 3)
+        >>> queue.decrease_key(2, 0)
+        >>> 2 in queue, queue.priority(2)
+        (True, 0.0)
+        >>> queue.update(3, 10)
+        >>> [queue.get() for _ in range(queue.size())]
+        [(0.0, 2), (2.0, 5), (3.0, 1), (5.0, 0), (9.0, 4), (10.0, 3)]
+        >>> queue = AlignedDAryHeap.from_arrays([3, 1, 4, 1.5, 9, 2.6], d=8)
+        >>> queue.get(), queue.get(), len(queue)
+        ((1.0, 1), (1.5, 3), 4)
+    """
+
+    def __init__(self, d=4, capacity=64):
+        """
+        Args:
+            d: 每个节点的子节点个数，至少为2
+            capacity: 初始容量，元素个数超过容量时容量翻倍
+        """
+        if d < 2:
+            raise ValueError("d must be at least 2: {}".format(d))
+        self.d = d
+        self.root = d - 1    # 根节点的位置
+        self.count = 0
+        self.position = array("l")    # 元素编号 -> 在堆数组中的位置
+        self._allocate(capacity)
+
+    @classmethod
+    def from_arrays(cls, priorities, items=None, d=4):
+        """由一组权重值批量建堆，运行时间为 :math:`O(n)`
+
+        Args:
+            priorities: 权重值序列或NumPy数组
+            items: 与priorities对应的元素编号，为None时为 `0 ~ n-1`
+        """
+        priorities = np.asarray(priorities, dtype=np.float64)
+        n = len(priorities)
+        items = np.arange(n) if items is None else np.asarray(items, dtype=np.int64)
+        queue = cls(d, n)
+        root = queue.root
+        queue._key_buffer[root:root + n] = priorities
+        queue._item_buffer[root:root + n] = items
+        if n:
+            position = np.full(int(items.max()) + 1, -1, dtype=np.int64)
+            position[items] = np.arange(root, root + n)
+            queue.position.frombytes(position.astype(queue.position.typecode).tobytes())
+        queue.count = n
+        # 自底向上对所有的非叶子节点进行向下调整
+        for p in range(queue.parent(root + n - 1), root - 1, -1):
+            queue.sift_down(p)
+        return queue
+
+    def _allocate(self, capacity):
+        """分配(或扩充)对齐的缓冲区，并拷贝已有的数据
+        """
+        length = self.root + max(capacity, 1)
+        keys = aligned_empty(length, np.float64)
+        items = aligned_empty(length, np.int64)
+        if self.count:
+            end = self.root + self.count
+            keys[:end] = self._key_buffer[:end]
+            items[:end] = self._item_buffer[:end]
+        self._key_buffer, self._item_buffer = keys, items
+        self.keys, self.items = memoryview(keys), memoryview(items)
+        self.capacity = length - self.root
+
+    def parent(self, p):
+        return p // self.d + self.d - 2
+
+    def first_child(self, p):
+        return self.d * (p - self.d + 2)
+
+    def put(self, item, priority):
+        """插入元素，如果元素已经在队列中，则等同于`update`
+        """
+        position = self.position
+        if item < len(position) and position[item] >= 0:
+            self.update(item, priority)
+            return
+        if self.count == self.capacity:
+            self._allocate(2 * self.capacity)
+        if item >= len(position):
+            position.extend([-1] * (item + 1 - len(position)))
+        p = self.root + self.count
+        self.count += 1
+        self.keys[p] = priority
+        self.items[p] = item
+        position[item] = p
+        self.sift_up(p)
+
+    def get(self):
+        """弹出权重值最小的元素
+
+        Returns:
+            (priority, item)
+        """
+        if self.count == 0:
+            raise IndexError("get from an empty priority queue")
+        keys, items, position = self.keys, self.items, self.position
+        root = self.root
+        min_key, min_item = keys[root], items[root]
+        position[min_item] = -1
+        self.count -= 1
+        last = root + self.count
+        if self.count:
+            keys[root], items[root] = keys[last], items[last]
+            position[items[root]] = root
+            self.sift_down(root)
+        return min_key, min_item
+
+    def peek(self):
+        """返回但不弹出权重值最小的元素
+        """
+        if self.count == 0:
+            raise IndexError("peek from an empty priority queue")
+        return self.keys[self.root], self.items[self.root]
+
+    def decrease_key(self, item, priority):
+        """减小元素的权重值
+        """
+        p = self.position[item]
+        if priority > self.keys[p]:
+            raise ValueError("New priority is greater than current priority")
+        self.keys[p] = priority
+        self.sift_up(p)
+
+    def update(self, item, priority):
+        """修改元素的权重值，可增可减
+        """
+        p = self.position[item]
+        old_priority = self.keys[p]
+        self.keys[p] = priority
+        if priority < old_priority:
+            self.sift_up(p)
+        else:
+            self.sift_down(p)
+
+    def contains(self, item):
+        return 0 <= item < len(self.position) and self.position[item] >= 0
+
+    __contains__ = contains
+
+    def priority(self, item):
+        """返回元素当前的权重值
+        """
+        return self.keys[self.position[item]]
+
+    def empty(self):
+        return self.count == 0
+
+    def size(self):
+        return self.count
+
+    __len__ = size
+
+    def to_numpy(self):
+        """以NumPy数组的形式返回堆中的 `(权重值, 元素)` ，按堆数组的顺序排列，不发生数据拷贝
+        """
+        root = self.root
+        end = root + self.count
+        return self._key_buffer[root:end], self._item_buffer[root:end]
+
+    def sift_up(self, p):
+        """将位置p处的元素向上调整：只要父节点比它大，就将父节点下移一层
+        """
+        keys, items, position = self.keys, self.items, self.position
+        d, root = self.d, self.root
+        key, item = keys[p], items[p]
+        while p > root:
+            parent = p // d + d - 2
+            if keys[parent] <= key:
+                break
+            keys[p] = keys[parent]
+            items[p] = items[parent]
+            position[items[p]] = p
+            p = parent
+        keys[p] = key
+        items[p] = item
+        position[item] = p
+
+    def sift_down(self, p):
+        """将位置p处的元素向下调整：每层在d个相邻的子节点中选出最小的一个，比它小时将其上移一层
+        """
+        keys, items, position = self.keys, self.items, self.position
+        d = self.d
+        end = self.root + self.count
+        key, item = keys[p], items[p]
+        while True:
+            child = d * (p - d + 2)
+            if child >= end:
+                break
+            # 子节点在缓冲区中是连续的一段，整段取出后在C层面求最小值
+            children = keys[child:min(child + d, end)].tolist()
+            best_key = min(children)
+            if key <= best_key:
+                break
+            best = child + children.index(best_key)
+            keys[p] = best_key
+            items[p] = items[best]
+            position[items[p]] = p
+            p = best
+        keys[p] = key
+        items[p] = item
+        position[item] = p
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../../")
+
+import heapq
+import random
+import time
+
+from data_structures.heaps.binary_min_heap import BinaryMinHeap
+from data_structures.heaps.d_ary_heap import AlignedDAryHeap, DAryMinHeap
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+
+
+class ListHeapAdapter:
+    """将作用在列表上的堆(`heapq` 、 `BinaryMinHeap` 、 `DAryMinHeap`)包装为统一的接口
+
+    这些堆不记录元素的位置，decrease_key采用延迟删除的方式：直接插入一个新的 `(priority, item)` ，
+    弹出时跳过权重值与当前权重值不一致的过期项。
+    """
+
+    def __init__(self, heap=None):
+        self.array = []
+        self.current = {}
+        if heap is None:
+            self.push_entry = lambda entry: heapq.heappush(self.array, entry)
+            self.pop_entry = lambda: heapq.heappop(self.array)
+        else:
+            self.push_entry = lambda entry: heap.insert(self.array, entry, False)
+            self.pop_entry = lambda: heap.extract_min(self.array, False)
+
+    def put(self, item, priority):
+        self.current[item] = priority
+        self.push_entry((priority, item))
+
+    decrease_key = put
+
+    def get(self):
+        while True:
+            priority, item = self.pop_entry()
+            if self.current.get(item) == priority:
+                del self.current[item]
+                return priority, item
+
+    def empty(self):
+        return not self.current
+
+
+HEAPS = {
+    "heapq": lambda: ListHeapAdapter(),
+    "binary": lambda: ListHeapAdapter(BinaryMinHeap()),
+    "4-ary": lambda: ListHeapAdapter(DAryMinHeap(4)),
+    "8-ary": lambda: ListHeapAdapter(DAryMinHeap(8)),
+    "indexed": IndexedPriorityQueue,
+    "eytzinger": lambda: AlignedDAryHeap(2),
+    "aligned-4": lambda: AlignedDAryHeap(4),
+    "aligned-8": lambda: AlignedDAryHeap(8),
+}
+
+
+def run(queue, priorities, decreases):
+    """依次执行n次put、若干次decrease_key和n次get，返回每个阶段的秒数和弹出的权重值
+    """
+    put, decrease_key, get = queue.put, queue.decrease_key, queue.get
+    start = time.perf_counter()
+    for item, priority in enumerate(priorities):
+        put(item, priority)
+    push_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for item, priority in decreases:
+        decrease_key(item, priority)
+    decrease_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    popped = [get()[0] for _ in range(len(priorities))]
+    pop_time = time.perf_counter() - start
+    return push_time, decrease_time, pop_time, popped
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5), repeat=3, heaps=None, seed=0):
+    """比较各种堆的push、decrease-key和pop的吞吐量
+
+    对每个规模n，生成n个均匀分布的随机权重值，以及n/2次随机的decrease-key操作(每次将一个元素的权重值减小一半)，
+    每种堆运行repeat次，各阶段分别取最短时间，并检查弹出的权重值序列与排好序的结果相同。
+
+    纯Python实现下，每个元素要占用数十到上百字节，`10^7` 以上的规模需要数GB内存和较长的时间，可以通过sizes参数指定。
+
+    Returns:
+        list: `[(n, 堆, push每秒次数, decrease-key每秒次数, pop每秒次数), ...]`
+    """
+    heaps = heaps or HEAPS
+    results = []
+    for n in sizes:
+        rng = random.Random(seed)
+        priorities = [rng.random() for _ in range(n)]
+        current = list(priorities)
+        decreases = []
+        for _ in range(n // 2):
+            item = rng.randrange(n)
+            current[item] /= 2
+            decreases.append((item, current[item]))
+        expected = sorted(current)
+        for name, factory in heaps.items():
+            best = None
+            for _ in range(repeat):
+                *times, popped = run(factory(), priorities, decreases)
+                if popped != expected:
+                    raise AssertionError("{} pops priorities in a wrong order".format(name))
+                best = times if best is None else [min(a, b) for a, b in zip(best, times)]
+            push_time, decrease_time, pop_time = best
+            results.append((n, name, n / push_time, len(decreases) / decrease_time, n / pop_time))
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Heap layout benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--heaps", nargs="+", choices=sorted(HEAPS), default=None)
+    args = parser.parse_args()
+
+    heaps = {name: HEAPS[name] for name in args.heaps} if args.heaps else None
+    print("{:<12}{:<12}{:>14}{:>14}{:>14}".format("n", "heap", "push/s", "decrease/s", "pop/s"))
+    for n, name, push, decrease, pop in benchmark(args.sizes, args.repeat, heaps):
+        print("{:<12}{:<12}{:>14.0f}{:>14.0f}{:>14.0f}".format(n, name, push, decrease, pop))
@@ -5,111 +5,163 @@
 import os
 import sys
 sys.path.insert(0, "../")
+
+from itertools import count
+from operator import itemgetter
+
 from data_structures.heaps.binary_min_heap import BinaryMinHeap as BaseQueue
 
 
 class DynamicPriorityQueue(BaseQueue):
     """优先队列-动态化
-    
+
     基于二叉最小堆实现的优先级队列，同时支持一些特殊形式的权重值进行比较。这也是这里命名为`动态`的原因。
-    
+
     动态化是指支持多种形式的权重值形式:
         - 纯权重形式: `[1,2,3,4,5,6]`
         - 一般形式(同标准库中的PriorityQueue): `[(1, "v1"), (2, "v2"), (3, "v3"), (4, "v4"), (5, "v5"), (6, "v6"), ]`
-        - 函数形式: `[(function, args), (function, args), ...]`。该形式下将在每次比较时，对函数进行调用，将其返回值作为比较值，这样可以用在一些特定的需要动态更改权重值的场景下
-        
+        - 键函数形式：提供 `key` 函数，元素可以是任意对象，以 `key(item)` 的返回值作为权重值。
+          键函数只在元素入队时调用一次，结果与元素一起保存为 `(权重值, 序号, 元素)` ，之后的比较不再调用键函数；
+          序号保证权重值相同的元素按入队顺序出队，并且元素本身不需要可比较。
+          如果权重值依赖于外部的可变状态，可以在 `get(rebuild=True)` 时重新计算所有元素的权重值
+
+    一般形式等同于 `key=itemgetter(0)` 。所有形式的堆中的项都可以直接比较，因此都使用 `heapq` 的C实现。
+
+    批量操作：
+        - put_many: 一次加入多个元素，新元素较多时先全部追加再自底向上建堆，运行时间为 :math:`O(n+k)`
+        - pop_many: 按顺序弹出至多k个元素
+        - merge: 将另一个队列中的所有元素移入当前队列
+
     Example:
         >>> queue = DynamicPriorityQueue()
         >>> data = [9,3,5,8,7,2,6]
         >>> _ = [queue.put(i) for i in data]
         >>> queue.get()
         2
-        >>> queue = DynamicPriorityQueue(without_data=False)
-        >>> f = lambda x,y: x*y
-        >>> data = [9,3,5,8,7,2,6]
-        >>> _ = [queue.put((f,(i,j))) for i in data for j in data]
-        >>> _f, args = queue.get()
-        >>> _f(*args)
-        4
+        >>> queue.put_many([4, 1, 10])
+        >>> queue.pop_many(3)
+        [1, 3, 4]
+        >>> queue = DynamicPriorityQueue(key=lambda task: task["deadline"])
+        >>> queue.put_many({"name": name, "deadline": deadline} for name, deadline in [("a", 3), ("b", 1), ("c", 3)])
+        >>> other = DynamicPriorityQueue(key=lambda task: task["deadline"])
+        >>> other.put({"name": "d", "deadline": 2})
+        >>> queue.merge(other)
+        >>> [task["name"] for task in queue.pop_many(10)], other.empty()
+        (['b', 'd', 'a', 'c'], True)
+
+        权重值依赖于外部状态时，使用rebuild重新计算
+
+        >>> load = {"x": 5, "y": 7}
+        >>> queue = DynamicPriorityQueue(key=lambda server: load[server])
+        >>> queue.put_many(["x", "y"])
+        >>> load["x"] = 9
+        >>> queue.get(rebuild=True)
+        'y'
     """
-    
-    def __init__(self, without_data=True):
+
+    def __init__(self, without_data=True, key=None):
+        """
+        Args:
+            without_data: 为False时元素为 `(权重值, 数据)` 形式的元组
+            key: 键函数，为None且without_data为False时使用元组的第一个元素
+        """
         self.items = []
-        self.without_data = without_data
-    
+        self.key = key if key is not None or without_data else itemgetter(0)
+        self.counter = count()    # 入队序号
+
+    def entry(self, item):
+        """生成保存在堆中的项
+        """
+        if self.key is None:
+            return item
+        return self.key(item), next(self.counter), item
+
     def put(self, item):
-        self.items.insert(0, item)
-        self.min_heapify(self.items, 0, len(self.items), self.without_data)
-    
+        """插入元素：放到堆数组末尾后向上调整，运行时间为 :math:`O(\\lg n)`
+        """
+        self.insert(self.items, self.entry(item))
+
+    def put_many(self, items):
+        """一次加入多个元素
+
+        新元素的个数k满足 :math:`k\\lg(n+k) \\ge n+k` 时，先全部追加到堆数组末尾，再用 `build_min_heap` 一次性建堆，
+        否则逐个向上调整
+        """
+        entries = [self.entry(item) for item in items]
+        total = len(self.items) + len(entries)
+        if len(entries) * total.bit_length() >= total:
+            self.items.extend(entries)
+            self.build_min_heap(self.items)
+        else:
+            for entry in entries:
+                self.insert(self.items, entry)
+
     def get(self, rebuild=False):
         """
-        
-        默认情况下，该方法的运行时间是:  :math:`O(\lg n)`
-        
-        但如果开启rebuild，那么该方法的运行时间时 :math:`O(n\lg n)`。
-        
-        当提供函数类型权重，且提供给函数的参数是外部的可变类型变量，而且在随时发生变动，那么为了在调用时获得实时的最小值，应当开启rebuild方式，但这样会增加程序运行时间。
+
+        默认情况下，该方法的运行时间是:  :math:`O(\\lg n)`
+
+        但如果开启rebuild，那么该方法的运行时间时 :math:`O(n)`。
+
+        当键函数依赖于外部的可变状态，而且在随时发生变动，那么为了在调用时获得实时的最小值，应当开启rebuild方式，
+        它会对所有元素重新调用一次键函数并重新建堆，但这样会增加程序运行时间。
         """
         if rebuild is True:
-            self.build_min_heap(self.items, self.without_data)
-            return self.items.pop(0)
+            self.rebuild()
+        entry = self.extract_min(self.items)
+        return entry if self.key is None else entry[2]
+
+    def pop_many(self, k):
+        """按权重值从小到大弹出至多k个元素
+
+        k不小于队列大小时，直接对堆数组排序后清空，否则逐个弹出
+        """
+        items = self.items
+        if k >= len(items):
+            items.sort()
+            entries = items[:]
+            items.clear()
+        else:
+            entries = [self.extract_min(items) for _ in range(k)]
+        if self.key is None:
+            return entries
+        return [entry[2] for entry in entries]
+
+    def merge(self, other):
+        """将other中的所有元素移入当前队列，other变为空队列，运行时间为 :math:`O(n+m)`
+
+        两个队列的键函数相同时直接使用other中已经计算好的权重值，否则重新计算
+        """
+        if other.key is None or other.key is not self.key:
+            raw = other.items if other.key is None else [entry[2] for entry in other.items]
+            entries = [self.entry(item) for item in raw]
         else:
-            self.items[0], self.items[-1] = self.items[-1], self.items[0]
-            min_item = self.items.pop()
-            if not self.empty:
-                self.min_heapify(self.items, 0, len(self.items), self.without_data)
-            return min_item
+            # other中的序号整体平移到当前队列的序号之后，保持other中权重值相同的元素的先后顺序
+            offset = next(self.counter)
+            entries = [(priority, offset + seq, item) for priority, seq, item in other.items]
+            self.counter = count(offset + next(other.counter))
+        other.items = []
+        self.items.extend(entries)
+        self.build_min_heap(self.items)
+
+    def rebuild(self):
+        """重新计算所有元素的权重值，并重新建堆
+        """
+        if self.key is not None:
+            key = self.key
+            self.items = [(key(item), seq, item) for _, seq, item in self.items]
+        self.build_min_heap(self.items)
 
     def empty(self):
         return True if self.size() == 0 else False
-    
+
     def size(self):
         return len(self.items)
-    
-    def min_heapify(self, array: list, index: int, heap_size: int, without_data=True):
-        """最小堆堆化处理，维护最小堆的性质
-        
-        最小堆性质：父节点必须小于等于左右子节点
-        
-        根据最小堆的性质将指定索引处的数调整到堆的它合适的位置:
-            - 将指定index处的值x与其左右孩子的进行比较，将最小的孩子与其交换位置，以满足最小堆性质，并再次递归处理x
-            - 当指定index处的值x比其左右孩子的都大，则不用再递归
-
-        时间复杂度：:math:`O(lg n)`,n表示堆大小
-        
-        Args:
-            array (list): 存放堆数据的数组
-            index (int): 指定的索引
-            heap_size (int): 当前堆有效元素个数。(array[0:heap_size-1]中存放的才是堆上有效的元素)
-            without_data (bool): 如果为False，则期望每个元素应是一个二元元组，并将元组第一个元素作为值进行比较，默认为True
-        """
-        left = self.get_left_child_index(index)
-        right = self.get_right_child_index(index)
-        
-        smallest_index = index
-        if without_data is False:
-            if type(array[index][0]).__name__ == "function":
-                if left <= heap_size-1 and array[left][0](*array[left][1]) < array[index][0](*array[index][1]):
-                    smallest_index = left
-                if right <= heap_size-1 and array[right][0](*array[right][1]) < array[smallest_index][0](*array[smallest_index][1]):
-                    smallest_index = right
-            else:
-                if left <= heap_size-1 and array[left][0] < array[index][0]:
-                    smallest_index = left
-                if right <= heap_size-1 and array[right][0] < array[smallest_index][0]:
-                    smallest_index = right
-        else:
-            if left <= heap_size-1 and array[left] < array[index]:
-                smallest_index = left
-            if right <= heap_size-1 and array[right] < array[smallest_index]:
-                smallest_index = right
 
-        if smallest_index != index:     # 如果父节点不是最小的，那么与对应最小的子节点交换位置，并继续递归判断下一级
-            array[index], array[smallest_index] = array[smallest_index], array[index]
-            self.min_heapify(array, smallest_index, heap_size, without_data)
+    __len__ = size
 
 
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
-    
\ No newline at end of file
+
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+
+
+class IndexedPriorityQueue:
+    """索引优先队列(支持decrease-key的二叉最小堆)
+
+    与`DynamicPriorityQueue`不同，这里的堆中每个元素(item)只会出现一次，并额外使用一个位置表(position map)记录每个元素当前在堆数组中的索引。
+    这样当某个元素的权重值发生变化时，可以直接定位到它在堆中的位置，只对它进行一次上浮或下沉调整，而不需要重建整个堆。
+
+    各操作的运行时间：
+        - put / get / decrease_key / update: :math:`O(\\lg n)`
+        - contains / priority / peek: :math:`O(1)`
+
+    要求元素(item)是可哈希的，且元素之间不需要可比较，比较时只使用权重值。
+
+    Example:
+        >>> queue = IndexedPriorityQueue()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.peek()
+        (1, 'd')
+        >>> queue.decrease_key("c", 0)
+        >>> "c" in queue, queue.priority("c")
+        (True, 0)
+        >>> queue.update("d", 10)
+        >>> [queue.get() for _ in range(queue.size())]
+        [(0, 'c'), (3, 'b'), (5, 'a'), (10, 'd')]
+        >>> queue.empty()
+        True
+    """
+
+    def __init__(self):
+        self.keys = []         # 堆数组：存放权重值
+        self.items = []        # 堆数组：与keys一一对应，存放元素
+        self.position = {}     # 位置表：元素 -> 在堆数组中的索引
+
+    def put(self, item, priority):
+        """插入元素，如果元素已经在队列中，则等同于`update`
+        """
+        if item in self.position:
+            self.update(item, priority)
+            return
+        self.keys.append(priority)
+        self.items.append(item)
+        self.position[item] = len(self.items) - 1
+        self.sift_up(len(self.items) - 1)
+
+    def get(self):
+        """弹出权重值最小的元素
+
+        Returns:
+            (priority, item)
+        """
+        if not self.items:
+            raise IndexError("get from an empty priority queue")
+        keys, items = self.keys, self.items
+        min_key, min_item = keys[0], items[0]
+        last_key, last_item = keys.pop(), items.pop()
+        del self.position[min_item]
+        if items:
+            # 将最后一个元素放到堆顶，再进行下沉调整
+            keys[0], items[0] = last_key, last_item
+            self.position[last_item] = 0
+            self.sift_down(0)
+        return min_key, min_item
+
+    def peek(self):
+        """返回但不弹出权重值最小的元素
+        """
+        if not self.items:
+            raise IndexError("peek from an empty priority queue")
+        return self.keys[0], self.items[0]
+
+    def decrease_key(self, item, priority):
+        """减小元素的权重值
+        """
+        index = self.position[item]
+        if priority > self.keys[index]:
+            raise ValueError("New priority is greater than current priority")
+        self.keys[index] = priority
+        self.sift_up(index)
+
+    def update(self, item, priority):
+        """修改元素的权重值，可增可减
+        """
+        index = self.position[item]
+        old_priority = self.keys[index]
+        self.keys[index] = priority
+        if priority < old_priority:
+            self.sift_up(index)
+        else:
+            self.sift_down(index)
+
+    def contains(self, item):
+        return item in self.position
+
+    __contains__ = contains
+
+    def priority(self, item):
+        """返回元素当前的权重值
+        """
+        return self.keys[self.position[item]]
+
+    def empty(self):
+        return len(self.items) == 0
+
+    def size(self):
+        return len(self.items)
+
+    __len__ = size
+
+    def sift_up(self, index):
+        """将index处的元素向上调整到合适的位置
+
+        这里没有使用逐层交换，而是先将待调整元素取出，将比它大的父节点依次下移，最后再将其放入空出的位置
+        """
+        keys, items, position = self.keys, self.items, self.position
+        key, item = keys[index], items[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[index] = keys[parent]
+            items[index] = items[parent]
+            position[items[index]] = index
+            index = parent
+        keys[index] = key
+        items[index] = item
+        position[item] = index
+
+    def sift_down(self, index):
+        """将index处的元素向下调整到合适的位置
+        """
+        keys, items, position = self.keys, self.items, self.position
+        size = len(keys)
+        key, item = keys[index], items[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[child + 1] < keys[child]:
+                child += 1
+            if key <= keys[child]:
+                break
+            keys[index] = keys[child]
+            items[index] = items[child]
+            position[items[index]] = index
+            index = child
+        keys[index] = key
+        items[index] = item
+        position[item] = index
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -2,6 +2,7 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
+from collections import deque
 
 the_graph = {
     "A": ["B", "C"],
@@ -32,32 +33,141 @@ def bfs(graph, source, target):
     """
     paths_info = {source: None}
     discoverd = {source}
-    queue = [source]
-    queue_size = 1
-    while queue_size != 0:
-        vertex = queue.pop(0)
-        queue_size -= 1
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
         for next_vert in graph[vertex]:
             if next_vert == target:
                 paths_info[next_vert] = vertex
-                queue_size = 0
+                queue.clear()
                 break
             if next_vert not in discoverd:
                 discoverd.add(next_vert)
                 queue.append(next_vert)
-                queue_size += 1
                 paths_info[next_vert] = vertex
         
+    return build_path(paths_info, target)
+
+
+def build_path(parents, target):
+    """根据前驱信息生成从源顶点到target的路径
+
+    先从target沿前驱反向追加，最后整体反转一次，避免每次都在列表头部插入带来的 :math:`O(n^2)` 开销
+    """
     path = []
-    while True:
-        pre = paths_info[target]
-        path.insert(0, target)
-        if pre == None:
-            break
-        target = pre
+    while target is not None:
+        path.append(target)
+        target = parents[target]
+    path.reverse()
     return path
 
 
+def bfs_tree(graph, sources, targets=None):
+    """多源多目标的广度优先搜索
+
+    从所有源顶点同时开始搜索(所有源顶点的距离都为0)，一次搜索得到所有被发现顶点的距离和前驱。
+    如果指定了targets，那么当所有目标顶点都被发现后就提前结束搜索。
+
+    队列使用 `collections.deque` ，出队和入队都是 :math:`O(1)` ，整个搜索的运行时间为 :math:`O(V+E)`
+
+    Args:
+        graph: 图
+        sources: 源顶点序列
+        targets: 目标顶点序列，为None时搜索所有可达顶点
+
+    Returns:
+        distances (dict): 顶点 -> 距最近源顶点的边数
+        parents (dict): 顶点 -> 前驱顶点，源顶点的前驱为None
+
+    Example:
+        >>> distances, parents = bfs_tree(the_graph, ["A"])
+        >>> distances
+        {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'E': 2, 'F': 2}
+        >>> build_path(parents, "F")
+        ['A', 'C', 'F']
+        >>> distances, parents = bfs_tree(the_graph, ["D", "F"], targets=["E"])
+        >>> distances["E"], build_path(parents, "E")
+        (1, ['F', 'E'])
+    """
+    distances = {}
+    parents = {}
+    for source in sources:
+        distances[source] = 0
+        parents[source] = None
+    remaining = None
+    if targets is not None:
+        remaining = set(targets) - distances.keys()
+        if not remaining:
+            return distances, parents
+    queue = deque(distances)
+    while queue:
+        vertex = queue.popleft()
+        next_distance = distances[vertex] + 1
+        for next_vert in graph[vertex]:
+            if next_vert in distances:
+                continue
+            distances[next_vert] = next_distance
+            parents[next_vert] = vertex
+            queue.append(next_vert)
+            if remaining is not None:
+                remaining.discard(next_vert)
+                if not remaining:
+                    return distances, parents
+    return distances, parents
+
+
+def bfs_frontier(graph, sources):
+    """基于CSR数组的逐层(level-synchronous)广度优先搜索
+
+    每一轮将当前层的所有顶点(frontier)作为一个整体处理，使用NumPy一次性展开它们的所有邻边，
+    筛选出还未被访问的顶点作为下一层，因此Python层面的循环次数只等于BFS的层数。
+
+    Args:
+        graph: `CSRGraph` 对象
+        sources: 源顶点标签序列
+
+    Returns:
+        distances (numpy.ndarray): 按顶点编号存放的距离，不可达为-1
+        parents (numpy.ndarray): 按顶点编号存放的前驱编号，源顶点和不可达顶点为-1
+
+    Example:
+        >>> from csr_graph import CSRGraph
+        >>> graph = CSRGraph.from_dict(the_graph)
+        >>> distances, parents = bfs_frontier(graph, ["A"])
+        >>> dict(zip(graph.labels, distances.tolist()))
+        {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'E': 2, 'F': 2}
+        >>> graph.labels[parents[graph.index["F"]]]
+        'C'
+    """
+    import numpy as np
+    indptr, indices, _ = graph.to_numpy()
+    n = graph.vertex_count
+    distances = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+    frontier = np.unique(np.fromiter((graph.index[s] for s in sources), dtype=np.int64))
+    distances[frontier] = 0
+    level = 0
+    while frontier.size:
+        level += 1
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        # 将每个frontier顶点的边区间[start, start+count)展开为一个连续的边编号数组
+        owners = np.repeat(frontier, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        edge_ids = np.repeat(starts, counts) + offsets
+        next_vertexs = indices[edge_ids]
+        unvisited = distances[next_vertexs] == -1
+        next_vertexs, owners = next_vertexs[unvisited], owners[unvisited]
+        # 同一个顶点可能被多个frontier顶点发现，只保留第一次出现的
+        next_vertexs, first = np.unique(next_vertexs, return_index=True)
+        distances[next_vertexs] = level
+        parents[next_vertexs] = owners[first]
+        frontier = next_vertexs
+    return distances, parents
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
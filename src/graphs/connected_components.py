@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../")
+
+from itertools import islice
+
+import numpy as np
+
+from high_level_data_structures.disjoin_set import ArrayDisjoinSet, DisjoinSet
+
+
+def read_edge_chunks(path, binary=False, dtype=np.int64, chunk_size=1 << 20):
+    """按块读取边文件，每次产出一个形状为 `(k, 2)` 的NumPy数组(k不超过chunk_size)
+
+    Args:
+        path: 边文件路径
+        binary: 为True时，文件为连续存放的 `(u, v)` 整数对(本机字节序，类型为dtype)；
+            否则为文本文件，每行一条边，前两列为顶点编号，其余列(如权重)被忽略，空行和以#开头的行被跳过
+        dtype: 顶点编号的类型
+        chunk_size: 每块的边数
+    """
+    if binary:
+        with open(path, "rb") as f:
+            while True:
+                chunk = np.fromfile(f, dtype=dtype, count=2 * chunk_size)
+                if len(chunk) == 0:
+                    return
+                yield chunk.reshape(-1, 2)
+    else:
+        with open(path) as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    return
+                chunk = np.loadtxt(lines, dtype=dtype, usecols=(0, 1), comments="#", ndmin=2)
+                if len(chunk):
+                    yield chunk
+
+
+def read_label_edge_chunks(path, chunk_size=1 << 20):
+    """按块读取顶点为任意字符串的文本边文件，每次产出一个 `[(u, v), ...]` 列表
+    """
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            edges = []
+            for line in lines:
+                fields = line.split()
+                if len(fields) >= 2 and not fields[0].startswith("#"):
+                    edges.append((fields[0], fields[1]))
+            yield edges
+
+
+def find_roots(parent, vertexs):
+    """向量化地查找一批顶点的根：反复令 `roots = parent[roots]` ，直到不再变化
+    """
+    roots = parent[vertexs]
+    while True:
+        grand = parent[roots]
+        if np.array_equal(grand, roots):
+            return roots
+        roots = grand
+
+
+def streaming_connected_components(edge_path, label_path=None, binary=False, dtype=np.int64,
+                                   numeric=True, chunk_size=1 << 20):
+    """以流的方式计算无向图的连通分量
+
+    边文件按块读取，每一块读入后立即合并到不相交集合中，之后就可以丢弃，因此内存占用只与顶点数有关( :math:`O(V)` )，与边数无关：
+        - numeric为True时，顶点是非负整数编号，使用 `ArrayDisjoinSet` ，数组的大小随读到的最大编号增长。
+          每一块先在parent数组上向量化地查找两个端点的根，过滤掉两个端点已经连通的边，剩下的边才逐条执行union，
+          当大部分顶点已经连通后，绝大多数的边在这一步就被过滤掉了
+        - numeric为False时，顶点可以是任意字符串(只支持文本文件)，使用 `DisjoinSet` 进行标签映射
+
+    Args:
+        edge_path: 边文件，格式见 `read_edge_chunks`
+        label_path: 结果的输出路径，为None时不输出。numeric为True且binary为True时，输出为连续存放的int64数组(第i个元素为顶点i的分量编号)，
+            否则输出为文本文件，每行为 `顶点\\t分量编号`
+        binary: 边文件是否为二进制文件
+        dtype: 二进制文件中顶点编号的类型
+        numeric: 顶点是否为整数编号
+        chunk_size: 每块的边数
+
+    Returns:
+        numeric为True时返回每个顶点的分量编号数组，否则返回 `{顶点: 分量编号}` 。分量按其中第一个顶点的顺序编号
+
+    Example:
+        >>> import tempfile
+        >>> directory = tempfile.mkdtemp()
+        >>> edge_path = os.path.join(directory, "edges.txt")
+        >>> with open(edge_path, "w") as f:
+        ...     _ = f.write("# u v w\\n0 1 0.5\\n2 3 1.0\\n1 4 2.0\\n6 6 1.0\\n")
+        >>> streaming_connected_components(edge_path, chunk_size=2).tolist()
+        [0, 0, 1, 1, 0, 2, 3]
+        >>> binary_path = os.path.join(directory, "edges.bin")
+        >>> np.array([[0, 1], [2, 3], [3, 0]], dtype=np.int32).tofile(binary_path)
+        >>> label_path = os.path.join(directory, "labels.bin")
+        >>> streaming_connected_components(binary_path, label_path, binary=True, dtype=np.int32).tolist()
+        [0, 0, 0, 0]
+        >>> np.fromfile(label_path, dtype=np.int64).tolist()
+        [0, 0, 0, 0]
+        >>> with open(edge_path, "w") as f:
+        ...     _ = f.write("a b\\nc d\\nb e\\n")
+        >>> streaming_connected_components(edge_path, numeric=False)
+        {'a': 0, 'b': 0, 'c': 1, 'd': 1, 'e': 0}
+        >>> import shutil
+        >>> shutil.rmtree(directory)
+    """
+    if not numeric:
+        disjoin_set = DisjoinSet()
+        for edges in read_label_edge_chunks(edge_path, chunk_size):
+            disjoin_set.union_many(edges)
+        labels = disjoin_set.component_labels()
+        if label_path is not None:
+            with open(label_path, "w") as f:
+                for v, label in labels.items():
+                    f.write("{}\t{}\n".format(v, label))
+        return labels
+
+    disjoin_set = ArrayDisjoinSet()
+    for chunk in read_edge_chunks(edge_path, binary, dtype, chunk_size):
+        chunk = chunk.astype(np.int64, copy=False)
+        disjoin_set.resize(int(chunk.max()) + 1)
+        # parent数组的NumPy视图不拷贝数据，但在array扩容之前必须释放
+        parent = np.frombuffer(disjoin_set.parent, dtype=disjoin_set.parent.typecode)
+        tails, heads = find_roots(parent, chunk[:, 0]), find_roots(parent, chunk[:, 1])
+        del parent
+        crossing = tails != heads
+        disjoin_set.union_many(np.stack((tails[crossing], heads[crossing]), axis=1))
+
+    labels = disjoin_set.component_labels()
+    if label_path is not None:
+        if binary:
+            labels.tofile(label_path)
+        else:
+            with open(label_path, "w") as f:
+                for start in range(0, len(labels), chunk_size):
+                    block = labels[start:start + chunk_size].tolist()
+                    f.writelines("{}\t{}\n".format(start + i, label) for i, label in enumerate(block))
+    return labels
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+from array import array
+
+
+the_graph = {
+    "s": [("t", 10), ("y", 5)],
+    "t": [("x", 1), ("y", 2)],
+    "x": [("z", 4)],
+    "y": [("t", 3), ("x", 9), ("z", 2)],
+    "z": [("s", 7), ("x", 6)]
+}
+
+
+class CSRGraph:
+    """压缩稀疏行(Compressed Sparse Row)存储的有向图
+
+    其余图算法中使用的图结构是 `{顶点: [(邻接顶点, 权重), ...]}` 形式的字典，每条边都是一个元组对象，
+    不仅每条边要占用上百字节的内存，遍历邻接顶点时也需要不断地跳转指针。
+
+    CSR存储方式则先将顶点标签映射(interning)为 `0 ~ n-1` 的整数编号，再使用三个连续的数组来存储所有的边：
+        - indptr: 长度为n+1，顶点i的所有出边存放在 `indices[indptr[i]:indptr[i+1]]` 中
+        - indices: 长度为m，存放每条边的终点编号
+        - weights: 长度为m，存放每条边的权重，无权图则为None
+
+    这样每条边只占用两个机器字(终点编号和权重)，且同一个顶点的邻边在内存中是连续的。
+
+    为了能让已有的图算法直接运行在CSRGraph上，CSRGraph同时实现了这些算法所用到的字典接口(`keys`、`graph[u]`、`len`、`in`)，
+    `graph[u]` 返回一个 `AdjacencyView` ，按原来的格式遍历邻接顶点：带权图为 `(v, w)` ，无权图为 `v` 。
+    这只是一个兼容层，每次遍历都要把整数编号转换回标签，需要更高性能的算法应直接使用整数编号和 `indptr/indices/weights` 数组。
+
+    Example:
+        >>> from pprint import pprint
+        >>> graph = CSRGraph.from_dict(the_graph)
+        >>> len(graph), graph.edge_count
+        (5, 10)
+        >>> graph["y"]
+        AdjacencyView([('t', 3), ('x', 9), ('z', 2)])
+        >>> graph["y"] == [('t', 3), ('x', 9), ('z', 2)], len(graph["y"]), graph["y"][-1]
+        (True, 3, ('z', 2))
+        >>> graph.index["y"], list(graph.neighbors(graph.index["y"]))
+        (3, [1, 2, 4])
+        >>> graph.to_dict() == the_graph
+        True
+        >>> from ssp_dijkstra import DijkstraSSP
+        >>> DijkstraSSP(graph, "s").show()
+        s -> y -> t, weights:  8.0
+        s -> y -> t -> x, weights:  9.0
+        s -> y, weights:  5.0
+        s -> y -> z, weights:  7.0
+        >>> from breadth_first_search import bfs, the_graph as unweighted_graph
+        >>> bfs(CSRGraph.from_dict(unweighted_graph), "A", "F")
+        ['A', 'C', 'F']
+    """
+
+    def __init__(self, labels, indptr, indices, weights=None):
+        """
+        Args:
+            labels: 顶点标签序列，第i个标签对应编号为i的顶点
+            indptr: 长度为n+1的整数数组
+            indices: 长度为m的整数数组
+            weights: 长度为m的权重数组，无权图为None
+        """
+        self.labels = list(labels)    # 编号 -> 标签
+        self.index = {label: i for i, label in enumerate(self.labels)}    # 标签 -> 编号
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self._topological_order = None
+        self._transpose = None
+        self._in_edge_arrays = None
+
+    @classmethod
+    def from_dict(cls, graph):
+        """由字典形式的图构建CSRGraph
+
+        只出现在邻接表中、但不是字典键的顶点，也会被加入到顶点表中(没有出边)。
+        如果邻接表中的元素是 `(v, w)` 元组，则构建带权图，否则构建无权图。
+        """
+        labels = list(graph.keys())
+        index = {label: i for i, label in enumerate(labels)}
+        weighted = None
+        indptr = array("l", [0])
+        indices = array("l")
+        weights = []
+        for u in labels:
+            for item in graph[u]:
+                if weighted is None:
+                    weighted = isinstance(item, tuple)
+                if weighted:
+                    v, w = item
+                    weights.append(w)
+                else:
+                    v = item
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+                indices.append(index[v])
+            indptr.append(len(indices))
+        # 补齐只作为终点出现的顶点
+        for _ in range(len(indptr) - 1, len(labels)):
+            indptr.append(len(indices))
+        return cls(labels, indptr, indices, cls._weights_array(weights) if weighted else None)
+
+    @classmethod
+    def from_edges(cls, edges, labels=None):
+        """由边序列构建CSRGraph
+
+        边可以是 `(u, v)` 或 `(u, v, w)` 形式，边可以是任意顺序，构建时会使用计数排序将边按起点分组，运行时间为 :math:`O(V+E)`
+
+        Args:
+            edges: 可迭代的边序列
+            labels: 顶点标签序列，为None时按顶点首次出现的顺序编号
+
+        Example:
+            >>> graph = CSRGraph.from_edges([("b", "a", 1), ("a", "c", 2), ("a", "b", 3)])
+            >>> graph.labels
+            ['b', 'a', 'c']
+            >>> list(graph["a"]), list(graph["c"])
+            ([('c', 2), ('b', 3)], [])
+        """
+        labels = [] if labels is None else list(labels)
+        index = {label: i for i, label in enumerate(labels)}
+        sources, targets, weights = array("l"), array("l"), []
+        weighted = None
+        for edge in edges:
+            if weighted is None:
+                weighted = len(edge) == 3
+            u, v = edge[0], edge[1]
+            for x in (u, v):
+                if x not in index:
+                    index[x] = len(labels)
+                    labels.append(x)
+            sources.append(index[u])
+            targets.append(index[v])
+            if weighted:
+                weights.append(edge[2])
+
+        n, m = len(labels), len(sources)
+        indptr = array("l", [0]) * (n + 1)
+        for u in sources:
+            indptr[u + 1] += 1
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        # 计数排序：按起点将边放入对应的位置，同一起点的边保持输入顺序
+        cursor = indptr[:-1]
+        indices = array("l", [0]) * m
+        ordered_weights = [0] * m if weighted else None
+        for e in range(m):
+            u = sources[e]
+            slot = cursor[u]
+            cursor[u] = slot + 1
+            indices[slot] = targets[e]
+            if weighted:
+                ordered_weights[slot] = weights[e]
+        return cls(labels, indptr, indices, cls._weights_array(ordered_weights) if weighted else None)
+
+    @staticmethod
+    def _weights_array(weights):
+        """权重全为整数时使用整数数组，否则使用双精度浮点数组
+        """
+        if all(isinstance(w, int) for w in weights):
+            return array("l", weights)
+        return array("d", weights)
+
+    @property
+    def vertex_count(self):
+        return len(self.labels)
+
+    @property
+    def edge_count(self):
+        return len(self.indices)
+
+    @property
+    def is_weighted(self):
+        return self.weights is not None
+
+    def neighbors(self, i):
+        """返回编号为i的顶点的所有邻接顶点编号
+        """
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def neighbor_weights(self, i):
+        """返回编号为i的顶点的所有出边权重
+        """
+        return self.weights[self.indptr[i]:self.indptr[i + 1]]
+
+    def degree(self, i):
+        return self.indptr[i + 1] - self.indptr[i]
+
+    def topological_order(self):
+        """Kahn算法计算拓扑排序，返回顶点编号数组
+
+        先统计每个顶点的入度，将入度为0的顶点放入队列，每次从队列中取出一个顶点u，将u的所有邻接顶点的入度减1，
+        入度变为0的顶点加入队列，运行时间为 :math:`O(V+E)` 。这里直接使用结果数组本身作为队列。
+
+        CSRGraph创建后不会再修改，因此结果会被缓存，之后的调用直接返回同一个数组。
+
+        Raises:
+            ValueError: 图中存在环路
+
+        Example:
+            >>> dag = CSRGraph.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
+            >>> [dag.labels[i] for i in dag.topological_order()]
+            ['a', 'b', 'c', 'd']
+            >>> CSRGraph.from_dict(the_graph).topological_order()
+            Traceback (most recent call last):
+                ...
+            ValueError: The graph contains a cycle
+        """
+        if self._topological_order is None:
+            n = self.vertex_count
+            indptr, indices = self.indptr, self.indices
+            indegree = array("l", [0]) * n
+            for v in indices:
+                indegree[v] += 1
+            order = array("l", [u for u in range(n) if indegree[u] == 0])
+            head = 0
+            while head < len(order):
+                u = order[head]
+                head += 1
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    indegree[v] -= 1
+                    if indegree[v] == 0:
+                        order.append(v)
+            if len(order) < n:
+                raise ValueError("The graph contains a cycle")
+            self._topological_order = order
+        return self._topological_order
+
+    def transpose(self):
+        """返回所有边反向后的图，顶点编号保持不变
+
+        与拓扑排序一样，结果会被缓存，反向图的反向图就是原图本身。
+
+        Example:
+            >>> graph = CSRGraph.from_dict(the_graph)
+            >>> list(graph.transpose()["x"])
+            [('t', 1), ('y', 9), ('z', 6)]
+            >>> graph.transpose() is graph.transpose(), graph.transpose().transpose() is graph
+            (True, True)
+        """
+        if self._transpose is None:
+            self._transpose = self._build_transpose()
+            self._transpose._transpose = self
+        return self._transpose
+
+    def in_edge_arrays(self):
+        """以NumPy数组的形式返回入边 `(indptr, indices, weights)` ，即反向图的CSR数组
+
+        顶点i的所有入边的起点为 `indices[indptr[i]:indptr[i+1]]` ，weights统一为float64类型，无权图中每条边的权重为1。
+        结果会被缓存，供需要反复按入边做向量化运算的算法(例如 `dag_paths`)使用。
+
+        Example:
+            >>> indptr, indices, weights = CSRGraph.from_dict(the_graph).in_edge_arrays()
+            >>> indptr.tolist(), weights.dtype
+            ([0, 1, 3, 6, 8, 10], dtype('float64'))
+        """
+        if self._in_edge_arrays is None:
+            import numpy as np
+            indptr, indices, weights = self.transpose().to_numpy()
+            if weights is None:
+                weights = np.ones(len(indices))
+            self._in_edge_arrays = indptr, indices, weights.astype(np.float64)
+        return self._in_edge_arrays
+
+    def _build_transpose(self):
+        n, m = self.vertex_count, self.edge_count
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        t_indptr = array("l", [0]) * (n + 1)
+        for v in indices:
+            t_indptr[v + 1] += 1
+        for i in range(n):
+            t_indptr[i + 1] += t_indptr[i]
+        cursor = t_indptr[:-1]
+        t_indices = array("l", [0]) * m
+        t_weights = None if weights is None else array(weights.typecode, [0]) * m
+        for u in range(n):
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                slot = cursor[v]
+                cursor[v] = slot + 1
+                t_indices[slot] = u
+                if weights is not None:
+                    t_weights[slot] = weights[e]
+        return CSRGraph(self.labels, t_indptr, t_indices, t_weights)
+
+    def to_dict(self):
+        """转换回字典形式的图
+        """
+        return {u: list(self[u]) for u in self.labels}
+
+    def to_numpy(self):
+        """以NumPy数组的形式返回 `(indptr, indices, weights)`
+
+        使用 `np.frombuffer` 直接共享底层array的内存，不发生数据拷贝
+        """
+        import numpy as np
+        as_numpy = lambda a: a if isinstance(a, np.ndarray) else np.frombuffer(a, dtype=a.typecode)
+        weights = None if self.weights is None else as_numpy(self.weights)
+        return as_numpy(self.indptr), as_numpy(self.indices), weights
+
+    # 以下为与字典形式的图兼容的接口，使已有的图算法可以直接运行在CSRGraph上
+    def keys(self):
+        return iter(self.labels)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def __getitem__(self, label):
+        i = self.index[label]
+        return AdjacencyView(self, self.indptr[i], self.indptr[i + 1])
+
+    def items(self):
+        for label in self.labels:
+            yield label, self[label]
+
+
+class AdjacencyView:
+    """CSRGraph中一个顶点的邻接顶点的只读视图
+
+    只记录该顶点的出边在边数组中的范围 `[start, end)` ，创建时不拷贝任何数据，遍历时才逐个生成 `(v, w)` 或 `v` 。
+    支持迭代、len、下标访问以及与列表比较，可以代替字典形式的图中的邻接列表使用。
+    """
+
+    __slots__ = ("graph", "start", "end")
+
+    def __init__(self, graph, start, end):
+        self.graph = graph
+        self.start = start
+        self.end = end
+
+    def __iter__(self):
+        graph, start, end = self.graph, self.start, self.end
+        labels = map(graph.labels.__getitem__, graph.indices[start:end])
+        if graph.weights is None:
+            return labels
+        return zip(labels, graph.weights[start:end])
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return list(self)[k]
+        n = self.end - self.start
+        if not -n <= k < n:
+            raise IndexError("adjacency index out of range")
+        e = self.start + k % n
+        graph = self.graph
+        v = graph.labels[graph.indices[e]]
+        return v if graph.weights is None else (v, graph.weights[e])
+
+    def __eq__(self, other):
+        if isinstance(other, (AdjacencyView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return "AdjacencyView({!r})".format(list(self))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
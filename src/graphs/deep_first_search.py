@@ -4,25 +4,78 @@
 # Email: ryomawithlst@gmail/outlook.com
 
 
-def dfs(graph, source, target):
+def dfs(graph, source=None, target=None):
     """深度优先搜索
     
     实现中不仅记录了顶点的发现顺序；还记录了顶点的探索完成顺序
+
+    先从source开始搜索，然后再依次从其余还未被发现的顶点开始搜索，source为None时直接按顶点顺序进行搜索
     
     Returns:
         discoverd (list): 顶点的深度优先搜索顺序
         finished (list): 顶点探索完成顺序
+
+    Example:
+        >>> graph = {"s": ["z", "w"], "z": ["y", "w"], "w": ["x"], "y": ["x"], "x": ["z"], "t": ["v", "u"], "v": ["s", "w"], "u": ["t", "v"]}
+        >>> discoverd, finished = dfs(graph, "s")
+        >>> discoverd
+        ['s', 'z', 'y', 'x', 'w', 't', 'v', 'u']
+        >>> finished
+        ['x', 'y', 'w', 'z', 's', 'v', 'u', 't']
+        >>> chain = {i: [i + 1] for i in range(100000)}
+        >>> len(dfs(chain, 0)[1])
+        100001
     """
     discoverd = []
     finished = []
-    dfs_recusion(graph, source, discoverd, finished)
+    visited = set()
+    if source is not None:
+        dfs_iterative(graph, source, discoverd, finished, visited)
     for vertex in graph.keys():
-        if vertex == source:
-            continue
-        dfs_recusion(graph, vertex, discoverd, finished)
+        dfs_iterative(graph, vertex, discoverd, finished, visited)
     return discoverd, finished
 
 
+def dfs_iterative(graph, start_vertex, discoverd, finished, visited):
+    """使用显式栈的深度优先搜索，与`dfs_recusion`得到的发现顺序和完成顺序完全相同
+
+    递归版本每深入一层就会占用一个Python栈帧，路径长度超过递归深度限制(默认约1000)时就会出错。
+    这里用一个栈来模拟递归调用：栈中每一项为(顶点, 该顶点邻接顶点的迭代器)，
+    迭代器记住了该顶点已经检查到了哪一个邻接顶点，相当于递归调用返回后继续执行的位置。
+
+    Args:
+        graph: 图
+        start_vertex: 起始顶点
+        discoverd (list): 顶点发现顺序，会被追加
+        finished (list): 顶点探索完成顺序，会被追加
+        visited (set): 已发现的顶点集合，用于 :math:`O(1)` 判断顶点是否已被发现，会被更新
+    """
+    if start_vertex in visited:
+        return
+    visited.add(start_vertex)
+    discoverd.append(start_vertex)
+    stack = [(start_vertex, iter(adjacent_vertexs(graph, start_vertex)))]
+    while stack:
+        vertex, neighbors = stack[-1]
+        for next_vertex in neighbors:
+            if next_vertex not in visited:
+                # 相当于递归调用dfs_recusion(graph, next_vertex, ...)
+                visited.add(next_vertex)
+                discoverd.append(next_vertex)
+                stack.append((next_vertex, iter(adjacent_vertexs(graph, next_vertex))))
+                break
+        else:
+            # 所有邻接顶点都已探索，相当于递归调用返回
+            stack.pop()
+            finished.append(vertex)
+
+
+def adjacent_vertexs(graph, vertex):
+    """返回顶点的邻接顶点，没有作为键出现在图中的顶点视为没有出边
+    """
+    return graph[vertex] if vertex in graph else ()
+
+
 def dfs_recusion(graph, start_vertex, discoverd, finished):
     if start_vertex not in discoverd:
         discoverd.append(start_vertex)
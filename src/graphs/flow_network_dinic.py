@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+from collections import deque
+
+from flow_network_residual import ResidualNetwork
+
+
+the_graph = {
+    "s": [("v1", 16), ("v2", 13)],
+    "v1": [("v3", 12)],
+    "v2": [("v1", 4), ("v4", 14)],
+    "v3": [("v2", 9), ("t", 20)],
+    "v4": [("v3", 7), ("t", 4)],
+    "t": []
+}
+
+
+class Dinic:
+    r"""最大流Dinic算法
+
+    Dinic算法同样基于增广路径，但它每一轮不是只找一条最短增广路径，而是：
+        1. 在残存网络上从源节点做一次广度优先搜索，得到每个结点的层次(level)，只保留从第i层指向第i+1层的残存边，构成层次图
+        2. 在层次图上不断用深度优先搜索寻找增广路径并增广，直到层次图中不存在从s到t的路径(得到一个阻塞流)
+        3. 重复以上过程，直到残存网络中不存在从s到t的路径
+
+    深度优先搜索时为每个结点维护一个当前弧(current arc)指针，已经确认无法再增广的弧不会被重复检查，
+    因此每一轮求阻塞流的时间为 :math:`O(VE)` ，且每一轮之后s到t的距离严格增加，所以总运行时间为 :math:`O(V^2E)` ，
+    在单位容量网络上为 :math:`O(E\sqrt{V})` 。
+
+    残存网络使用 `ResidualNetwork` 的数组形式存储，深度优先搜索使用显式栈实现。
+
+    Example:
+        >>> dinic = Dinic(the_graph, "s", "t")
+        >>> dinic.max_flows
+        23
+        >>> source_side, cut_edges = dinic.min_cut()
+        >>> sorted(source_side), sorted(cut_edges)
+        (['s', 'v1', 'v2', 'v4'], [('v1', 'v3'), ('v4', 't'), ('v4', 'v3')])
+        >>> flows = dinic.flows()
+        >>> flows[("s", "v1")] + flows[("s", "v2")]
+        23
+    """
+
+    def __init__(self, graph, s, t):
+        self.graph = graph
+        self.s = s
+        self.t = t
+
+        self.max_flows = None
+        self.network = ResidualNetwork(graph)
+        self.compute()
+
+    def build_level_graph(self, s, t):
+        """广度优先搜索计算层次，返回t是否可达
+        """
+        network = self.network
+        head, capacity, start = network.head, network.capacity, network.start
+        level = self.level
+        for i in range(len(level)):
+            level[i] = -1
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            next_level = level[u] + 1
+            for a in range(start[u], start[u + 1]):
+                v = head[a]
+                if capacity[a] > 0 and level[v] < 0:
+                    level[v] = next_level
+                    if v == t:
+                        return True
+                    queue.append(v)
+        return False
+
+    def blocking_flow(self, s, t):
+        """在层次图上求阻塞流
+
+        使用显式栈记录当前路径上的弧：
+            - 如果当前结点u的当前弧指向下一层且有残存容量，那么沿该弧前进
+            - 如果u没有可用的弧，那么将u的层次置为-1(从层次图中删除)，并回退一步
+            - 如果到达了t，那么沿路径增广，并回退到路径上第一条饱和的弧的起点
+        """
+        network = self.network
+        head, capacity, reverse, start = network.head, network.capacity, network.reverse, network.start
+        level, current = self.level, self.current
+        for u in range(network.vertex_count):
+            current[u] = start[u]
+
+        total = 0
+        path = []    # 路径上的弧
+        u = s
+        while True:
+            if u == t:
+                delta = min(capacity[a] for a in path)
+                total += delta
+                retreat = len(path)
+                for i, a in enumerate(path):
+                    capacity[a] -= delta
+                    capacity[reverse[a]] += delta
+                    if capacity[a] == 0 and retreat == len(path):
+                        retreat = i
+                del path[retreat:]
+                u = head[path[-1]] if path else s
+                continue
+
+            end = start[u + 1]
+            a = current[u]
+            next_level = level[u] + 1
+            while a < end and (capacity[a] <= 0 or level[head[a]] != next_level):
+                a += 1
+            current[u] = a
+            if a < end:
+                path.append(a)
+                u = head[a]
+            else:
+                # u无法再到达t，从层次图中删除并回退
+                level[u] = -1
+                if not path:
+                    return total
+                a = path.pop()
+                u = head[reverse[a]]
+                current[u] += 1
+
+    def compute(self):
+        network = self.network
+        s, t = network.index[self.s], network.index[self.t]
+        self.level = [-1] * network.vertex_count
+        self.current = [0] * network.vertex_count
+        max_flows = 0
+        while self.build_level_graph(s, t):
+            max_flows += self.blocking_flow(s, t)
+        self.max_flows = max_flows
+
+    def min_cut(self):
+        """返回最小切割 `(S, cut_edges)`
+        """
+        return self.network.min_cut(self.network.index[self.s])
+
+    def flows(self):
+        """返回每条原始边上的流量 `{(u, v): f(u,v)}`
+        """
+        return self.network.flows()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
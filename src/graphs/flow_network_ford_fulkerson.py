@@ -3,7 +3,7 @@
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
 from math import inf
-from copy import deepcopy
+from collections import deque
 
 from breadth_first_search import bfs
 
@@ -96,20 +96,17 @@ class FordFulkerson:
         """
         paths_info = {source: (None, inf)}
         discoverd = {source}
-        queue = [source]
-        queue_size = 1
-        while queue_size != 0:
-            vertex = queue.pop(0)
-            queue_size -= 1
+        queue = deque([source])
+        while queue:
+            vertex = queue.popleft()
             for next_vert, (c_uv, f_uv) in residual_network[vertex]:
                 if next_vert == target:
                     paths_info[next_vert] = (vertex, c_uv-f_uv)
-                    queue_size = 0
+                    queue.clear()
                     break
                 if next_vert not in discoverd:
                     discoverd.add(next_vert)
                     queue.append(next_vert)
-                    queue_size += 1
                     paths_info[next_vert] = (vertex, c_uv-f_uv)
             
         if target not in paths_info:
@@ -119,12 +116,13 @@ class FordFulkerson:
         remaining_capacity = inf
         while True:
             pre, r_f_uv = paths_info[target]
-            path.insert(0, target)
+            path.append(target)
             if remaining_capacity > r_f_uv:
                 remaining_capacity = r_f_uv
             if pre == None:
                 break
             target = pre
+        path.reverse()
         return path, remaining_capacity
     
     def compute(self):
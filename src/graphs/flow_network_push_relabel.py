@@ -4,6 +4,9 @@
 # Email: ryomawithlst@gmail/outlook.com
 from math import inf
 from pprint import pprint
+from collections import deque
+
+from flow_network_residual import ResidualNetwork
 
 the_graph = {
     "s": [("v1", 16), ("v2", 13)],
@@ -209,6 +212,266 @@ class PushRelabel:
         self.max_flows = self.vertex_info[self.t]["e"]
     
 
+
+class HeuristicPushRelabel:
+    r"""带启发式优化的Push-Relabel最大流算法
+
+    `PushRelabel` 每次都从头扫描所有结点来寻找溢出结点，而且残存网络是元组列表，推流时需要线性查找边和反向边。
+    这里的实现基于数组形式的残存网络 `ResidualNetwork` ，并使用了以下几种常用的优化：
+        - 溢出结点的选择策略：
+            - `highest` : 每次选择高度最高的溢出结点(highest-label)，使用按高度分桶的列表维护溢出结点，运行时间为 :math:`O(V^2\sqrt{E})`
+            - `fifo` : 使用先进先出队列维护溢出结点，运行时间为 :math:`O(V^3)`
+        - 当前弧(current arc)：每个结点记录下一条待检查的弧，重贴标签之前不会重复检查不可推流的弧
+        - 间隙(gap)启发式：如果重贴标签后某个高度h上已经没有任何结点，那么所有高度在h与|V|之间的结点都不可能再到达汇点，直接将它们的高度提升到|V|
+        - 全局重贴标签(global relabel)：每进行|V|次重贴标签后，从汇点在残存网络上反向做一次广度优先搜索，将每个结点的高度设为它到汇点的精确距离
+
+    算法分为两个阶段：第一阶段只处理高度小于|V|的溢出结点，结束时汇点的超额流就是最大流的值；
+    第二阶段将其余结点中剩下的超额流推回源节点，得到一个合法的流，用于输出每条边的流量和最小切割。
+
+    Example:
+        >>> highest_label = HeuristicPushRelabel(the_graph, "s", "t")
+        >>> highest_label.max_flows
+        23
+        >>> fifo = HeuristicPushRelabel(the_graph, "s", "t", strategy="fifo")
+        >>> fifo.max_flows
+        23
+        >>> source_side, cut_edges = fifo.min_cut()
+        >>> sorted(source_side), sorted(cut_edges)
+        (['s', 'v1', 'v2', 'v4'], [('v1', 'v3'), ('v4', 't'), ('v4', 'v3')])
+    """
+
+    def __init__(self, graph, s, t, strategy="highest"):
+        """
+        Args:
+            graph: 流网络，`{u: [(v, c(u,v)), ...]}` 形式的字典或者 `CSRGraph`
+            s: 源节点
+            t: 汇点
+            strategy: 溢出结点的选择策略， `highest` 或 `fifo`
+        """
+        if strategy not in ("highest", "fifo"):
+            raise ValueError("strategy must be 'highest' or 'fifo'")
+        self.graph = graph
+        self.s = s
+        self.t = t
+        self.strategy = strategy
+
+        self.max_flows = None
+        self.network = ResidualNetwork(graph)
+        self.compute()
+
+    def compute(self):
+        network = self.network
+        n = network.vertex_count
+        self.n = n
+        self.source = network.index[self.s]
+        self.sink = network.index[self.t]
+        self.height = [0] * n
+        self.excess = [0] * n
+        self.current = [0] * n
+        self.count = [0] * (n + 1)    # 每个高度上的结点个数，用于间隙启发式
+        self.buckets = [[] for _ in range(n)]
+        self.highest = -1
+        self.queue = deque()
+
+        # 初始化预流：将源节点的所有出边饱和
+        head, capacity, reverse = network.head, network.capacity, network.reverse
+        for a in network.arcs(self.source):
+            c = capacity[a]
+            if c > 0:
+                capacity[a] = 0
+                capacity[reverse[a]] += c
+                self.excess[head[a]] += c
+                self.excess[self.source] -= c
+
+        self.global_relabel()
+        while True:
+            if self.relabels >= n:
+                self.global_relabel()
+            u = self.next_active()
+            if u is None:
+                break
+            self.discharge(u)
+        self.max_flows = self.excess[self.sink]
+        self.return_excess_to_source()
+
+    def global_relabel(self):
+        """全局重贴标签：从汇点在残存网络上反向广度优先搜索，高度设为到汇点的距离，到达不了汇点的结点高度设为|V|
+        """
+        network = self.network
+        head, capacity, reverse, start = network.head, network.capacity, network.reverse, network.start
+        n, s, t = self.n, self.source, self.sink
+        height = self.height
+        for i in range(n):
+            height[i] = n
+        height[t] = 0
+        queue = deque([t])
+        while queue:
+            v = queue.popleft()
+            next_height = height[v] + 1
+            for a in range(start[v], start[v + 1]):
+                u = head[a]
+                # 弧a为v->u，其反向弧u->v有残存容量时，u可以向v推流
+                if height[u] == n and u != s and capacity[reverse[a]] > 0:
+                    height[u] = next_height
+                    queue.append(u)
+
+        count = self.count
+        for h in range(n + 1):
+            count[h] = 0
+        for u in range(n):
+            count[height[u]] += 1
+            self.current[u] = start[u]
+        # 高度变化后重建溢出结点集合
+        for bucket in self.buckets:
+            bucket.clear()
+        self.highest = -1
+        self.queue.clear()
+        for u in range(n):
+            if u != s and u != t and self.excess[u] > 0 and height[u] < n:
+                self.add_active(u)
+        self.relabels = 0
+
+    def add_active(self, u):
+        if self.strategy == "highest":
+            h = self.height[u]
+            self.buckets[h].append(u)
+            if h > self.highest:
+                self.highest = h
+        else:
+            self.queue.append(u)
+
+    def next_active(self):
+        """取出下一个待处理的溢出结点，没有则返回None
+        """
+        height, excess, n = self.height, self.excess, self.n
+        if self.strategy == "highest":
+            while self.highest >= 0:
+                bucket = self.buckets[self.highest]
+                while bucket:
+                    u = bucket.pop()
+                    # 被间隙启发式提升过高度的结点会残留在原来的桶中，这里直接跳过
+                    if excess[u] > 0 and height[u] == self.highest:
+                        return u
+                self.highest -= 1
+            return None
+        while self.queue:
+            u = self.queue.popleft()
+            if excess[u] > 0 and height[u] < n:
+                return u
+        return None
+
+    def discharge(self, u):
+        """对溢出结点u不断推流和重贴标签，直到u的超额流为0，或者u的高度达到|V|
+        """
+        network = self.network
+        head, capacity, reverse, start = network.head, network.capacity, network.reverse, network.start
+        height, excess, current = self.height, self.excess, self.current
+        n, s, t = self.n, self.source, self.sink
+        end = start[u + 1]
+        while excess[u] > 0:
+            a = current[u]
+            if a == end:
+                self.relabel(u)
+                if height[u] >= n:
+                    return
+                continue
+            v = head[a]
+            if capacity[a] > 0 and height[u] == height[v] + 1:
+                delta = excess[u] if excess[u] < capacity[a] else capacity[a]
+                capacity[a] -= delta
+                capacity[reverse[a]] += delta
+                excess[u] -= delta
+                if excess[v] == 0 and v != s and v != t:
+                    self.add_active(v)
+                excess[v] += delta
+                if capacity[a] == 0:
+                    current[u] = a + 1
+            else:
+                current[u] = a + 1
+
+    def relabel(self, u):
+        """重贴标签，并在出现间隙时使用间隙启发式
+        """
+        network = self.network
+        head, capacity, start = network.head, network.capacity, network.start
+        height, count, n = self.height, self.count, self.n
+        self.relabels += 1
+        old_height = height[u]
+        min_height = n
+        for a in range(start[u], start[u + 1]):
+            if capacity[a] > 0 and height[head[a]] < min_height:
+                min_height = height[head[a]]
+        count[old_height] -= 1
+        if count[old_height] == 0:
+            # 间隙：高度高于old_height的结点都无法再到达汇点
+            for w in range(n):
+                if old_height < height[w] < n:
+                    count[height[w]] -= 1
+                    height[w] = n
+                    count[n] += 1
+            height[u] = n
+        else:
+            height[u] = min(min_height + 1, n)
+        count[height[u]] += 1
+        self.current[u] = start[u]
+
+    def return_excess_to_source(self):
+        """第二阶段：将剩余的超额流推回源节点
+
+        先从源节点反向广度优先搜索，将每个结点的高度设为 |V| + 到源节点的距离，
+        再使用先进先出队列对剩余的溢出结点进行推流和重贴标签(不再限制高度)
+        """
+        network = self.network
+        head, capacity, reverse, start = network.head, network.capacity, network.reverse, network.start
+        height, excess, current = self.height, self.excess, self.current
+        n, s, t = self.n, self.source, self.sink
+        active = deque(u for u in range(n) if u != s and u != t and excess[u] > 0)
+        if not active:
+            return
+        for u in range(n):
+            height[u] = 2 * n
+            current[u] = start[u]
+        height[s] = n
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            for a in range(start[v], start[v + 1]):
+                u = head[a]
+                if height[u] == 2 * n and u != t and capacity[reverse[a]] > 0:
+                    height[u] = height[v] + 1
+                    queue.append(u)
+        while active:
+            u = active.popleft()
+            end = start[u + 1]
+            while excess[u] > 0:
+                a = current[u]
+                if a == end:
+                    min_height = min(height[head[b]] for b in range(start[u], end) if capacity[b] > 0)
+                    height[u] = min_height + 1
+                    current[u] = start[u]
+                    continue
+                v = head[a]
+                if capacity[a] > 0 and height[u] == height[v] + 1:
+                    delta = excess[u] if excess[u] < capacity[a] else capacity[a]
+                    capacity[a] -= delta
+                    capacity[reverse[a]] += delta
+                    excess[u] -= delta
+                    if excess[v] == 0 and v != s and v != t:
+                        active.append(v)
+                    excess[v] += delta
+                else:
+                    current[u] = a + 1
+
+    def min_cut(self):
+        """返回最小切割 `(S, cut_edges)`
+        """
+        return self.network.min_cut(self.source)
+
+    def flows(self):
+        """返回每条原始边上的流量 `{(u, v): f(u,v)}`
+        """
+        return self.network.flows()
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
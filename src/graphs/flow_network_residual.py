@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+from array import array
+from collections import deque
+
+
+the_graph = {
+    "s": [("v1", 16), ("v2", 13)],
+    "v1": [("v3", 12)],
+    "v2": [("v1", 4), ("v4", 14)],
+    "v3": [("v2", 9), ("t", 20)],
+    "v4": [("v3", 7), ("t", 4)],
+    "t": []
+}
+
+
+class ResidualNetwork:
+    """基于数组的残存网络
+
+    `FordFulkerson` 和 `PushRelabel` 中的残存网络使用 `{u: [(v, (c, f)), ...]}` 的形式存储，
+    每次推流都需要线性扫描邻接表来找到边(u,v)和它的反向边(v,u)，而且每次更新都要重新构造元组。
+
+    这里将顶点编号为 `0 ~ n-1` ，并将每条原始边(u,v)拆成一对残存边(弧)：正向弧u->v(残存容量初始为c)和反向弧v->u(残存容量初始为0)。
+    所有弧按起点分组连续存放(与CSR相同)：
+        - start: 长度为n+1，顶点u的所有弧编号为 `start[u] ~ start[u+1]-1`
+        - head: 弧的终点
+        - capacity: 弧的残存容量
+        - reverse: 弧的配对反向弧的编号
+
+    这样推流只需要 `capacity[a] -= delta; capacity[reverse[a]] += delta` 两次数组操作。
+
+    Example:
+        >>> network = ResidualNetwork(the_graph)
+        >>> network.vertex_count, network.arc_count
+        (6, 18)
+        >>> u = network.index["v2"]
+        >>> [(network.labels[network.head[a]], network.capacity[a]) for a in network.arcs(u)]
+        [('s', 0), ('v1', 4), ('v4', 14), ('v3', 0)]
+    """
+
+    def __init__(self, graph):
+        """
+        Args:
+            graph: 流网络，`{u: [(v, c(u,v)), ...]}` 形式的字典或者 `CSRGraph`
+        """
+        self.labels = list(graph.keys())
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        tails, heads, capacities = array("l"), array("l"), []
+        for u in self.labels:
+            for v, c_uv in graph[u]:
+                if v not in self.index:
+                    self.index[v] = len(self.labels)
+                    self.labels.append(v)
+                tails.append(self.index[u])
+                heads.append(self.index[v])
+                capacities.append(c_uv)
+        self.build(tails, heads, capacities)
+
+    def build(self, tails, heads, capacities):
+        """根据原始边构建弧数组，同一个顶点的弧按原始边的顺序排列，运行时间为 :math:`O(V+E)`
+        """
+        n, m = len(self.labels), len(tails)
+        typecode = "l" if all(isinstance(c, int) for c in capacities) else "d"
+        start = array("l", [0]) * (n + 1)
+        for e in range(m):
+            start[tails[e] + 1] += 1
+            start[heads[e] + 1] += 1
+        for i in range(n):
+            start[i + 1] += start[i]
+        cursor = start[:-1]
+        head = array("l", [0]) * (2 * m)
+        reverse = array("l", [0]) * (2 * m)
+        capacity = array(typecode, [0]) * (2 * m)
+        self.edge_arcs = array("l", [0]) * m    # 原始边 -> 正向弧编号
+        for e in range(m):
+            u, v = tails[e], heads[e]
+            forward, backward = cursor[u], cursor[v]
+            cursor[u] += 1
+            cursor[v] += 1
+            head[forward], head[backward] = v, u
+            reverse[forward], reverse[backward] = backward, forward
+            capacity[forward] = capacities[e]
+            self.edge_arcs[e] = forward
+        self.start = start
+        self.head = head
+        self.reverse = reverse
+        self.capacity = capacity
+        self.original_capacity = array(typecode, capacity)
+        self.tails = tails
+
+    @property
+    def vertex_count(self):
+        return len(self.labels)
+
+    @property
+    def arc_count(self):
+        return len(self.head)
+
+    def arcs(self, u):
+        """顶点u的所有弧编号
+        """
+        return range(self.start[u], self.start[u + 1])
+
+    def push(self, a, delta):
+        """沿弧a推送delta的流量
+        """
+        self.capacity[a] -= delta
+        self.capacity[self.reverse[a]] += delta
+
+    def flows(self):
+        """返回每条原始边上的流量
+
+        Returns:
+            dict: `{(u, v): f(u,v)}` ，存在平行边时流量会累加
+        """
+        flows = {}
+        labels = self.labels
+        for e, a in enumerate(self.edge_arcs):
+            key = (labels[self.tails[e]], labels[self.head[a]])
+            flows[key] = flows.get(key, 0) + self.original_capacity[a] - self.capacity[a]
+        return flows
+
+    def reachable_from(self, s):
+        """残存网络中从s出发可以到达的顶点(编号)集合
+        """
+        seen = bytearray(self.vertex_count)
+        seen[s] = 1
+        queue = deque([s])
+        head, capacity, start = self.head, self.capacity, self.start
+        while queue:
+            u = queue.popleft()
+            for a in range(start[u], start[u + 1]):
+                v = head[a]
+                if capacity[a] > 0 and not seen[v]:
+                    seen[v] = 1
+                    queue.append(v)
+        return seen
+
+    def min_cut(self, s):
+        """根据最大流对应的残存网络计算最小切割
+
+        由最大流最小切割定理，残存网络中从s可以到达的顶点集合S，与T=V-S就构成一个最小切割，
+        切割边就是所有从S指向T的原始边
+
+        Returns:
+            (S, cut_edges): S为源节点一侧的顶点标签集合，cut_edges为切割边 `[(u, v), ...]`
+        """
+        seen = self.reachable_from(s)
+        labels = self.labels
+        source_side = {labels[u] for u in range(self.vertex_count) if seen[u]}
+        cut_edges = []
+        for e, a in enumerate(self.edge_arcs):
+            u, v = self.tails[e], self.head[a]
+            if seen[u] and not seen[v]:
+                cut_edges.append((labels[u], labels[v]))
+        return source_side, cut_edges
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
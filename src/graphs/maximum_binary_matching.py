@@ -2,6 +2,9 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
+from array import array
+from collections import deque
+
 from  flow_network_ford_fulkerson import FordFulkerson
 # 二分图
 the_graph = {
@@ -63,6 +66,173 @@ def maximum_binary_matching(binary_graph):
     return largest_base, matching
 
 
+
+class HopcroftKarp:
+    r"""最大二分匹配的Hopcroft-Karp算法
+
+    将二分图转为流网络后使用Edmonds-Karp方法，每次只能找到一条增广路径，运行时间为 :math:`O(VE^2)` 。
+    Hopcroft-Karp算法则直接在二分图上进行，每一个阶段：
+        1. 从所有未匹配的左侧顶点同时开始广度优先搜索，沿"非匹配边 -> 匹配边"交替前进，得到每个左侧顶点的层次，直到遇到未匹配的右侧顶点
+        2. 沿层次递增的方向进行深度优先搜索，找出一组顶点不相交的最短增广路径，并同时增广
+
+    由于最多只需要 :math:`O(\sqrt{V})` 个阶段，每个阶段的运行时间为 :math:`O(E)` ，所以总运行时间为 :math:`O(E\sqrt{V})` 。
+
+    顶点被映射为整数编号，每个左侧顶点的邻接表是一个整数数组，匹配关系也使用整数数组存储。
+    边可以随时通过`add_edge`/`add_edges`流式加入，再次调用`match`时会在当前匹配的基础上继续增广，而不是从头计算。
+
+    Example:
+        >>> hopcroft_karp = HopcroftKarp(the_graph)
+        >>> hopcroft_karp.match()
+        3
+        >>> sorted(hopcroft_karp.matching())
+        [('l1', 'r1'), ('l2', 'r3'), ('l3', 'r2')]
+        >>> hopcroft_karp.add_edges([("l4", "r5"), ("l5", "r6")])
+        >>> hopcroft_karp.match()
+        5
+    """
+
+    def __init__(self, binary_graph=None):
+        """
+        Args:
+            binary_graph: 二分图，`{左侧顶点: [右侧顶点, ...]}` 的形式，可以为None，之后再加入边
+        """
+        self.left_labels = []
+        self.left_index = {}
+        self.right_labels = []
+        self.right_index = {}
+        self.adjacency = []    # 左侧顶点 -> 右侧顶点编号数组
+        self.match_left = array("l")    # 左侧顶点匹配到的右侧顶点，-1表示未匹配
+        self.match_right = array("l")    # 右侧顶点匹配到的左侧顶点，-1表示未匹配
+        self.size = 0    # 当前匹配的边数
+        if binary_graph is not None:
+            for l in binary_graph.keys():
+                self.add_vertex(l)
+                for r in binary_graph[l]:
+                    self.add_edge(l, r)
+
+    def add_vertex(self, l):
+        """加入左侧顶点，返回其编号
+        """
+        if l not in self.left_index:
+            self.left_index[l] = len(self.left_labels)
+            self.left_labels.append(l)
+            self.adjacency.append(array("l"))
+            self.match_left.append(-1)
+        return self.left_index[l]
+
+    def add_edge(self, l, r):
+        """加入边(l, r)，已有的匹配保持不变
+        """
+        u = self.add_vertex(l)
+        if r not in self.right_index:
+            self.right_index[r] = len(self.right_labels)
+            self.right_labels.append(r)
+            self.match_right.append(-1)
+        self.adjacency[u].append(self.right_index[r])
+
+    def add_edges(self, edges):
+        """流式加入边序列 `[(l, r), ...]`
+        """
+        for l, r in edges:
+            self.add_edge(l, r)
+
+    def bfs(self):
+        """计算左侧顶点的层次，返回是否存在增广路径
+        """
+        inf = len(self.left_labels) + 1
+        dist, adjacency, match_left, match_right = self.dist, self.adjacency, self.match_left, self.match_right
+        queue = deque()
+        for u in range(len(self.left_labels)):
+            if match_left[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = inf
+        found = inf
+        while queue:
+            u = queue.popleft()
+            next_dist = dist[u] + 1
+            if next_dist > found:
+                continue
+            for r in adjacency[u]:
+                v = match_right[r]
+                if v == -1:
+                    if found == inf:
+                        found = next_dist
+                elif dist[v] == inf:
+                    dist[v] = next_dist
+                    queue.append(v)
+        self.found = found
+        return found != inf
+
+    def augment_from(self, root):
+        """从未匹配的左侧顶点root出发，沿层次图进行深度优先搜索(显式栈)，找到一条增广路径则进行增广
+        """
+        inf = len(self.left_labels) + 1
+        adjacency, match_left, match_right = self.adjacency, self.match_left, self.match_right
+        dist, pointer = self.dist, self.pointer
+        stack = [root]
+        via = []    # via[i]为stack[i]选择的右侧顶点
+        while stack:
+            u = stack[-1]
+            neighbors = adjacency[u]
+            if pointer[u] < len(neighbors):
+                r = neighbors[pointer[u]]
+                pointer[u] += 1
+                v = match_right[r]
+                if v == -1:
+                    if dist[u] + 1 == self.found:
+                        via.append(r)
+                        for l, r in zip(stack, via):
+                            match_left[l] = r
+                            match_right[r] = l
+                        return True
+                elif dist[v] == dist[u] + 1:
+                    via.append(r)
+                    stack.append(v)
+            else:
+                # 从u出发已经找不到增广路径，本阶段内不再访问u
+                dist[u] = inf
+                stack.pop()
+                if via:
+                    via.pop()
+        return False
+
+    def match(self):
+        """在当前匹配的基础上计算最大匹配，返回匹配的边数
+        """
+        n = len(self.left_labels)
+        self.greedy_match()
+        self.dist = [0] * n
+        while self.bfs():
+            self.pointer = [0] * n
+            for u in range(n):
+                if self.match_left[u] == -1 and self.augment_from(u):
+                    self.size += 1
+        return self.size
+
+    def greedy_match(self):
+        """贪心地为每个未匹配的左侧顶点匹配第一个未匹配的邻接右侧顶点，作为初始匹配，可以减少后面的阶段数
+        """
+        match_left, match_right = self.match_left, self.match_right
+        for u, neighbors in enumerate(self.adjacency):
+            if match_left[u] != -1:
+                continue
+            for r in neighbors:
+                if match_right[r] == -1:
+                    match_left[u] = r
+                    match_right[r] = u
+                    self.size += 1
+                    break
+
+    def matching(self):
+        """返回匹配的边 `[(l, r), ...]`
+        """
+        return [
+            (self.left_labels[u], self.right_labels[r])
+            for u, r in enumerate(self.match_left) if r != -1
+        ]
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -39,7 +39,6 @@ class MinmumSpanningTree:
             graph: 连通无向图
         """
         self.graph = graph
-        self.root = root
         self.n = len(graph)
         
         self.edges = []
@@ -54,7 +53,8 @@ class MinmumSpanningTree:
     def minmum_weight_edge(self, exclude_vectexs):
         """每次选取与已生成的最小生成树连接的权重最小的边加入到树中
         
-        这里的实现方式类似prim算法，但没有优化
+        这里的实现方式类似prim算法，但没有优化：每次都要遍历所有的边，总运行时间为 :math:`O(VE)` ，
+        实际使用时应选择 `PrimMST` (索引优先队列， :math:`O(E\\lg V)` )或 `DensePrimMST` (稠密图， :math:`O(V^2)` )
         """
         min_w_edge = (None, None)
         min_w = math.inf
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../")
+
+from multiprocessing import Pool
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from mst_kruskal import KruskalMST, collect_undirected_edges, radix_argsort
+
+
+connected_undirected_graph = {
+    "a": [("b", 4), ("h", 8)],
+    "b": [("a", 4), ("c", 8), ("h", 11)],
+    "c": [("b", 8), ("i", 2), ("f", 4), ("d", 7)],
+    "d": [("c", 7), ("f", 14), ("e", 9)],
+    "e": [("d", 9), ("f", 10)],
+    "f": [("e", 10), ("d", 14), ("c", 4), ("g", 2)],
+    "g": [("i", 6), ("h", 1), ("f", 2)],
+    "h": [("a", 8), ("i", 7), ("g", 1)],
+    "i": [("c", 2), ("h", 7), ("g", 6)]
+}
+
+
+class BoruvkaMST(KruskalMST):
+    """最小生成树的Borůvka算法
+
+    Borůvka算法以轮为单位进行，每一轮：
+        1. 对每个连通分量，找出一个端点在该分量内、另一个端点在分量外的权重最小的边
+        2. 将这些边全部加入最小生成树，合并它们连接的分量
+        3. 收缩：将每个分量收缩为一个顶点，删除两个端点在同一个分量中的边
+
+    每一轮分量的个数至少减少一半，因此最多进行 :math:`\\lg V` 轮，总运行时间为 :math:`O(E\\lg V)` 。
+
+    第1步对每条边的处理是相互独立的，因此可以并行：边数组写入共享内存后，将边分为processes块交给进程池，
+    每个工作进程得到自己那一块边中每个分量的最小边，主进程再对各块的结果取最小值。
+
+    所有边按权重排序后，用边在排好序的数组中的位置代替权重进行比较，这样边之间不存在相同的权重，
+    不会在一轮中选出构成环路的边；并且与 `ArrayKruskalMST` 使用相同的排序方式，因此得到的最小生成树(森林)与它完全相同。
+
+    结果的形式与 `KruskalMST` 相同，另外最小生成树的边按权重排列保存在 `tree_edges` 中。
+
+    Example:
+        >>> boruvka_mst = BoruvkaMST(connected_undirected_graph, processes=2)
+        >>> boruvka_mst.minmum_weight, boruvka_mst.rounds
+        (37, 2)
+        >>> from mst_kruskal import ArrayKruskalMST
+        >>> boruvka_mst.tree_edges == ArrayKruskalMST(connected_undirected_graph).tree_edges
+        True
+    """
+
+    def __init__(self, graph, processes=None):
+        """
+        Args:
+            graph: 无向图，字典形式或者 `CSRGraph`
+            processes: 工作进程数，为None时使用CPU核数，为1时不创建进程池
+        """
+        self.processes = processes or os.cpu_count()
+        self.rounds = 0
+        self.tree_edges = None
+        super().__init__(graph)
+
+    def create(self):
+        graph = self.graph if isinstance(self.graph, CSRGraph) else CSRGraph.from_dict(self.graph)
+        labels = graph.labels
+        tails, heads, weights = collect_undirected_edges(graph)
+        if weights.dtype.kind in "iu":
+            order = radix_argsort(weights)
+        else:
+            order = np.argsort(weights, kind="stable")
+        tails, heads, weights = tails[order], heads[order], weights[order]
+
+        # 收缩后的图：端点为分量编号，edge_ids为边在排好序的数组中的位置，始终保持升序
+        component_tails, component_heads = tails, heads
+        edge_ids = np.arange(len(tails))
+        component_count = graph.vertex_count
+        selected = []
+        pool = None
+        memories = []
+        if self.processes > 1 and len(edge_ids) > 0:
+            # 在这里导入：shared_memory模块在Python 3.8才加入
+            from multiprocessing.shared_memory import SharedMemory
+            # 共享内存只在开始时创建一次，每一轮将收缩后的边写入前面的部分，工作进程只在初始化时附加一次
+            names = []
+            for _ in range(2):
+                memory = SharedMemory(create=True, size=tails.nbytes)
+                memories.append(memory)
+                names.append(memory.name)
+            self.shared = [np.ndarray(tails.shape, dtype=np.int64, buffer=memory.buf) for memory in memories]
+            pool = Pool(self.processes, initializer=_attach_shared, initargs=(names, len(tails)))
+        try:
+            while len(edge_ids) > 0:
+                self.rounds += 1
+                best = self.cheapest_edges(component_tails, component_heads, component_count, pool)
+                chosen = np.unique(best[best < len(edge_ids)])
+                selected.append(edge_ids[chosen])
+
+                # 合并分量，并重新编号为 0 ~ k-1
+                roots = self.merge_components(component_tails, component_heads, best)
+                _, relabel = np.unique(roots, return_inverse=True)
+                component_count = int(relabel.max()) + 1
+
+                # 收缩：删除两个端点在同一个分量中的边
+                component_tails = relabel[component_tails]
+                component_heads = relabel[component_heads]
+                keep = component_tails != component_heads
+                component_tails, component_heads = component_tails[keep], component_heads[keep]
+                edge_ids = edge_ids[keep]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+                del self.shared
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+        selected = np.sort(np.concatenate(selected)) if selected else np.arange(0)
+        tree_edges = []
+        vertexs_already_in_tree = set()
+        total_weight = 0
+        for u, v, w in zip(tails[selected].tolist(), heads[selected].tolist(), weights[selected].tolist()):
+            tree_edges.append((labels[u], labels[v], w))
+            vertexs_already_in_tree.update((labels[u], labels[v]))
+            total_weight += w
+        self.tree_edges = tree_edges
+        return total_weight, vertexs_already_in_tree
+
+    @staticmethod
+    def merge_components(tails, heads, best):
+        """由每个分量选出的最小边合并分量，返回每个分量合并后所在的树的根
+
+        每个分量c指向它的最小边的另一个端点所在的分量，得到一个森林，其中唯一的环路是两个分量选择了同一条边，
+        此时让编号较小的分量作为根。之后不断令 `parent = parent[parent]` (指针跳跃)，直到所有分量都直接指向根，
+        每一步都是向量化的数组运算，不需要逐个分量地执行union。
+        """
+        k = len(best)
+        components = np.arange(k)
+        has_edge = best < len(tails)
+        parent = components.copy()
+        chosen = best[has_edge]
+        parent[has_edge] = np.where(tails[chosen] == components[has_edge], heads[chosen], tails[chosen])
+        mutual = (parent[parent] == components) & (components < parent)
+        parent[mutual] = components[mutual]
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                return parent
+            parent = grand
+
+    def cheapest_edges(self, tails, heads, component_count, pool):
+        """返回长度为component_count的数组，第c个元素为与分量c相连的最小边的位置，没有这样的边时为边数
+        """
+        m = len(tails)
+        if pool is None:
+            return _cheapest_edges_in(tails, heads, 0, m, component_count)
+
+        shared_tails, shared_heads = self.shared
+        shared_tails[:m] = tails
+        shared_heads[:m] = heads
+        step = -(-m // self.processes)
+        tasks = [(m, start, min(start + step, m), component_count) for start in range(0, m, step)]
+        best = np.full(component_count, m, dtype=np.int64)
+        for part in pool.imap_unordered(_cheapest_edges_task, tasks):
+            np.minimum(best, part, out=best)
+        return best
+
+
+_shared = {}    # 工作进程中附加的共享内存和边数组
+
+
+def _attach_shared(names, m):
+    """工作进程的初始化函数：附加到主进程创建的共享内存块上
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    memories = [SharedMemory(name=name) for name in names]
+    _shared["memories"] = memories    # 保持引用，避免共享内存被关闭
+    _shared["tails"], _shared["heads"] = (np.ndarray((m,), dtype=np.int64, buffer=memory.buf) for memory in memories)
+
+
+def _cheapest_edges_in(tails, heads, start, end, component_count):
+    """在第start到end条边中，找出每个分量的最小边的位置
+    """
+    m = len(tails)
+    best = np.full(component_count, m, dtype=np.int64)
+    positions = np.arange(start, end, dtype=np.int64)
+    np.minimum.at(best, tails[start:end], positions)
+    np.minimum.at(best, heads[start:end], positions)
+    return best
+
+
+def _cheapest_edges_task(task):
+    """工作进程：处理共享内存中前m条边中的一块
+    """
+    m, start, end, component_count = task
+    return _cheapest_edges_in(_shared["tails"][:m], _shared["heads"][:m], start, end, component_count)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -2,7 +2,14 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
-from queue import PriorityQueue
+import os
+import sys
+sys.path.insert(0, "../")
+
+import numpy as np
+
+from high_level_data_structures.disjoin_set import DisjoinSet, ArrayDisjoinSet
+from csr_graph import CSRGraph
 
 
 connected_undirected_graph = {
@@ -22,6 +29,13 @@ class KruskalMST:
     """最小生成树的Kruskal算法
     
     Kruskal算法的思想是每次添加的边都是图中权重最小的边(贪心策略)，因此这样可能会在生成过程中出现多颗子树(不相连),我们称为森林。因此需要直到所有的子树连接为一颗树，且覆盖完图中所有的节点，则代表树生成结束
+
+    Example:
+        >>> kruskal_mst = KruskalMST(connected_undirected_graph)
+        >>> kruskal_mst.minmum_weight
+        37
+        >>> sorted(kruskal_mst.edges)
+        ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
     """
     
     def __init__(self, graph):
@@ -30,33 +44,126 @@ class KruskalMST:
 
     def create(self):
         vertexs_already_in_tree = set()
-        queue = PriorityQueue()
         disjoin_set = DisjoinSet()
         for v in self.graph.keys():
             disjoin_set.make(v)
         
+        # 所有边只需要排序一次，不需要使用线程安全的queue.PriorityQueue(每次put/get都需要加锁)
+        edges = []
         for i in self.graph.keys():
             for j,w in self.graph[i]:
-                queue.put((w, (i,j)))
+                edges.append((w, i, j))
+        edges.sort(key=lambda edge: edge[0])
         
         total_weight = 0
-        while not queue.empty():
-            w, edge = queue.get()
+        for w, *edge in edges:
             if disjoin_set.find_set(edge[0]) != disjoin_set.find_set(edge[1]):
                 vertexs_already_in_tree.update(edge)
                 disjoin_set.union(edge[0], edge[1])
                 total_weight += w
         return total_weight, vertexs_already_in_tree
+
+
+class ArrayKruskalMST(KruskalMST):
+    """基于数组的Kruskal算法
+
+    适用于边数很多的图：
+        1. 所有边只收集一次，保存到NumPy数组tails、heads、weights中。无向图中每条边会在两个端点的邻接表中各出现一次，
+           这里将每条边的端点规范为 `(min(u,v), max(u,v))` 并去掉自环，不做去重，同一条边的第二次出现会被并查集拒绝
+        2. 对权重数组排序得到边的顺序：整数权重使用基数排序( `radix_argsort` )，否则使用 `np.argsort`
+        3. 使用 `ArrayDisjoinSet` (整数数组、路径减半、按大小合并)判断边的两个端点是否已经连通，
+           接受了 :math:`\\vert V \\vert - 1` 条边之后立即结束，不再检查剩余的边
+
+    结果与 `KruskalMST` 相同，另外最小生成树(森林)的边保存在 `tree_edges` 中，为 `[(u, v, w), ...]` 。
+
+    Example:
+        >>> kruskal_mst = ArrayKruskalMST(connected_undirected_graph)
+        >>> kruskal_mst.minmum_weight
+        37
+        >>> len(kruskal_mst.tree_edges), sorted(kruskal_mst.edges) == sorted(connected_undirected_graph)
+        (8, True)
+        >>> kruskal_mst.tree_edges[:3]
+        [('g', 'h', 1), ('c', 'i', 2), ('f', 'g', 2)]
+    """
+
+    chunk_size = 1 << 16    # 每次转换为Python列表的边数
+
+    def create(self):
+        graph = self.graph if isinstance(self.graph, CSRGraph) else CSRGraph.from_dict(self.graph)
+        labels = graph.labels
+        tails, heads, weights = collect_undirected_edges(graph)
+        if weights.dtype.kind in "iu":
+            order = radix_argsort(weights)
+        else:
+            order = np.argsort(weights, kind="stable")
+
+        disjoin_set = ArrayDisjoinSet(graph.vertex_count)
+        tree_edges = []
+        vertexs_already_in_tree = set()
+        total_weight = 0
+        remaining = graph.vertex_count - 1
+        # 按块将排好序的边转换为Python列表，避免逐个访问NumPy标量，也避免一次性转换所有的边
+        for start in range(0, len(order), self.chunk_size):
+            if remaining == 0:
+                break
+            chunk = order[start:start + self.chunk_size]
+            for u, v, w in zip(tails[chunk].tolist(), heads[chunk].tolist(), weights[chunk].tolist()):
+                if disjoin_set.union(u, v):
+                    tree_edges.append((labels[u], labels[v], w))
+                    vertexs_already_in_tree.update((labels[u], labels[v]))
+                    total_weight += w
+                    remaining -= 1
+                    if remaining == 0:
+                        break
+        self.tree_edges = tree_edges
+        return total_weight, vertexs_already_in_tree
+
+
+def collect_undirected_edges(graph):
+    """将CSRGraph中的边收集为NumPy数组 `(tails, heads, weights)`
+
+    端点规范为 `tails < heads` ，并去掉自环。无向图中每条边的两个方向都会保留下来，这里不做去重：
+    去重需要对所有的边做一次比较排序，会抵消后面基数排序的线性时间，而重复的边在Kruskal算法中会被并查集直接拒绝，
+    在Boruvka算法中也不影响结果。运行时间为 :math:`O(V+E)`
+    """
+    indptr, indices, weights = graph.to_numpy()
+    if weights is None:    # 无权图或没有边的图
+        weights = np.ones(len(indices), dtype=np.int64)
+    n = graph.vertex_count
+    tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    heads = indices.astype(np.int64)
+    lo, hi = np.minimum(tails, heads), np.maximum(tails, heads)
+    not_loop = lo != hi
+    return lo[not_loop], hi[not_loop], weights[not_loop]
+
+
+def radix_argsort(keys, bits=16):
+    """整数数组的LSD基数排序，返回排序后的下标(稳定)
+
+    每一趟取出bits位作为一个数位，对数位使用 `np.argsort(kind="stable")` 排序，对于不超过16位的无符号整数，
+    NumPy的稳定排序本身就是基数排序，因此每一趟都是线性时间。趟数由最大的关键字决定，关键字范围越小，趟数越少。
+
+    Example:
+        >>> radix_argsort(np.array([70000, -3, 5, 70000, 0])).tolist()
+        [1, 4, 2, 0, 3]
+    """
+    keys = np.asarray(keys)
+    if len(keys) == 0:
+        return np.arange(0)
+    keys = keys.astype(np.int64) - keys.min()    # 平移为非负整数
+    max_key = int(keys.max())
+    mask = (1 << bits) - 1
+    digit_type = np.uint16 if bits <= 16 else np.uint32
+    order = np.arange(len(keys))
+    shift = 0
+    while shift == 0 or (max_key >> shift) > 0:
+        digits = ((keys[order] >> shift) & mask).astype(digit_type)
+        order = order[np.argsort(digits, kind="stable")]
+        shift += bits
+    return order
         
         
 if __name__ == '__main__':
-    import os
-    import sys
-    sys.path.insert(0, os.path.abspath('../high_level_data_structures/'))
-    
-    from disjoin_set import DisjoinSet
-    
-    kruskal_mst = KruskalMST(connected_undirected_graph)
-    print(kruskal_mst.minmum_weight)
-    print(kruskal_mst.edges)
+    import doctest
+    doctest.testmod()
     
\ No newline at end of file
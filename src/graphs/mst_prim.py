@@ -2,38 +2,77 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
-from queue import PriorityQueue
+import os
+import sys
+sys.path.insert(0, "../")
+
+import math
+
+import numpy as np
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+
+
+connected_undirected_graph = {
+    "a": [("b", 4), ("h", 8)],
+    "b": [("a", 4), ("c", 8), ("h", 11)],
+    "c": [("b", 8), ("i", 2), ("f", 4), ("d", 7)],
+    "d": [("c", 7), ("f", 14), ("e", 9)],
+    "e": [("d", 9), ("f", 10)],
+    "f": [("e", 10), ("d", 14), ("c", 4), ("g", 2)],
+    "g": [("i", 6), ("h", 1), ("f", 2)],
+    "h": [("a", 8), ("i", 7), ("g", 1)],
+    "i": [("c", 2), ("h", 7), ("g", 6)]
+}
 
 
 class PrimMST:
     """最小生成树Prim算法
     
     Prim算法的思想是每次添加的边总能构成一颗树(全部相连),且每次添加的边的权重总是与已生成的前驱子树相连的边中最小的(贪心策略)
+
+    除了以 `{from: {to, ...}}` 形式保存的树结构edges，每个顶点在树中的父顶点保存在parent中(根顶点的父顶点为None)。
+
+    Example:
+        >>> prim_mst = PrimMST(connected_undirected_graph, "c")
+        >>> prim_mst.minmum_weight
+        37
+        >>> sorted(prim_mst.parent.items(), key=lambda item: item[0])
+        [('a', 'h'), ('b', 'a'), ('c', None), ('d', 'c'), ('e', 'd'), ('f', 'c'), ('g', 'f'), ('h', 'g'), ('i', 'c')]
     """
     
-    def __init__(self, graph, root):
+    def __init__(self, graph, root, queue_class=IndexedPriorityQueue):
+        """
+        Args:
+            graph: 无向图
+            root: 根顶点
+            queue_class: 优先队列的实现，需要提供与`IndexedPriorityQueue`相同的接口：
+                `put(item, priority)`(元素已存在时更新权重值)、`get()`、`empty()`、`priority(item)` 和 `in`
+        """
         self.graph = graph
         self.root = root
+        self.queue_class = queue_class
         self.n = len(self.graph)
+        self.parent = None
         self.minmum_weight, self.edges = self.create()
     
     def create(self):
         """构建最小生成树
-        
-        使用优先级队列添加新的与已生成的前驱子树相连的边。不断循环添加新的边加入的已生成的前驱子树中，直到覆盖完图中所有的顶点
-        
-        由于生成过程中会不断将边加入到队列中，因此该算法的时间复杂度在于优先级队列的实现方式。
+
+        使用索引优先队列维护所有与已生成的前驱子树相连、但还不在树中的顶点，队列中顶点的权重值为：该顶点与前驱子树相连的所有边中最小的权重。
+        每次从队列中取出权重值最小的顶点加入到前驱子树中，然后用它的邻边去更新邻接顶点的权重值(decrease-key)，直到覆盖完图中所有的顶点
+
+        由于队列中每个顶点最多只出现一次，因此队列大小为 :math:`O(V)` ，算法运行时间为 :math:`O(E\lg V)`
         """
-        queue = PriorityQueue()
-        queue.put((0, (None, self.root)))
+        queue = self.queue_class()
+        queue.put(self.root, 0)
+        parent = {self.root: None}    # 记录每个顶点当前与前驱子树相连的最小权重边的另一端顶点
         vertexs_already_in_tree = set()    # 存储已经生成的前驱子树中的节点
         edges = {}    # 存储树结构
         total_weight = 0     # 生成树的总权重
-        while 1:
-            weight, vertex = queue.get()    # 每次取与前驱子树相连，且权重最小的边
-            from_vertex, to_vertex = vertex
-            if to_vertex in vertexs_already_in_tree:    # 如果边的顶点已经在生成的前驱子树中，那么跳过
-                continue
+        while not queue.empty():
+            weight, to_vertex = queue.get()    # 每次取与前驱子树相连，且权重最小的边
+            from_vertex = parent[to_vertex]
             total_weight += weight    # 更新已生成的前驱子树的权重值
             # 记录树结构
             if from_vertex not in edges:
@@ -44,27 +83,91 @@ class PrimMST:
             vertexs_already_in_tree.add(to_vertex)
             if len(vertexs_already_in_tree) == self.n:    # 当生成树已经覆盖所有的顶点，则生成完毕
                 break
-            # 遍历新的与已生成的前驱子树相连的边
+            # 遍历新的与已生成的前驱子树相连的边，更新邻接顶点的权重值
             for v, w in self.graph[to_vertex]:
-                if v not in vertexs_already_in_tree:
-                    queue.put((w, (to_vertex, v)))
+                if v in vertexs_already_in_tree:
+                    continue
+                if v not in queue or w < queue.priority(v):
+                    parent[v] = to_vertex
+                    queue.put(v, w)
+        self.parent = {v: parent[v] for v in vertexs_already_in_tree}
         return total_weight, edges
+
+
+class DensePrimMST:
+    """稠密图上的Prim算法
+
+    对于完全图(例如点云中任意两点之间都有一条边，权重为两点间的距离)， :math:`E = O(V^2)` ，
+    此时使用优先队列反而不如直接使用数组：用数组key记录每个还不在树中的顶点与树相连的最小边的权重，每一轮：
+        1. 在key中找到最小值对应的顶点u加入树中， :math:`O(V)`
+        2. 用u到其他所有顶点的边的权重更新key和parent， :math:`O(V)`
+
+    总运行时间为 :math:`O(V^2)` ，每一轮的两步都是NumPy的向量化运算。
+
+    图可以由权重矩阵给出，也可以由点的坐标给出。给出坐标时，边的权重为欧氏距离，每一轮只计算u到所有点的距离，
+    不需要保存 :math:`V \\times V` 的距离矩阵，额外的内存只有 :math:`O(V)` 。
+
+    结果为总权重minmum_weight和父顶点数组parent(根顶点为-1)。
+
+    Example:
+        >>> points = np.array([[0, 0], [0, 1], [3, 1], [3, 3], [1, 1]])
+        >>> dense_prim = DensePrimMST(points=points)
+        >>> dense_prim.minmum_weight
+        6.0
+        >>> dense_prim.parent.tolist()
+        [-1, 0, 4, 2, 1]
+        >>> W = np.array([[0, 4, 1], [4, 0, 2], [1, 2, 0]])
+        >>> DensePrimMST(W).parent.tolist()
+        [-1, 2, 0]
+    """
+
+    def __init__(self, weights=None, points=None, root=0):
+        """
+        Args:
+            weights: :math:`n \\times n` 的对称权重矩阵，不存在的边为inf
+            points: :math:`n \\times d` 的坐标数组，与weights二选一
+            root: 根顶点的编号
+        """
+        if (weights is None) == (points is None):
+            raise ValueError("Exactly one of weights and points must be given")
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        self.points = None if points is None else np.asarray(points, dtype=np.float64)
+        self.n = len(self.weights if points is None else self.points)
+        self.root = root
+        self.parent = None
+        self.minmum_weight = self.create()
+
+    def edge_weights(self, u):
+        """返回u到所有顶点的边的权重
+        """
+        if self.weights is not None:
+            return self.weights[u]
+        diff = self.points - self.points[u]
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+    def create(self):
+        n = self.n
+        key = np.full(n, math.inf)
+        parent = np.full(n, -1, dtype=np.int64)
+        in_tree = np.zeros(n, dtype=bool)
+        key[self.root] = 0
+        total_weight = 0.0
+        for _ in range(n):
+            u = int(np.argmin(key))
+            if in_tree[u] or key[u] == math.inf:    # 剩余的顶点与树不连通
+                break
+            total_weight += key[u]
+            in_tree[u] = True
+            key[u] = math.inf
+            row = self.edge_weights(u)
+            improve = row < key
+            improve &= ~in_tree
+            key[improve] = row[improve]
+            parent[improve] = u
+        self.parent = parent
+        return float(total_weight)
         
 
 if __name__ == '__main__':
-    connected_undirected_graph = {
-        "a": [("b", 4), ("h", 8)],
-        "b": [("a", 4), ("c", 8), ("h", 11)],
-        "c": [("b", 8), ("i", 2), ("f", 4), ("d", 7)],
-        "d": [("c", 7), ("f", 14), ("e", 9)],
-        "e": [("d", 9), ("f", 10)],
-        "f": [("e", 10), ("d", 14), ("c", 4), ("g", 2)],
-        "g": [("i", 6), ("h", 1), ("f", 2)],
-        "h": [("a", 8), ("i", 7), ("g", 1)],
-        "i": [("c", 2), ("h", 7), ("g", 6)]
-    }
-    
-    prim_mst = PrimMST(connected_undirected_graph, "c")
-    print(prim_mst.minmum_weight)
-    print(prim_mst.edges)
-    
\ No newline at end of file
+    import doctest
+    doctest.testmod()
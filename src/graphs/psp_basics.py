@@ -5,6 +5,8 @@
 from math import inf
 from copy import deepcopy
 
+import numpy as np
+
 the_graph = [
     [0,    3,    8,   inf,  -4 ],
     [inf,  0,    inf, 1,    7  ],
@@ -143,6 +145,91 @@ class GeneralPairsShortestPaths:
             m = 2*m
         return L_m
 
+    @classmethod
+    def vectorized_faster_pairs_shortest_paths(cls, W, dtype=np.float64, block_size=256):
+        """较快的计算版本的NumPy实现
+
+        与`faster_pairs_shortest_paths`相同，使用重复平方的方法计算，但每次平方使用的是`min_plus_product`的向量化分块实现
+
+        Args:
+            W: 表示 :math:`W` 矩阵，可以是嵌套列表或者NumPy数组
+            dtype: 计算使用的数据类型，如 `np.float32` 、 `np.int32` 等，整数类型时不可达用 `infinity_of(dtype)` 表示
+            block_size: 分块大小
+
+        Example:
+            >>> L_m = GeneralPairsShortestPaths.vectorized_faster_pairs_shortest_paths(the_graph, dtype=np.int32)
+            >>> L_m.tolist()
+            [[0, 1, -3, 2, -4], [3, 0, -4, 1, -1], [7, 4, 0, 5, 3], [2, -1, -5, 0, -2], [8, 5, 1, 6, 0]]
+        """
+        L_m = to_weight_matrix(W, dtype)
+        n = len(L_m)
+        m = 1
+        while m < n-1:
+            L_m = cls.min_plus_product(L_m, L_m, block_size)
+            m = 2*m
+        return L_m
+
+    @staticmethod
+    def min_plus_product(A, B, block_size=256):
+        """(min, +)矩阵乘积的向量化分块实现
+
+        .. math:: C_{ij} = \min_{k} \{ A_{ik} + B_{kj} \}
+
+        对A按行分块，每次只处理 `block_size` 行，对每个k使用一次广播 `A[rows, k, None] + B[None, k, :]` 更新这几行的结果，
+        这样内层运算都由NumPy完成，且每个分块的结果矩阵可以留在缓存中。
+
+        Args:
+            A: NumPy矩阵，由`to_weight_matrix`转换得到
+            B: NumPy矩阵，与A的数据类型相同
+            block_size: 分块的行数
+
+        Example:
+            >>> A = to_weight_matrix([[0, 1], [inf, 0]], np.float64)
+            >>> GeneralPairsShortestPaths.min_plus_product(A, A).tolist()
+            [[0.0, 1.0], [inf, 0.0]]
+        """
+        n, p = A.shape
+        C = np.full((n, B.shape[1]), infinity_of(A.dtype), dtype=A.dtype)
+        candidate = np.empty((min(block_size, n), B.shape[1]), dtype=A.dtype)
+        for start in range(0, n, block_size):
+            end = min(start + block_size, n)
+            C_block = C[start:end]
+            buffer = candidate[:end-start]
+            for k in range(p):
+                np.add(A[start:end, k, None], B[None, k, :], out=buffer)
+                np.minimum(C_block, buffer, out=C_block)
+        clamp_infinity(C)
+        return C
+
+
+def infinity_of(dtype):
+    """返回给定数据类型下表示无穷大(不可达)的值
+
+    浮点类型直接使用 `inf` ；整数类型使用该类型最大值的一半，这样两个"无穷大"相加也不会溢出
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return dtype.type(inf)
+    return dtype.type(np.iinfo(dtype).max // 2)
+
+
+def clamp_infinity(D):
+    """整数类型下，将"无穷大"加上负权重后得到的值重新置为无穷大
+
+    整数类型要求所有最短路径权重的绝对值都小于 `infinity_of(dtype) // 2` ，因此大于等于该阈值的值都视为不可达
+    """
+    if np.issubdtype(D.dtype, np.integer):
+        infinity = infinity_of(D.dtype)
+        np.putmask(D, D >= infinity // 2, infinity)
+
+
+def to_weight_matrix(W, dtype=np.float64):
+    """将嵌套列表形式的 :math:`W` 矩阵转换为NumPy矩阵，其中的 `inf` 会被替换为 `infinity_of(dtype)`
+    """
+    W = np.asarray(W, dtype=np.float64)
+    matrix = np.where(np.isinf(W), infinity_of(dtype), W).astype(dtype)
+    return matrix
+
 
 if __name__ == '__main__':
     import doctest
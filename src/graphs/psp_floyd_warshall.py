@@ -3,7 +3,10 @@
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
 from math import inf
-from copy import deepcopy
+
+import numpy as np
+
+from psp_basics import infinity_of, clamp_infinity, to_weight_matrix
 
 
 the_graph = [
@@ -50,7 +53,7 @@ def floyd_warshall(W):
     """
     
     n = len(W)
-    D = deepcopy(W)
+    D = [row[:] for row in W]
     for k in range(n):
         for i in range(n):
             for j in range(n):
@@ -58,6 +61,53 @@ def floyd_warshall(W):
     return D
 
 
+def vectorized_floyd_warshall(W, dtype=np.float64, with_predecessors=False):
+    """Floyd-Warshall算法的NumPy实现
+
+    对每个k，内层的两重循环等价于一次广播运算：
+
+    .. math:: D^{(k)} = \min(D^{(k-1)}, D^{(k-1)}_{:,k} + D^{(k-1)}_{k,:})
+
+    因此只需要在Python中循环n次，每次由NumPy对整个矩阵原地更新。
+
+    前驱矩阵 :math:`\Pi` 是可选的，:math:`\Pi_{ij}` 表示从i到j的最短路径上j的前驱结点，-1表示没有前驱。
+    当经过k的路径更短时，有 :math:`\Pi^{(k)}_{ij} = \Pi^{(k-1)}_{kj}`
+
+    Args:
+        W: 表示 :math:`W` 矩阵，可以是嵌套列表或者NumPy数组
+        dtype: 计算使用的数据类型，如 `np.float32` 、 `np.int32` 等，整数类型时不可达用 `infinity_of(dtype)` 表示
+        with_predecessors: 是否同时计算前驱矩阵
+
+    Returns:
+        D, 或者 (D, P)
+
+    Example:
+        >>> D, P = vectorized_floyd_warshall(the_graph, dtype=np.int32, with_predecessors=True)
+        >>> D.tolist()
+        [[0, 1, -3, 2, -4], [3, 0, -4, 1, -1], [7, 4, 0, 5, 3], [2, -1, -5, 0, -2], [8, 5, 1, 6, 0]]
+        >>> P.tolist()
+        [[-1, 2, 3, 4, 0], [3, -1, 3, 1, 0], [3, 2, -1, 1, 0], [3, 2, 3, -1, 0], [3, 2, 3, 4, -1]]
+        >>> vectorized_floyd_warshall([[0, inf], [1, 0]], dtype=np.float32).tolist()
+        [[0.0, inf], [1.0, 0.0]]
+    """
+    D = to_weight_matrix(W, dtype)
+    n = len(D)
+    infinity = infinity_of(dtype)
+    if with_predecessors:
+        P = np.where((D != infinity) & ~np.eye(n, dtype=bool), np.arange(n)[:, None], -1).astype(np.int32)
+    candidate = np.empty_like(D)
+    for k in range(n):
+        np.add(D[:, k, None], D[None, k, :], out=candidate)
+        clamp_infinity(candidate)
+        if with_predecessors:
+            shorter = candidate < D
+            np.copyto(P, np.broadcast_to(P[k], P.shape), where=shorter)
+        np.minimum(D, candidate, out=D)
+    if with_predecessors:
+        return D, P
+    return D
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
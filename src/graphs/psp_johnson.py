@@ -2,8 +2,17 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
-from copy import deepcopy
-from ssp_bellman_ford import BellmanFordSSP as BellmanFord
+import os
+import sys
+sys.path.insert(0, "../")
+
+from array import array
+from math import inf
+from multiprocessing import Pool
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+from csr_graph import CSRGraph
+from ssp_bellman_ford import QueueBellmanFord
 from ssp_dijkstra import DijkstraSSP as Dijkstra
 
 
@@ -45,28 +54,22 @@ def johnson(the_graph, v_s="s"):
          'e': [('d', 6)]}
         >>> shortest_paths_graph = johnson(the_graph)
         >>> pprint(shortest_paths_graph)
-        {'a': [('b', 1), ('c', -3), ('d', 2), ('e', -4)],
-         'b': [('a', 3), ('c', -4), ('d', 1), ('e', -1)],
-         'c': [('a', 7), ('b', 4), ('d', 5), ('e', 3)],
-         'd': [('a', 2), ('b', -1), ('c', -5), ('e', -2)],
-         'e': [('a', 8), ('b', 5), ('c', 1), ('d', 6)]}
+        {'a': [('b', 1.0), ('c', -3.0), ('d', 2.0), ('e', -4.0)],
+         'b': [('a', 3.0), ('c', -4.0), ('d', 1.0), ('e', -1.0)],
+         'c': [('a', 7.0), ('b', 4.0), ('d', 5.0), ('e', 3.0)],
+         'd': [('a', 2.0), ('b', -1.0), ('c', -5.0), ('e', -2.0)],
+         'e': [('a', 8.0), ('b', 5.0), ('c', 1.0), ('d', 6.0)]}
     """
-    the_graph_added_s = deepcopy(the_graph)
-    the_graph_added_s[v_s] = []
-    for v in the_graph.keys():
-        the_graph_added_s[v_s].append((v, 0))
-
-    bellman_ford = BellmanFord(the_graph_added_s, v_s)
+    bellman_ford = QueueBellmanFord(the_graph)    # 所有顶点初始距离为0，等价于添加一个虚拟源顶点v_s
     if bellman_ford.isexists_ssp is False:
-        raise Exception("The input graph contains a negative-weight cycle")
+        raise Exception("The input graph contains a negative-weight cycle: {}".format(bellman_ford.negative_cycle))
     else:
+        h = bellman_ford.distances()
         updated_weight_graph = {}
         for u in the_graph.keys():
             updated_weight_graph[u] = []
             for v, w_uv in the_graph[u]:
-                h_u = bellman_ford.get_shortest_weight(u)
-                h_v = bellman_ford.get_shortest_weight(v)
-                updated_w_uv = w_uv + h_u - h_v
+                updated_w_uv = w_uv + h[u] - h[v]
                 updated_weight_graph[u].append((v, updated_w_uv))
         
         shortest_paths_graph = {}
@@ -77,11 +80,155 @@ def johnson(the_graph, v_s="s"):
                 if u==v:
                     continue
                 min_w_uv = dijkstra.get_shortest_weight(v)
-                h_u = bellman_ford.get_shortest_weight(u)
-                h_v = bellman_ford.get_shortest_weight(v)
-                shortest_paths_graph[u].append((v, min_w_uv + h_v - h_u))
+                shortest_paths_graph[u].append((v, min_w_uv + h[v] - h[u]))
         return shortest_paths_graph
-                
+
+
+
+class ParallelJohnson:
+    """多进程的Johnson算法
+
+    Johnson算法中，权重调整之后对每个源结点运行的Dijkstra算法是相互独立的，因此可以分配到多个进程中并行计算：
+        1. 在主进程中用 `QueueBellmanFord` 计算h，并将调整后的图以CSR形式(indptr、indices、weights三个数组)写入共享内存
+        2. 进程池中的每个工作进程在初始化时附加到这些共享内存块上，以只读的memoryview访问，整个图在所有进程间只有一份
+        3. 源结点按chunk_size分块分配给工作进程，每个工作进程对块中的每个源结点运行Dijkstra算法，
+           并将结果按源结点逐行(`array('d')` ，按 `labels` 的顺序排列)返回
+        4. `rows` 是一个生成器，每收到一块结果就逐行产出，调用者可以边计算边写出结果，不需要在内存中保存完整的 :math:`V \\times V` 矩阵
+
+    processes为1时不创建进程池，直接在当前进程中计算。
+
+    Example:
+        >>> johnson_ = ParallelJohnson(the_graph, processes=2, chunk_size=2)
+        >>> johnson_.to_dict() == johnson(the_graph)
+        True
+        >>> for u, row in johnson_.rows(["a"]):
+        ...     print(u, list(row))
+        a [0.0, 1.0, -3.0, 2.0, -4.0]
+    """
+
+    def __init__(self, graph, processes=None, chunk_size=64):
+        """
+        Args:
+            graph: 有向图，字典形式或者 `CSRGraph`
+            processes: 工作进程数，为None时使用CPU核数
+            chunk_size: 每个任务包含的源结点数
+        """
+        bellman_ford = QueueBellmanFord(graph)
+        if bellman_ford.isexists_ssp is False:
+            raise Exception("The input graph contains a negative-weight cycle: {}".format(bellman_ford.negative_cycle))
+        graph = bellman_ford.graph
+        h = bellman_ford.distance
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        if weights is None:    # 没有边的图
+            weights = array("l")
+        reweighted = array(weights.typecode, weights)
+        for u in range(graph.vertex_count):
+            h_u = h[u]
+            for e in range(indptr[u], indptr[u + 1]):
+                reweighted[e] += h_u - h[indices[e]]
+
+        self.labels = graph.labels
+        self.index = graph.index
+        self.arrays = {
+            "indptr": indptr,
+            "indices": indices,
+            "weights": reweighted,
+            "h": array(weights.typecode, h),
+        }
+        self.processes = processes or os.cpu_count()
+        self.chunk_size = chunk_size
+
+    def rows(self, sources=None):
+        """逐行产出最短路径权重 `(u, row)` ，row[i]为u到 `labels[i]` 的最短路径权重，不可达时为inf
+
+        Args:
+            sources: 源结点序列，为None时为所有结点
+        """
+        if sources is None:
+            sources = range(len(self.labels))
+        else:
+            sources = [self.index[u] for u in sources]
+        chunks = [sources[i:i + self.chunk_size] for i in range(0, len(sources), self.chunk_size)]
+        labels = self.labels
+
+        if self.processes == 1:
+            _shared.update(self.arrays)
+            try:
+                for chunk in chunks:
+                    for s, row in _johnson_rows(chunk):
+                        yield labels[s], row
+            finally:
+                _shared.clear()
+            return
+
+        # shared_memory需要Python 3.8以上，只在真正并行计算时导入，使模块本身在更低的版本中也能导入
+        from multiprocessing.shared_memory import SharedMemory
+        blocks = {}
+        memories = []
+        try:
+            for key, values in self.arrays.items():
+                nbytes = max(len(values) * values.itemsize, 1)
+                memory = SharedMemory(create=True, size=nbytes)
+                memories.append(memory)
+                memory.buf[:len(values) * values.itemsize] = values.tobytes()
+                blocks[key] = (memory.name, values.typecode, len(values))
+            with Pool(self.processes, initializer=_attach_shared, initargs=(blocks,)) as pool:
+                for results in pool.imap(_johnson_rows, chunks):
+                    for s, row in results:
+                        yield labels[s], row
+        finally:
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+    def to_dict(self):
+        """返回与 `johnson` 相同形式的结果 `{u: [(v, w), ...]}`
+        """
+        as_int = self.arrays["weights"].typecode != "d"
+        shortest_paths_graph = {}
+        for u, row in self.rows():
+            shortest_paths_graph[u] = [
+                (v, int(w) if as_int and w != inf else w) for v, w in zip(self.labels, row) if v != u
+            ]
+        return shortest_paths_graph
+
+
+_shared = {}    # 工作进程中共享的CSR数组：indptr、indices、weights、h
+
+
+def _attach_shared(blocks):
+    """工作进程的初始化函数：附加到主进程创建的共享内存块上
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    for key, (name, typecode, length) in blocks.items():
+        memory = SharedMemory(name=name)
+        _shared[key + "_memory"] = memory    # 保持引用，避免共享内存被关闭
+        _shared[key] = memory.buf[:length * array(typecode).itemsize].cast(typecode)
+
+
+def _johnson_rows(sources):
+    """对一块源结点运行Dijkstra算法，返回 `[(s, row), ...]`
+    """
+    indptr, indices, weights, h = _shared["indptr"], _shared["indices"], _shared["weights"], _shared["h"]
+    n = len(indptr) - 1
+    results = []
+    for s in sources:
+        distance = [inf] * n
+        distance[s] = 0
+        queue = IndexedPriorityQueue()
+        queue.put(s, 0)
+        while not queue.empty():
+            d_u, u = queue.get()
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                d_v = d_u + weights[e]
+                if d_v < distance[v]:
+                    distance[v] = d_v
+                    queue.put(v, d_v)
+        h_s = h[s]
+        results.append((s, array("d", [d - h_s + h[v] for v, d in enumerate(distance)])))
+    return results
+
 
 if __name__ == '__main__':
     import doctest
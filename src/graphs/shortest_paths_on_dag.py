@@ -2,8 +2,12 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
+import math
+
+import numpy as np
+
 from ssp_basics import AbstracteSingleSourcePaths as SSP
-from topological_sort import topological_sort
+from csr_graph import CSRGraph
 
 
 the_dag = {
@@ -15,15 +19,6 @@ the_dag = {
     "z": []
 }
 
-the_dag_wthout_weights = {
-    "r": ["s", "t"],
-    "s": ["t", "x"],
-    "t": ["x", "y", "z"],
-    "x": ["y", "z"],
-    "y": ["z"],
-    "z": []
-}
-
 
 class ShortestPathsOnDAG(SSP):
     """有向无环图上的最短路径
@@ -31,25 +26,142 @@ class ShortestPathsOnDAG(SSP):
     这里由于已经要求给定图是有向无环图，所以本算法等于是对`BellmanFordSSP`的特殊情况做的修改，以提高运行效率。
     
     相比bellman-ford算法，由于已经要求给定图是有向无环图，因此无需对图中的边进行|V|-1次松弛操作，而是利用对DAG的拓扑排序序列，依次取出每一条边，然后进行1次松弛操作即可
+
+    拓扑排序使用 `CSRGraph.topological_order` (Kahn算法)，如果传入的图已经是CSRGraph，拓扑排序只会在第一次计算时进行，之后的调用都直接使用缓存的结果。
+    传入字典形式的图时，每次计算都会重新转换为CSRGraph，需要复用缓存时应先调用 `CSRGraph.from_dict` 。无权图中每条边的权重为1。
     
     Example:
         >>> dag_ssp = ShortestPathsOnDAG(the_dag, "s")
         >>> dag_ssp.show()
-        s -> t, weights:  2
-        s -> x, weights:  6
-        s -> x -> y, weights:  5
-        s -> x -> y -> z, weights:  3
+        s -> t, weights:  2.0
+        s -> x, weights:  6.0
+        s -> x -> y, weights:  5.0
+        s -> x -> y -> z, weights:  3.0
+        >>> ShortestPathsOnDAG({"a": ["b", "c"], "b": ["c"], "c": []}, "a").show()
+        a -> b, weights:  1.0
+        a -> c, weights:  1.0
     """
     
     def compute(self):
         """计算SSP
         """
-        # 使用已经生成的无权重的图进行拓扑排序，因为之前的dfs实现暂不支持带权重的图结构
-        # 注意：这里为了简便，帮助理解，直接使用了全局变量the_dag_wthout_weight
-        topo_sequence = topological_sort(the_dag_wthout_weights)
-        for u in topo_sequence:
-            for v, w_uv in self.graph[u]:
-                self.relax(u, v, w_uv)
+        graph = self.graph if isinstance(self.graph, CSRGraph) else CSRGraph.from_dict(self.graph)
+        labels, indptr, indices, weights = graph.labels, graph.indptr, graph.indices, graph.weights
+        for u in graph.topological_order():
+            for e in range(indptr[u], indptr[u + 1]):
+                self.relax(labels[u], labels[indices[e]], 1 if weights is None else weights[e])
+
+
+def dag_paths(graph, sources, longest=False):
+    """同时计算多个源顶点在有向无环图上的最短路径(或最长路径)
+
+    按拓扑排序依次处理每个顶点v，此时v的所有前驱顶点都已经处理完毕，因此v到各个源顶点的距离可以由它的入边一次性得到：
+
+    .. math::
+
+        d_i(v) = \\min_{(u,v) \\in E} d_i(u) + w(u,v)
+
+    距离保存在形状为 `(n, k)` 的矩阵中(k为源顶点的个数)，每处理一个顶点只需要对它的入边做一次向量化的运算，
+    k个源顶点的松弛是同时进行的，整个计算只需要按拓扑排序对反向图的边数组扫描一遍，运行时间为 :math:`O(k(V+E))` 。
+    入边数组由 `CSRGraph.in_edge_arrays` 提供，与拓扑排序一样只在第一次调用时构建。
+
+    计算最长路径时，将min换成max即可(有向无环图中不存在环路，因此不存在正值环路的问题)。
+
+    Args:
+        graph: 有向无环图，字典形式或者 `CSRGraph` ，字典形式的图每次调用都会重新转换，
+            多次调用时应传入CSRGraph，以复用缓存的拓扑排序和入边数组。无权图中每条边的权重为1
+        sources: 源顶点序列
+        longest: 为True时计算最长路径
+
+    Returns:
+        (distances, predecessors): 形状均为 `(k, n)` ， `distances[i][j]` 为 `sources[i]` 到编号为j的顶点的距离，
+        不可达时为inf(最长路径时为-inf)， `predecessors[i][j]` 为前驱顶点的编号，没有前驱时为-1
+
+    Example:
+        >>> graph = CSRGraph.from_dict(the_dag)
+        >>> graph.labels
+        ['r', 's', 't', 'x', 'y', 'z']
+        >>> distances, predecessors = dag_paths(graph, ["s", "r"])
+        >>> distances.tolist()
+        [[inf, 0.0, 2.0, 6.0, 5.0, 3.0], [0.0, 5.0, 3.0, 10.0, 7.0, 5.0]]
+        >>> distances, predecessors = dag_paths(graph, ["s", "r"], longest=True)
+        >>> distances.tolist()
+        [[-inf, 0.0, 2.0, 9.0, 8.0, 10.0], [0.0, 5.0, 7.0, 14.0, 13.0, 15.0]]
+        >>> [graph.labels[p] for p in predecessors[0][2:]]
+        ['s', 't', 'x', 'x']
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    order = graph.topological_order()
+    indptr, indices, weights = graph.in_edge_arrays()
+    unreachable = -math.inf if longest else math.inf
+
+    n, k = graph.vertex_count, len(sources)
+    columns = np.arange(k)
+    distances = np.full((n, k), unreachable)
+    predecessors = np.full((n, k), -1, dtype=np.int64)
+    rows_of = {}    # 顶点编号 -> 以该顶点为源顶点的行
+    for i, s in enumerate(sources):
+        rows_of.setdefault(graph.index[s], []).append(i)
+
+    for v in order:
+        start, end = indptr[v], indptr[v + 1]
+        if start < end:
+            preds = indices[start:end]
+            candidates = distances[preds] + weights[start:end, None]    # (入度, k)
+            best = candidates.argmax(axis=0) if longest else candidates.argmin(axis=0)
+            distances[v] = candidates[best, columns]
+            predecessors[v] = np.where(distances[v] != unreachable, preds[best], -1)
+        if v in rows_of:
+            rows = rows_of[v]
+            distances[v, rows] = 0
+            predecessors[v, rows] = -1
+    return distances.T, predecessors.T
+
+
+def critical_path(graph):
+    """有向无环图中的关键路径(权重最大的路径)
+
+    在任务调度中，顶点表示事件，边的权重表示任务的耗时，关键路径的长度就是完成所有任务所需的最短时间。
+    与 `dag_paths` 不同，这里路径可以从任意顶点开始，因此每个顶点的初始距离都为0，只需按拓扑排序对边数组扫描一遍。
+    无权图中每条边的权重为1，此时关键路径就是边数最多的路径。
+
+    Args:
+        graph: 有向无环图，字典形式或者 `CSRGraph` ，字典形式的图每次调用都会重新转换，多次调用时应传入CSRGraph
+
+    Returns:
+        (length, path)
+
+    Example:
+        >>> critical_path(the_dag)
+        (15, ['r', 's', 't', 'x', 'z'])
+        >>> critical_path({"a": ["b", "c"], "b": ["c"], "c": []})
+        (2, ['a', 'b', 'c'])
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    n = graph.vertex_count
+    if n == 0:
+        return 0, []
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    distances = [0] * n
+    predecessors = [-1] * n
+    for u in graph.topological_order():
+        d_u = distances[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            d_v = d_u + (1 if weights is None else weights[e])
+            if d_v > distances[v]:
+                distances[v] = d_v
+                predecessors[v] = u
+    v = max(range(n), key=distances.__getitem__)
+    length = distances[v]
+    path = []
+    while v != -1:
+        path.append(graph.labels[v])
+        v = predecessors[v]
+    path.reverse()
+    return length, path
 
 
 if __name__ == '__main__':
@@ -3,6 +3,95 @@
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
 import math
+from array import array
+
+
+class SSPResult:
+    """单源最短路径的计算结果
+
+    顶点按标签编号后，距离和前驱分别保存在 `array('d')` 和 `array('l')` 中(前驱为-1表示没有前驱)，
+    每个顶点只占用16字节，而不是每个顶点一个 `{"distance": ..., "prev": ...}` 字典。
+
+    Example:
+        >>> result = SSPResult(["s", "a", "b", "c"], "s")
+        >>> result.set("a", 2, "s")
+        >>> result.set("b", 5, "a")
+        >>> result.path("b"), result.distance("b"), result.predecessor("b")
+        (['s', 'a', 'b'], 5.0, 'a')
+        >>> result.path("c"), result.distance("c")
+        ([], inf)
+        >>> distances, predecessors = result.to_numpy()
+        >>> distances.tolist(), predecessors.tolist()
+        ([0.0, 2.0, 5.0, inf], [-1, 0, 1, -1])
+    """
+
+    def __init__(self, labels, source):
+        """
+        Args:
+            labels: 顶点标签序列，顶点的编号即其在序列中的位置
+            source: 源顶点
+        """
+        self.labels = list(labels)
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        self.source = source
+        n = len(self.labels)
+        self.distances = array("d", [math.inf]) * n
+        self.predecessors = array("l", [-1]) * n
+        self.distances[self.index[source]] = 0
+
+    def add_vertex(self, v):
+        """添加一个距离为无穷大、没有前驱的顶点
+        """
+        self.index[v] = len(self.labels)
+        self.labels.append(v)
+        self.distances.append(math.inf)
+        self.predecessors.append(-1)
+
+    def set(self, v, distance, prev):
+        """设置顶点v的距离和前驱
+        """
+        i = self.index[v]
+        self.distances[i] = distance
+        self.predecessors[i] = -1 if prev is None else self.index[prev]
+
+    def distance(self, v):
+        return self.distances[self.index[v]]
+
+    def predecessor(self, v):
+        """返回v的前驱，没有前驱时返回None
+        """
+        p = self.predecessors[self.index[v]]
+        return None if p < 0 else self.labels[p]
+
+    def path(self, t):
+        """返回从源顶点到t的最短路径，t不可达时返回空列表
+
+        沿前驱数组迭代回溯，路径长度不受递归深度的限制
+        """
+        i = self.index[t]
+        if self.distances[i] == math.inf:
+            return []
+        labels, predecessors = self.labels, self.predecessors
+        path = []
+        while i >= 0:
+            path.append(labels[i])
+            i = predecessors[i]
+        path.reverse()
+        return path
+
+    def to_numpy(self):
+        """以NumPy数组的形式返回 `(distances, predecessors)`
+
+        使用 `np.frombuffer` 直接共享底层array的内存，不发生数据拷贝
+        """
+        import numpy as np
+        return (
+            np.frombuffer(self.distances, dtype=self.distances.typecode),
+            np.frombuffer(self.predecessors, dtype=self.predecessors.typecode),
+        )
+
+    def __len__(self):
+        return len(self.labels)
 
 
 class AbstracteSingleSourcePaths:
@@ -11,54 +100,63 @@ class AbstracteSingleSourcePaths:
     注意：不能直接初始化进行使用，需要继承后，重写compute方法进行使用
     """
     
-    def __init__(self, graph, source):
+    queue_class = None    # 需要使用优先队列的子类在这里指定默认的优先队列实现
+
+    def __init__(self, graph, source, queue_class=None):
         """
         Args:
             graph: 有向图
             source: 源顶点
+            queue_class: 优先队列的实现，为None时使用子类默认的实现。
+                需要提供与`IndexedPriorityQueue`相同的接口：`put(item, priority)`(元素已存在时更新权重值)、`get()`、`empty()`
         """
         self.graph = graph
         self.source = source
-        self.vertex_info = {}    # 记录每个顶点在计算ssp过程中的信息
+        if queue_class is not None:
+            self.queue_class = queue_class
+        self.result = None    # 计算结果 `SSPResult`
         self.initialize_single_source()
         self.isexists_ssp = False
         self.compute()
     
     def initialize_single_source(self):
         """初始化单源路径图顶点信息
+
+        所有顶点的距离为无穷大、没有前驱，源顶点的距离为0
         """
-        for vertex in self.graph.keys():
-            self.vertex_info[vertex] = {
-                "distance": math.inf,    # 记录source顶点到当前顶点的距离，默认是无穷大
-                "prev": None    # 记录当前顶点在ssp中的前驱顶点
-            }
-        self.vertex_info[self.source]["distance"] = 0    # 将源顶点的距离归为0
+        self.result = SSPResult(self.graph.keys(), self.source)
     
     def relax(self, u, v, w_uv):
         """对边`u->v`进行松弛处理
         
         如果（源顶点s到后向顶点v的距离）大于（源顶点s到其前驱顶点u的距离+边`u->v`的权重），则需要对源顶点s到后向顶点v的距离进行一次更新
+
+        Returns:
+            bool: 是否对v的距离进行了更新
         """
-        if self.vertex_info[v]["distance"] > self.vertex_info[u]["distance"] + w_uv:
-            self.vertex_info[v]["distance"] = self.vertex_info[u]["distance"] + w_uv
-            self.vertex_info[v]["prev"] = u
+        result = self.result
+        i, j = result.index[u], result.index[v]
+        distance = result.distances[i] + w_uv
+        if result.distances[j] > distance:
+            result.distances[j] = distance
+            result.predecessors[j] = i
+            return True
+        return False
     
     def generate_ssp(self, t):
-        """根据已经构建的SSP信息(`vertex_info`)，生成每一条路径
+        """根据已经构建的SSP信息(`result`)，生成源顶点之后的每一个顶点
         """
-        if self.vertex_info[t]["prev"] != None:
-            if self.vertex_info[t]["prev"] != self.source:
-                yield from self.generate_ssp(self.vertex_info[t]["prev"])
-            yield t
+        if self.result.predecessor(t) is not None:
+            yield from self.result.path(t)[1:]
     
     def get_shortest_weight(self, v):
-        return self.vertex_info[v]["distance"]
+        return self.result.distance(v)
     
     def show(self):
         """打印每一条SSP
         """
         for v in self.graph.keys():
-            if self.vertex_info[v]["prev"] != None:
+            if self.result.predecessor(v) is not None:
                 print(self.source+" ->", " -> ".join(self.generate_ssp(v)), end=", ")
                 print("weights: ", self.get_shortest_weight(v))
 
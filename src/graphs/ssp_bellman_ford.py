@@ -3,8 +3,11 @@
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
 import math
+from array import array
+from collections import deque
 
 from ssp_basics import AbstracteSingleSourcePaths as SSP
+from csr_graph import CSRGraph
 
 
 the_graph = {
@@ -35,10 +38,10 @@ class BellmanFordSSP(SSP):
         >>> bellman_ford_ssp.isexists_ssp
         True
         >>> bellman_ford_ssp.show()
-        s -> y -> x -> t, weights:  2
-        s -> y -> x, weights:  4
-        s -> y, weights:  7
-        s -> y -> x -> t -> z, weights:  -2
+        s -> y -> x -> t, weights:  2.0
+        s -> y -> x, weights:  4.0
+        s -> y, weights:  7.0
+        s -> y -> x -> t -> z, weights:  -2.0
     """
     
     def compute(self):
@@ -56,12 +59,149 @@ class BellmanFordSSP(SSP):
         # 判断是否存在SSP(当给定的图是一个具有负值环路的图时，是不存在SSP的)
         for u in self.graph.keys():
             for v, w_uv in self.graph[u]:
-                if self.vertex_info[v]["distance"] > self.vertex_info[u]["distance"] + w_uv:
+                if self.get_shortest_weight(v) > self.get_shortest_weight(u) + w_uv:
                     self.isexists_ssp = False
                     return
         self.isexists_ssp = True
 
 
+the_negative_cycle_graph = {
+    "s": [("a", 1)],
+    "a": [("b", 2)],
+    "b": [("c", -4), ("t", 1)],
+    "c": [("a", 1)],
+    "t": []
+}
+
+
+class QueueBellmanFord:
+    """基于队列的BellmanFord算法(SPFA)
+
+    `BellmanFordSSP` 每一轮都会对所有边进行松弛，而只有距离在上一轮发生了变化的顶点，其出边的松弛才可能产生新的更新。
+    因此这里用一个先进先出队列保存距离发生了变化的顶点，每次只对队首顶点的出边进行松弛，被更新的顶点如果不在队列中则加入队尾：
+        - 队列为空时说明已经没有可以松弛的边，算法立即结束，在实际的稀疏图上通常远少于 :math:`\\vert V \\vert - 1` 轮
+        - 最坏情况下运行时间与BellmanFord算法相同，为 :math:`O(VE)`
+
+    负值环路的检测：用length记录每个顶点当前最短路径所包含的边数，不存在负值环路时，最短路径都是简单路径，边数不超过 :math:`\\vert V \\vert - 1` ，
+    因此一旦某个顶点的边数达到 :math:`\\vert V \\vert` ，就沿前驱数组回溯寻找环路，前驱数组中出现的环路一定是负值环路。
+    找到的环路保存在negative_cycle中，为顶点列表 `[v0, v1, ..., vk]` ，表示环路 `v0 -> v1 -> ... -> vk -> v0` 。
+
+    图会被转换为 `CSRGraph` ，距离、前驱、边数都使用以顶点编号为下标的列表存储，避免了每次松弛时的标签到编号的字典查找。
+
+    source为None时，所有顶点的初始距离都为0，相当于添加一个到所有顶点权重为0的虚拟源顶点，可以直接用于Johnson算法中的权重调整。
+    无权图中每条边的权重为1。
+
+    Example:
+        >>> bellman_ford = QueueBellmanFord(the_graph, "s")
+        >>> bellman_ford.isexists_ssp
+        True
+        >>> bellman_ford.get_shortest_weight("z"), bellman_ford.path("z")
+        (-2, ['s', 'y', 'x', 't', 'z'])
+        >>> QueueBellmanFord(the_graph).distances()
+        {'s': -7, 't': -5, 'x': -3, 'y': 0, 'z': -9}
+        >>> bellman_ford = QueueBellmanFord(the_negative_cycle_graph, "s")
+        >>> bellman_ford.isexists_ssp
+        False
+        >>> bellman_ford.negative_cycle
+        ['c', 'a', 'b']
+        >>> QueueBellmanFord(CSRGraph.from_edges([(0, 1), (1, 2)]), 0).distances()
+        {0: 0, 1: 1, 2: 2}
+    """
+
+    def __init__(self, graph, source=None):
+        """
+        Args:
+            graph: 有向图，字典形式或者 `CSRGraph`
+            source: 源顶点，为None时所有顶点的初始距离都为0
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        self.graph = graph
+        self.source = source
+        n = graph.vertex_count
+        self.distance = [math.inf] * n    # 顶点编号 -> 距离
+        self.parent = [-1] * n    # 顶点编号 -> 前驱顶点编号
+        self.negative_cycle = None
+        self.isexists_ssp = False
+        self.compute()
+
+    def compute(self):
+        graph = self.graph
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        if weights is None:    # 无权图，每条边的权重为1
+            weights = array("l", [1]) * len(indices)
+        n = graph.vertex_count
+        distance, parent = self.distance, self.parent
+        length = [0] * n
+        in_queue = bytearray(n)
+        if self.source is None:
+            sources = range(n)
+        else:
+            sources = [graph.index[self.source]]
+        for s in sources:
+            distance[s] = 0
+            in_queue[s] = 1
+        queue = deque(sources)
+
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = 0
+            d_u = distance[u]
+            l_v = length[u] + 1
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                d_v = d_u + weights[e]
+                if d_v < distance[v]:
+                    distance[v] = d_v
+                    parent[v] = u
+                    length[v] = l_v
+                    if l_v >= n:
+                        cycle = self.find_cycle(v)
+                        if cycle is not None:
+                            self.negative_cycle = [graph.labels[x] for x in cycle]
+                            return
+                    if not in_queue[v]:
+                        in_queue[v] = 1
+                        queue.append(v)
+        self.isexists_ssp = True
+
+    def find_cycle(self, v):
+        """从v开始沿前驱数组回溯，如果遇到环路，返回环路上的顶点编号(按边的方向排列)，否则返回None
+        """
+        parent = self.parent
+        order = {}
+        while v != -1 and v not in order:
+            order[v] = len(order)
+            v = parent[v]
+        if v == -1:
+            return None
+        cycle = [x for x, i in order.items() if i >= order[v]]
+        cycle.reverse()
+        return cycle
+
+    def get_shortest_weight(self, v):
+        return self.distance[self.graph.index[v]]
+
+    def distances(self):
+        """返回 `{顶点: 距离}`
+        """
+        return dict(zip(self.graph.labels, self.distance))
+
+    def path(self, t):
+        """返回从源顶点到t的最短路径，t不可达时返回空列表
+        """
+        labels, parent = self.graph.labels, self.parent
+        v = self.graph.index[t]
+        if self.distance[v] == math.inf:
+            return []
+        path = []
+        while v != -1:
+            path.append(labels[v])
+            v = parent[v]
+        path.reverse()
+        return path
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -8,7 +8,7 @@ sys.path.insert(0, "../")
 
 import math
 
-from data_structures.queues.dynamic_priority_queue import DynamicPriorityQueue
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
 from ssp_basics import AbstracteSingleSourcePaths as SSP
 
 
@@ -36,11 +36,16 @@ class DijkstraSSP(SSP):
          'z': [('s', 7), ('x', 6)]}
         >>> dijkstra_ssp = DijkstraSSP(the_graph, "s")
         >>> dijkstra_ssp.show()
-        s -> y -> t, weights:  8
-        s -> y -> t -> x, weights:  9
-        s -> y, weights:  5
-        s -> y -> z, weights:  7
+        s -> y -> t, weights:  8.0
+        s -> y -> t -> x, weights:  9.0
+        s -> y, weights:  5.0
+        s -> y -> z, weights:  7.0
+        >>> from high_level_data_structures.fibonacci_heap import FibonacciPriorityQueue
+        >>> DijkstraSSP(the_graph, "s", queue_class=FibonacciPriorityQueue).get_shortest_weight("x")
+        9.0
     """
+
+    queue_class = IndexedPriorityQueue
     
     def compute(self):
         """Dijkstra算法核心逻辑
@@ -50,29 +55,31 @@ class DijkstraSSP(SSP):
         Dijkstra算法总是选择集合V-S中最近的节点来加入到集合S中(贪心策略)，主循环次数是图的顶点集合数，第一次迭代中进行计算的顶点u是源节点
         
         由于每轮迭代，V-S中的节点的距离值都可能发生变化，是在动态发生变化。
-        而Python中无法直接给优先级队列传递指针，因此这里单独封装了一个DynamicPriorityQueue，可以用于在每次获取下一个数据时，实时的计算当前队列中最小的值并返回。
-        只要调用queue.get方法时传入rebuild=True参数，但是这样会增加程序的运行时间。
-        
-        而整个Dijkstra算法的运行时间其实也主要是在于这个优先级队列的实现上，理论上使用最小二叉堆实现的优先级队列，运行时间为 :math:`O((V+E)\lg V)` 当边数远远大于结点数时 :math:`O(E\lg V)`.
-        
-        不过本实现中，使用的最小二叉堆的实现还不是最优的情况，属于待优化的情况。
-        
+        因此这里使用了索引优先队列`IndexedPriorityQueue`：它记录了每个顶点在堆中的位置，当某个顶点的距离被松弛变小时，
+        直接对该顶点执行一次decrease-key操作(:math:`O(\lg V)`)，而不需要在每次取出顶点时重建整个堆。
+        并且只有被发现(距离不再是无穷大)的顶点才会被加入到队列中。
+
+        而整个Dijkstra算法的运行时间其实也主要是在于这个优先级队列的实现上，使用最小二叉堆实现的优先级队列，运行时间为 :math:`O((V+E)\lg V)` 当边数远远大于结点数时 :math:`O(E\lg V)`.
+
         另外如果使用斐波那契堆( :math:`O(V\lg V + E)` )或者使用van emde boas tree ( :math:`O((V+E)\lg \lg V)` ) 实现的优先队列，可以达到更好的性能。
-        
+        优先队列的实现可以通过构造参数`queue_class`替换，可选的有：
+            - `IndexedPriorityQueue` : 索引二叉堆(默认)
+            - `FibonacciPriorityQueue` : 斐波那契堆，decrease-key的摊还时间为 :math:`O(1)`
+            - `PairingPriorityQueue` : 配对堆
+            - `RadixHeap` : 基数堆，只适用于非负整数权重
+        各实现在不同权重分布下的实际运行时间可以使用`ssp_dijkstra_benchmark`进行比较。
+
         由此可见 Dijkstra算法的性能其实主要在于使用的最小优先队列的实现上。
         """
-        queue = DynamicPriorityQueue(without_data=False)
-        for u in self.graph.keys():
-            queue.put(
-                (
-                    lambda info, v: info[v]["distance"], 
-                    (self.vertex_info, u)
-                )
-            )
+        queue = self.queue_class()
+        queue.put(self.source, 0)
         while not queue.empty():
-            _, (_, u) = queue.get(rebuild=True)
+            _, u = queue.get()
             for v, w_uv in self.graph[u]:
-                self.relax(u, v, w_uv)
+                if self.relax(u, v, w_uv):
+                    # 距离变小：已在队列中则decrease-key，否则插入队列
+                    queue.put(v, self.get_shortest_weight(v))
+
 
 if __name__ == '__main__':
     import doctest
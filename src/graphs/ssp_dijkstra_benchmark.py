@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../")
+
+import random
+import time
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+from high_level_data_structures.fibonacci_heap import FibonacciPriorityQueue
+from high_level_data_structures.pairing_heap import PairingPriorityQueue
+from high_level_data_structures.radix_heap import RadixHeap
+from csr_graph import CSRGraph
+from ssp_dijkstra import DijkstraSSP
+
+
+QUEUE_CLASSES = {
+    "binary": IndexedPriorityQueue,
+    "fibonacci": FibonacciPriorityQueue,
+    "pairing": PairingPriorityQueue,
+    "radix": RadixHeap,
+}
+
+WEIGHT_DISTRIBUTIONS = {
+    "uniform-small": lambda rng: rng.randint(1, 10),
+    "uniform-large": lambda rng: rng.randint(1, 10**6),
+    "exponential": lambda rng: int(rng.expovariate(1 / 1000)),
+}
+
+
+def random_graph(vertex_count, edge_count, weight, seed=0):
+    """生成随机有向图，边的权重由weight函数生成
+
+    为了保证所有顶点都从0号顶点可达，先生成一条经过所有顶点的环，其余的边随机生成
+    """
+    rng = random.Random(seed)
+    edges = [(i, (i + 1) % vertex_count, weight(rng)) for i in range(vertex_count)]
+    for _ in range(edge_count - vertex_count):
+        edges.append((rng.randrange(vertex_count), rng.randrange(vertex_count), weight(rng)))
+    return CSRGraph.from_edges(edges, labels=range(vertex_count))
+
+
+def benchmark(vertex_count=10000, edge_count=50000, repeat=3, queue_classes=None, distributions=None):
+    """比较各优先队列实现下Dijkstra算法的运行时间
+
+    每种权重分布生成一个随机图，对每种优先队列运行repeat次，取最短时间，并检查所有实现得到的最短距离相同
+
+    Returns:
+        list: `[(权重分布, 优先队列, 秒数), ...]`
+    """
+    queue_classes = queue_classes or QUEUE_CLASSES
+    distributions = distributions or WEIGHT_DISTRIBUTIONS
+    results = []
+    for distribution, weight in distributions.items():
+        graph = random_graph(vertex_count, edge_count, weight)
+        expected = None
+        for name, queue_class in queue_classes.items():
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                dijkstra = DijkstraSSP(graph, 0, queue_class=queue_class)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            distances = [dijkstra.get_shortest_weight(v) for v in graph.keys()]
+            if expected is None:
+                expected = distances
+            elif distances != expected:
+                raise AssertionError("{} returns different distances".format(name))
+            results.append((distribution, name, best))
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Dijkstra priority queue benchmark")
+    parser.add_argument("--vertices", type=int, default=10000)
+    parser.add_argument("--edges", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("{:<16}{:<12}{:>10}".format("weights", "queue", "seconds"))
+    for distribution, name, seconds in benchmark(args.vertices, args.edges, args.repeat):
+        print("{:<16}{:<12}{:>10.4f}".format(distribution, name, seconds))
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import math
+
+from ssp_dijkstra import DijkstraSSP
+
+
+the_graph = {
+    "s": [("t", 10), ("y", 5)],
+    "t": [("x", 1), ("y", 2)],
+    "x": [("z", 4)],
+    "y": [("t", 3), ("x", 9), ("z", 2)],
+    "z": [("s", 7), ("x", 6)]
+}
+
+
+class DynamicDijkstraSSP(DijkstraSSP):
+    """边权重动态变化时的单源最短路径
+
+    构造时与 `DijkstraSSP` 相同，先计算一次完整的最短路径树；之后每次通过 `update_edge` 修改一条边的权重时，
+    只修复受影响的部分(Ramalingam–Reps算法的思路)，而不是重新运行一次Dijkstra算法：
+        - 权重减小(或新增边) `u->v` ：如果 :math:`d(u) + w < d(v)` ，更新v的距离，并从v开始运行Dijkstra算法，
+          只有距离变小的顶点才会进入优先队列
+        - 权重增大(或删除边) `u->v` ：如果这条边不在最短路径树上，那么所有的距离都不会改变；
+          否则以v为根的子树中的顶点(受影响的顶点)的距离都可能变大：
+            1. 沿最短路径树找出受影响的顶点集合A
+            2. 对A中的每个顶点x，在所有不在A中的前驱顶点p中选择 :math:`d(p) + w(p,x)` 最小的作为x的新的距离的上界
+            3. 以这些上界为初始权重值，只在A中运行Dijkstra算法
+
+    每次更新的运行时间只与受影响的顶点及其关联的边的数量有关。为了在权重增大时找到所有的前驱顶点，
+    这里使用字典保存了图的出边和入边 `{u: {v: w}}` ，平行边只保留权重最小的一条。要求所有边的权重非负。
+
+    Example:
+        >>> ssp = DynamicDijkstraSSP(the_graph, "s")
+        >>> ssp.result.path("x"), ssp.get_shortest_weight("x")
+        (['s', 'y', 't', 'x'], 9.0)
+        >>> sorted(ssp.update_edge("y", "t", 1))
+        ['t', 'x']
+        >>> ssp.result.path("x"), ssp.get_shortest_weight("x")
+        (['s', 'y', 't', 'x'], 7.0)
+        >>> sorted(ssp.update_edge("s", "y", 20))
+        ['t', 'x', 'y', 'z']
+        >>> ssp.show()
+        s -> t, weights:  10.0
+        s -> t -> x, weights:  11.0
+        s -> t -> y, weights:  12.0
+        s -> t -> y -> z, weights:  14.0
+        >>> sorted(ssp.remove_edge("s", "t"))
+        ['t', 'x', 'y', 'z']
+        >>> ssp.get_shortest_weight("t"), ssp.result.path("t")
+        (21.0, ['s', 'y', 't'])
+
+        update_edge可以引入新的顶点
+
+        >>> ssp = DynamicDijkstraSSP({"a": [("b", 1)], "b": []}, "a")
+        >>> sorted(ssp.update_edge("b", "c", 2))
+        ['c']
+        >>> ssp.show()
+        a -> b, weights:  1.0
+        a -> b -> c, weights:  3.0
+    """
+
+    def __init__(self, graph, source, queue_class=None):
+        self.out_edges = {}    # u -> {v: w(u,v)}
+        self.in_edges = {}    # v -> {u: w(u,v)}
+        for u in graph.keys():
+            self.out_edges.setdefault(u, {})
+            self.in_edges.setdefault(u, {})
+            for v, w_uv in graph[u]:
+                self.out_edges.setdefault(v, {})
+                self.in_edges.setdefault(v, {})
+                if w_uv < self.out_edges[u].get(v, math.inf):
+                    self.out_edges[u][v] = w_uv
+                    self.in_edges[v][u] = w_uv
+        super().__init__(graph, source, queue_class)
+
+    def initialize_single_source(self):
+        super().initialize_single_source()
+        for v in self.out_edges.keys():
+            if v not in self.result.index:
+                self.result.add_vertex(v)
+
+    def show(self):
+        """打印每一条SSP
+
+        `update_edge` 新增的顶点不在原来的图中，因此按 `result.labels` 遍历所有顶点
+        """
+        for v in self.result.labels:
+            if self.result.predecessor(v) is not None:
+                print(self.source+" ->", " -> ".join(self.generate_ssp(v)), end=", ")
+                print("weights: ", self.get_shortest_weight(v))
+
+    def update_edge(self, u, v, w):
+        """将边 `u->v` 的权重修改为w，边不存在时添加这条边
+
+        Returns:
+            set: 距离发生了变化的顶点
+        """
+        if w < 0:
+            raise ValueError("Edge weight must be non-negative: {}".format(w))
+        for x in (u, v):
+            if x not in self.out_edges:
+                self.out_edges[x] = {}
+                self.in_edges[x] = {}
+                self.result.add_vertex(x)
+        old_w = self.out_edges[u].get(v, math.inf)
+        self.out_edges[u][v] = w
+        self.in_edges[v][u] = w
+        if w < old_w:
+            return self.decrease(u, v, w)
+        if w > old_w:
+            return self.increase(u, v)
+        return set()
+
+    def remove_edge(self, u, v):
+        """删除边 `u->v`
+
+        Returns:
+            set: 距离发生了变化的顶点
+        """
+        del self.out_edges[u][v]
+        del self.in_edges[v][u]
+        return self.increase(u, v)
+
+    def decrease(self, u, v, w):
+        """边 `u->v` 的权重减小为w后，从v开始向外传播更小的距离
+        """
+        result = self.result
+        index, distances, predecessors = result.index, result.distances, result.predecessors
+        d_v = distances[index[u]] + w
+        if d_v >= distances[index[v]]:
+            return set()
+        distances[index[v]] = d_v
+        predecessors[index[v]] = index[u]
+        changed = {v}
+        queue = self.queue_class()
+        queue.put(v, d_v)
+        while not queue.empty():
+            d_x, x = queue.get()
+            for y, w_xy in self.out_edges[x].items():
+                d_y = d_x + w_xy
+                j = index[y]
+                if d_y < distances[j]:
+                    distances[j] = d_y
+                    predecessors[j] = index[x]
+                    changed.add(y)
+                    queue.put(y, d_y)
+        return changed
+
+    def increase(self, u, v):
+        """边 `u->v` 的权重增大(或被删除)后，重新计算以v为根的子树中顶点的距离
+        """
+        result = self.result
+        index, labels = result.index, result.labels
+        distances, predecessors = result.distances, result.predecessors
+        if predecessors[index[v]] != index[u]:
+            return set()    # u->v不在最短路径树上
+
+        # 1. 沿最短路径树找出以v为根的子树
+        affected = {v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            i = index[x]
+            for y in self.out_edges[x].keys():
+                if y not in affected and predecessors[index[y]] == i:
+                    affected.add(y)
+                    stack.append(y)
+        old_distances = {x: distances[index[x]] for x in affected}
+
+        # 2. 由不受影响的前驱顶点得到每个受影响顶点的距离上界
+        queue = self.queue_class()
+        for x in affected:
+            best, best_p = math.inf, -1
+            for p, w_px in self.in_edges[x].items():
+                if p not in affected and distances[index[p]] + w_px < best:
+                    best, best_p = distances[index[p]] + w_px, index[p]
+            j = index[x]
+            distances[j] = best
+            predecessors[j] = best_p
+            if best < math.inf:
+                queue.put(x, best)
+
+        # 3. 只在受影响的顶点中运行Dijkstra算法
+        while not queue.empty():
+            d_x, x = queue.get()
+            for y, w_xy in self.out_edges[x].items():
+                if y not in affected:
+                    continue
+                d_y = d_x + w_xy
+                j = index[y]
+                if d_y < distances[j]:
+                    distances[j] = d_y
+                    predecessors[j] = index[x]
+                    queue.put(y, d_y)
+        return {x for x in affected if distances[index[x]] != old_distances[x]}
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
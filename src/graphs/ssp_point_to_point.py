@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../")
+
+from math import inf
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+from breadth_first_search import build_path
+
+
+the_graph = {
+    "s": [("t", 10), ("y", 5)],
+    "t": [("x", 1), ("y", 2)],
+    "x": [("z", 4)],
+    "y": [("t", 3), ("x", 9), ("z", 2)],
+    "z": [("s", 7), ("x", 6)]
+}
+
+the_grid = {
+    (x, y): [
+        ((x + dx, y + dy), 1) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        if 0 <= x + dx < 4 and 0 <= y + dy < 4
+    ]
+    for x in range(4) for y in range(4)
+}
+
+
+def shortest_path(graph, s, t, heuristic=None, bidirectional=False, reverse=None, queue_class=IndexedPriorityQueue):
+    """点对点最短路径查询
+
+    `DijkstraSSP` 等单源最短路径算法会在构造时计算出源顶点到所有顶点的最短路径树，但很多时候只需要一对顶点之间的最短路径。
+    这里提供三种只计算s到t的最短路径的方式：
+        - 默认：Dijkstra算法，当t从优先队列中被取出(即t的最短距离已经确定)时立即结束
+        - A*：指定heuristic时，优先队列中顶点v的权重值为 :math:`d(s,v) + h(v)` ，其中h(v)是对v到t的距离的估计，
+          搜索会优先朝着t的方向进行。要求h不超过v到t的真实距离(可采纳)，否则结果不一定是最短路径
+        - 双向Dijkstra：bidirectional为True时，分别从s出发在原图上、从t出发在反向图上同时进行搜索，见`bidirectional_dijkstra`
+
+    要求所有边的权重非负。
+
+    Args:
+        graph: 有向图
+        s: 起点
+        t: 终点
+        heuristic: 启发函数 `h(v)` ，为None时为普通的Dijkstra算法
+        bidirectional: 是否使用双向Dijkstra
+        reverse: 双向搜索时使用的反向图，为None时由`reverse_graph`生成，多次查询同一个图时应预先生成并传入
+        queue_class: 优先队列的实现，双向搜索时两侧各使用一个
+
+    Returns:
+        (distance, path): t不可达时返回 `(inf, [])`
+
+    Example:
+        >>> shortest_path(the_graph, "s", "x")
+        (9, ['s', 'y', 't', 'x'])
+        >>> shortest_path(the_graph, "s", "x", bidirectional=True)
+        (9, ['s', 'y', 't', 'x'])
+        >>> from high_level_data_structures.pairing_heap import PairingPriorityQueue
+        >>> shortest_path(the_graph, "s", "x", bidirectional=True, queue_class=PairingPriorityQueue)
+        (9, ['s', 'y', 't', 'x'])
+        >>> manhattan = lambda v: abs(v[0] - 3) + abs(v[1] - 3)
+        >>> distance, path = shortest_path(the_grid, (0, 0), (3, 3), heuristic=manhattan)
+        >>> distance, len(path)
+        (6, 7)
+        >>> shortest_path({"a": [("b", 1)], "b": []}, "b", "a")
+        (inf, [])
+    """
+    if bidirectional:
+        return bidirectional_dijkstra(graph, s, t, reverse, queue_class)
+
+    distances = {s: 0}
+    parents = {s: None}
+    queue = queue_class()
+    queue.put(s, heuristic(s) if heuristic else 0)
+    while not queue.empty():
+        _, u = queue.get()
+        if u == t:
+            return distances[t], build_path(parents, t)
+        d_u = distances[u]
+        for v, w_uv in graph[u]:
+            d_v = d_u + w_uv
+            if d_v < distances.get(v, inf):
+                distances[v] = d_v
+                parents[v] = u
+                queue.put(v, d_v + heuristic(v) if heuristic else d_v)
+    return inf, []
+
+
+def bidirectional_dijkstra(graph, s, t, reverse=None, queue_class=IndexedPriorityQueue):
+    """双向Dijkstra算法
+
+    同时从s出发进行正向搜索，从t出发在反向图上进行反向搜索，每次扩展当前队列较小的一侧。
+    用mu记录目前找到的经过两侧都已访问过的顶点的最短路径长度，当两个队列的最小权重值之和不小于mu时，
+    任何还未找到的路径都不会比mu更短，此时即可结束。
+    权重非负时每一侧弹出的权重值是单调不减的，因此用两侧最近一次弹出的权重值作为队列最小权重值的下界，
+    不需要优先队列提供peek，`queue_class` 可以是任意与`IndexedPriorityQueue`接口相同的优先队列。
+
+    两侧的搜索半径大约都只有单向搜索的一半，在道路网络这样近似平面的图上，访问的顶点数通常也只有单向搜索的一半左右。
+
+    Example:
+        >>> bidirectional_dijkstra(the_graph, "z", "t")
+        (15, ['z', 's', 'y', 't'])
+    """
+    if s == t:
+        return 0, [s]
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    distances = ({s: 0}, {t: 0})
+    parents = ({s: None}, {t: None})
+    queues = (queue_class(), queue_class())
+    queues[0].put(s, 0)
+    queues[1].put(t, 0)
+    graphs = (graph, reverse)
+    last = [0, 0]    # 两侧最近一次弹出的权重值
+    mu = inf
+    meet = None
+    while not queues[0].empty() and not queues[1].empty():
+        side = 0 if queues[0].size() <= queues[1].size() else 1
+        dist, other_dist, parent = distances[side], distances[1 - side], parents[side]
+        d_u, u = queues[side].get()
+        last[side] = d_u
+        if d_u + last[1 - side] >= mu:
+            break
+        for v, w_uv in graphs[side][u] if u in graphs[side] else ():
+            d_v = d_u + w_uv
+            if d_v < dist.get(v, inf):
+                dist[v] = d_v
+                parent[v] = u
+                queues[side].put(v, d_v)
+            if v in other_dist and dist[v] + other_dist[v] < mu:
+                mu = dist[v] + other_dist[v]
+                meet = v
+    if meet is None:
+        return inf, []
+    path = build_path(parents[0], meet)
+    v = parents[1][meet]
+    while v is not None:
+        path.append(v)
+        v = parents[1][v]
+    return mu, path
+
+
+def reverse_graph(graph):
+    """生成反向图 `{v: [(u, w(u,v)), ...]}`
+    """
+    reverse = {u: [] for u in graph.keys()}
+    for u in graph.keys():
+        for v, w_uv in graph[u]:
+            if v not in reverse:
+                reverse[v] = []
+            reverse[v].append((u, w_uv))
+    return reverse
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
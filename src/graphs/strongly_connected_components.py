@@ -2,7 +2,7 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
-from deep_first_search import dfs_recusion
+from deep_first_search import dfs_iterative, adjacent_vertexs
 
 
 def strongly_connected_components(graph):
@@ -22,18 +22,20 @@ def strongly_connected_components(graph):
     # 1. 对graph进行依次深度优先搜索，拿到
     discoverd = []    # 顶点的探索顺序
     finished = []    # 顶点探索完成的顺序：逆序的。第一个是最后才探索完成的
+    visited = set()
     for start_vertex in graph.keys():
-        dfs_recusion(graph, start_vertex, discoverd, finished)
+        dfs_iterative(graph, start_vertex, discoverd, finished, visited)
     # 2. 计算转置图
     graph_t = tranpose_graph(graph)
     # 3. 对graph_t进行深度优先探索，但是预设探索顺序将按照对原图的dfs的顶点探索完成序列的逆序
     discoverd.clear()
+    visited.clear()
     gt_finished = []
     forests = []    # 深度优先森林
     for vertex in reversed(finished):   # 使用逆序结果
-        dfs_recusion(graph_t, vertex, discoverd, gt_finished)
-        # 当其实探索节点被探索完成，则意味着得到了一颗深度优先树
-        if gt_finished and vertex == gt_finished[0]:
+        dfs_iterative(graph_t, vertex, discoverd, gt_finished, visited)
+        # 当起始探索节点被探索完成，则意味着得到了一颗深度优先树(起始节点是这颗树中最后一个完成探索的节点)
+        if gt_finished and vertex == gt_finished[-1]:
             forests.append(gt_finished[:])
             gt_finished.clear()
     return forests
@@ -42,7 +44,7 @@ def strongly_connected_components(graph):
 def tranpose_graph(graph):
     """对图进行转置
     """
-    graph_t = {}
+    graph_t = {i: [] for i in graph.keys()}    # 没有入边的顶点在转置图中也要保留
     for i in graph.keys():
         for j in graph[i]:
             if j not in graph_t:
@@ -51,6 +53,72 @@ def tranpose_graph(graph):
     return graph_t
 
 
+def tarjan_strongly_connected_components(graph):
+    """计算强连通分量的Tarjan算法(显式栈实现)
+
+    与上面的两次深度优先搜索的方法相比，Tarjan算法只需要对原图进行一次深度优先搜索，也不需要计算转置图：
+        - 为每个顶点记录发现次序index，以及low值：从该顶点出发，经过深度优先树中的边和至多一条回到栈中顶点的边，能到达的最小index
+        - 顶点被发现时压入一个辅助栈，当一个顶点完成探索时如果 low == index，那么它就是一个强连通分量的根，
+          辅助栈中该顶点及其之后压入的顶点就构成了这个强连通分量
+
+    Tarjan算法得到分量的顺序是缩点图的逆拓扑序，为了与`strongly_connected_components`保持一致，最后会将其反转为拓扑序
+
+    深度优先搜索使用显式栈，栈中每一项为(顶点, 邻接顶点迭代器)，因此不受递归深度限制
+
+    Example:
+        >>> graph = {"a": ["b"], "b": ["c", "e", "f"], "c": ["d", "g"], "d": ["c", "h"], "e": ["a", "f"], "f": ["g"], "g": ["f", "h"], "h": ["h"]}
+        >>> tarjan_strongly_connected_components(graph)
+        [['e', 'b', 'a'], ['d', 'c'], ['f', 'g'], ['h']]
+        >>> chain = {i: [i + 1] for i in range(100000)}
+        >>> chain[100000] = [0]
+        >>> len(tarjan_strongly_connected_components(chain))
+        1
+    """
+    index = {}    # 顶点的发现次序
+    low = {}
+    stack = []    # 辅助栈
+    on_stack = set()
+    components = []
+    counter = 0
+    for root in graph.keys():
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacent_vertexs(graph, root)))]
+        while work:
+            vertex, neighbors = work[-1]
+            for next_vertex in neighbors:
+                if next_vertex not in index:
+                    index[next_vertex] = low[next_vertex] = counter
+                    counter += 1
+                    stack.append(next_vertex)
+                    on_stack.add(next_vertex)
+                    work.append((next_vertex, iter(adjacent_vertexs(graph, next_vertex))))
+                    break
+                elif next_vertex in on_stack and index[next_vertex] < low[vertex]:
+                    low[vertex] = index[next_vertex]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[vertex] < low[parent]:
+                        low[parent] = low[vertex]
+                if low[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    components.append(component)
+    components.reverse()
+    return components
+
+
 if __name__ == '__main__':
     the_graph1 = {
         "a": ["b"],
@@ -4,9 +4,11 @@
 # Email: ryomawithlst@gmail/outlook.com
 from deep_first_search import dfs
 
-def topological_sort(graph, start_vertex):
+def topological_sort(graph, start_vertex=None):
     """
     对图进行深度优先搜索后，顶点的探索完成顺序的逆序，就是对该graph的一种拓扑展开顺序
+
+    深度优先搜索使用的是显式栈的实现，因此可以处理很长的依赖链
     """
     d, f = dfs(graph, start_vertex)
     return reversed(f)
@@ -2,7 +2,11 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
-from queue import PriorityQueue
+import os
+import sys
+sys.path.insert(0, "../")
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
 
 
 class HuffmanCodeNode:
@@ -17,24 +21,29 @@ class HuffmanCodeNode:
         return "{}:{}".format(self.char, self.freq)
 
 
-def huffman_code(characters):
+def huffman_code(characters, queue_class=IndexedPriorityQueue):
     """霍夫曼编码
     
     贪心选择：按字符出现频率最低次序的进行选择，来构建霍夫曼编码树
     
     时间复杂度: :math:`O(nlgn)`
+
+    优先队列中的元素为树节点，权重值为节点的频率，只比较频率，频率相同的节点之间不需要可比较。
+    queue_class需要提供与`IndexedPriorityQueue`相同的 `put(item, priority)` 和 `get()` 接口
     
     >>> characters = [("f", 5), ("e", 9), ("c", 12), ("b", 13), ("d", 16), ("a", 45)]
     >>> root_node = huffman_code(characters)
     >>> root_node
     None:100
+    >>> huffman_code([("a", 1), ("b", 1), ("c", 1), ("d", 1)])
+    None:4
     """
-    queue = PriorityQueue()    # 优先级队列，lowest first
+    queue = queue_class()    # 优先级队列，lowest first
     for char, freq in characters:
         # 将每个字符初始化为一个叶节点，并按照字符频率压入优先级队列
         char_node = HuffmanCodeNode(freq)
         char_node.char = char
-        queue.put((freq, char_node))
+        queue.put(char_node, freq)
     
     for i in range(1, len(characters)):
         # 取出当前频率最低的两个节点
@@ -45,7 +54,7 @@ def huffman_code(characters):
         node.left = left_node
         node.right = right_node
         # 再压入优先级队列中
-        queue.put((node.freq, node))
+        queue.put(node, node.freq)
     # 由于前面进行了n-1此循环，因此最后还剩下一个元素，它就是树的根节点
     return queue.get()[1]
     
@@ -2,40 +2,246 @@
 # -*- coding:utf-8 -*-
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
+from array import array
 
 
-class DisjoinSet:
-    """不相交集合-森林
+class ArrayDisjoinSet:
+    """基于整数数组的不相交集合-森林
+
+    元素为 `0 ~ n-1` 的整数，parent和size分别保存在两个 `array('l')` 中，每个元素只占用两个机器字：
+        - find_set: 迭代实现，使用路径减半(path halving)，查找时将路径上的每个结点指向它的祖父结点，不需要递归或第二趟遍历
+        - union: 按大小合并(union by size)，将较小的树合并到较大的树上
+
+    两者结合后，每个操作的摊还时间为 :math:`O(\\alpha(n))` 。
+
+    回滚模式(rollback=True)：每次成功的union都会记录到history中，`rollback(snapshot)` 可以撤销到某个 `snapshot()` 时的状态。
+    由于路径压缩会修改大量结点的parent，难以撤销，回滚模式下find_set不做路径减半，只依靠按大小合并保证树高为 :math:`O(\\lg n)` 。
+
+    Example:
+        >>> disjoin_set = ArrayDisjoinSet(5)
+        >>> disjoin_set.union(0, 1), disjoin_set.union(3, 4), disjoin_set.union(1, 0)
+        (True, True, False)
+        >>> disjoin_set.find_set(0) == disjoin_set.find_set(1), disjoin_set.find_set(1) == disjoin_set.find_set(3)
+        (True, False)
+        >>> disjoin_set.count
+        3
+        >>> disjoin_set.component_labels().tolist()
+        [0, 0, 1, 2, 2]
+        >>> import numpy as np
+        >>> disjoin_set.union_many(np.array([[1, 2], [2, 3]]))
+        2
+        >>> disjoin_set.count
+        1
+
+        回滚模式
+
+        >>> disjoin_set = ArrayDisjoinSet(4, rollback=True)
+        >>> disjoin_set.union(0, 1)
+        True
+        >>> snapshot = disjoin_set.snapshot()
+        >>> disjoin_set.union_many([(1, 2), (2, 3)])
+        2
+        >>> disjoin_set.rollback(snapshot)
+        >>> disjoin_set.component_labels().tolist(), disjoin_set.count
+        ([0, 0, 1, 2], 3)
     """
-    
-    def __init__(self):
-        """实现中使用字典维护集合中元素的关系
+
+    def __init__(self, n=0, rollback=False):
         """
-        self.items = {}
-    
-    def make(self, x):
-        """创建新的集合
+        Args:
+            n: 元素个数
+            rollback: 是否启用回滚模式
         """
-        self.items[x] = {
-            "parent": x,
-            "rank": 0
-        }
-    
-    def find_set(self, x):
+        self.parent = array("l", range(n))
+        self.size = array("l", [1]) * n
+        self.count = n    # 集合的个数
+        self.history = [] if rollback else None    # 回滚模式下记录每次合并时被挂到另一棵树下的根
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self):
+        """添加一个新元素(单独构成一个集合)，返回它的编号
         """
-        使用路径压缩的方式
+        x = len(self.parent)
+        self.parent.append(x)
+        self.size.append(1)
+        self.count += 1
+        return x
+
+    def resize(self, n):
+        """将元素个数扩充到n，新元素各自单独构成一个集合
         """
-        if x != self.items[x]["parent"]:
-            self.items[x]["parent"] = self.find_set(self.items[x]["parent"])
-        return self.items[x]["parent"]
-    
+        old = len(self.parent)
+        if n > old:
+            self.parent.extend(range(old, n))
+            self.size.extend(array("l", [1]) * (n - old))
+            self.count += n - old
+
+    def find_set(self, x):
+        parent = self.parent
+        if self.history is not None:
+            while parent[x] != x:
+                x = parent[x]
+            return x
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
     def union(self, x, y):
+        """合并x和y所在的集合，x和y已经在同一个集合中时返回False
+        """
         x = self.find_set(x)
         y = self.find_set(y)
-        
-        if self.items[x]["rank"] > self.items[y]["rank"]:
-            self.items[y]["parent"] = x
+        if x == y:
+            return False
+        size = self.size
+        if size[x] < size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        size[x] += size[y]
+        self.count -= 1
+        if self.history is not None:
+            self.history.append(y)
+        return True
+
+    def union_many(self, pairs, chunk_size=1 << 16):
+        """依次合并每一对元素，返回成功合并的次数
+
+        Args:
+            pairs: `[(x, y), ...]` 或者形状为 `(k, 2)` 的NumPy整数数组，NumPy数组会按块转换为Python列表后再处理
+        """
+        merged = 0
+        union = self.union
+        if hasattr(pairs, "tolist"):
+            for start in range(0, len(pairs), chunk_size):
+                for x, y in pairs[start:start + chunk_size].tolist():
+                    if union(x, y):
+                        merged += 1
         else:
-            self.items[x]["parent"] = y
-            if self.items[x]["rank"] == self.items[y]["rank"]:
-                self.items[y]["rank"] += 1
+            for x, y in pairs:
+                if union(x, y):
+                    merged += 1
+        return merged
+
+    def component_labels(self):
+        """返回每个元素所在集合的编号(NumPy数组)，集合按其最小元素的顺序编号为 `0 ~ count-1`
+
+        在parent数组的副本上反复执行 `parent = parent[parent]` (指针跳跃)得到每个元素的根，不修改森林本身
+        """
+        import numpy as np
+        roots = np.array(self.parent, dtype=np.int64)
+        while True:
+            grand = roots[roots]
+            if np.array_equal(grand, roots):
+                break
+            roots = grand
+        _, first, labels = np.unique(roots, return_index=True, return_inverse=True)
+        # np.unique按根的编号排序，这里改为按每个集合中最小元素的顺序编号
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first, kind="stable")] = np.arange(len(first))
+        return rank[labels]
+
+    def snapshot(self):
+        """回滚模式下，返回当前状态的标记，供 `rollback` 使用
+        """
+        if self.history is None:
+            raise ValueError("Rollback is not enabled")
+        return len(self.history)
+
+    def rollback(self, snapshot):
+        """撤销snapshot之后的所有合并
+        """
+        if self.history is None:
+            raise ValueError("Rollback is not enabled")
+        parent, size, history = self.parent, self.size, self.history
+        while len(history) > snapshot:
+            y = history.pop()
+            x = parent[y]
+            size[x] -= size[y]
+            parent[y] = y
+            self.count += 1
+
+
+class DisjoinSet:
+    """不相交集合-森林
+
+    元素可以是任意可哈希的标签，标签被映射(interning)为 `0 ~ n-1` 的整数编号后，由 `ArrayDisjoinSet` 维护，
+    查找是迭代实现的，不会因为链过长而超出递归深度，每个元素也只需要两个机器字加上标签表中的一项。
+
+    Example:
+        >>> disjoin_set = DisjoinSet()
+        >>> for x in "abcde":
+        ...     disjoin_set.make(x)
+        >>> disjoin_set.union("a", "b"), disjoin_set.union("d", "e"), disjoin_set.union("b", "a")
+        (True, True, False)
+        >>> disjoin_set.find_set("a") == disjoin_set.find_set("b")
+        True
+        >>> disjoin_set.component_labels()
+        {'a': 0, 'b': 0, 'c': 1, 'd': 2, 'e': 2}
+        >>> disjoin_set.union_many([("c", "d"), ("f", "a")])
+        2
+        >>> sorted(set(disjoin_set.component_labels().values()))
+        [0, 1]
+    """
+
+    def __init__(self, rollback=False):
+        """
+        Args:
+            rollback: 是否启用回滚模式，见 `ArrayDisjoinSet`
+        """
+        self.forest = ArrayDisjoinSet(0, rollback)
+        self.labels = []    # 编号 -> 标签
+        self.index = {}    # 标签 -> 编号
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, x):
+        return x in self.index
+
+    def make(self, x):
+        """创建新的集合，x已存在时不做任何操作
+        """
+        if x not in self.index:
+            self.index[x] = self.forest.add()
+            self.labels.append(x)
+
+    def find_set(self, x):
+        """返回x所在集合的代表元素
+        """
+        return self.labels[self.forest.find_set(self.index[x])]
+
+    def union(self, x, y):
+        """合并x和y所在的集合，x和y已经在同一个集合中时返回False
+        """
+        return self.forest.union(self.index[x], self.index[y])
+
+    def union_many(self, pairs):
+        """依次合并每一对元素，返回成功合并的次数，不存在的元素会自动创建
+        """
+        index, make = self.index, self.make
+        encoded = []
+        for x, y in pairs:
+            if x not in index:
+                make(x)
+            if y not in index:
+                make(y)
+            encoded.append((index[x], index[y]))
+        return self.forest.union_many(encoded)
+
+    def component_labels(self):
+        """返回 `{元素: 集合编号}` ，集合按其第一个元素的创建顺序编号为 `0 ~ count-1`
+        """
+        return dict(zip(self.labels, self.forest.component_labels().tolist()))
+
+    @property
+    def count(self):
+        return self.forest.count
+
+    def snapshot(self):
+        return self.forest.snapshot()
+
+    def rollback(self, snapshot):
+        self.forest.rollback(snapshot)
@@ -5,10 +5,20 @@
 import math
 
 
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+
+
 class FibonacciHeapNode:
-    
-    def __init__(self, key):
+    """斐波那契堆节点
+
+    使用 `__slots__` ，每个节点不再带有 `__dict__` ，占用的内存更少，属性访问也更快
+    """
+
+    __slots__ = ("key", "data", "degree", "parent", "child", "left", "right", "mark")
+
+    def __init__(self, key, data=None):
         self.key = key
+        self.data = data    # 节点携带的数据
         self.degree = 0
         self.parent = None
         self.child = None
@@ -19,11 +29,75 @@ class FibonacciHeapNode:
 
 class FibonacciHeap:
     """斐波那契堆
+
+    各操作的运行时间：
+        - insert / minmum / union: :math:`O(1)`
+        - decrease_key: 摊还 :math:`O(1)` ，节点被剪下后放入根链表，它的父节点如果已经失去过一个孩子(mark为True)，
+          也要被剪下(级联剪枝)，保证度数为k的节点的子树至少有 :math:`F_{k+2}` 个节点
+        - extract_min / delete: 摊还 :math:`O(\\lg n)`
+
+    consolidate使用一个预先分配的度数表，只在堆的大小超过度数表能容纳的上界时才扩充，
+    不需要在每次extract_min时计算 :math:`\\log_\\phi n` 并分配新的列表。
+
+    Example:
+        >>> heap = FibonacciHeap()
+        >>> nodes = [FibonacciHeapNode(key) for key in [5, 2, 7, 1, 8, 10, 3]]
+        >>> for node in nodes:
+        ...     heap.insert(node)
+        >>> heap.extract_min().key
+        1
+        >>> heap.decrease_key(nodes[5], 0)
+        >>> heap.delete(nodes[0])
+        >>> other = FibonacciHeap()
+        >>> other.insert(FibonacciHeapNode(4))
+        >>> heap = heap.union(other)
+        >>> [heap.extract_min().key for _ in range(heap.heap_size)]
+        [0, 2, 3, 4, 7, 8]
+
+        与 `heapq` (使用延迟删除实现decrease-key和delete)对比随机的操作序列
+
+        >>> import heapq, random
+        >>> rng = random.Random(2024)
+        >>> heap, nodes, reference, current = FibonacciHeap(), {}, [], {}
+        >>> mismatches = 0
+        >>> for step in range(5000):
+        ...     op = rng.random()
+        ...     if op < 0.4 or not nodes:
+        ...         key = rng.randrange(1000)
+        ...         nodes[step] = FibonacciHeapNode(key, step)
+        ...         heap.insert(nodes[step])
+        ...         current[step] = key
+        ...         heapq.heappush(reference, (key, step))
+        ...     elif op < 0.7:
+        ...         item = rng.choice(list(nodes))
+        ...         key = current[item] - rng.randrange(100)
+        ...         heap.decrease_key(nodes[item], key)
+        ...         current[item] = key
+        ...         heapq.heappush(reference, (key, item))
+        ...     elif op < 0.8:
+        ...         item = rng.choice(list(nodes))
+        ...         heap.delete(nodes.pop(item))
+        ...         del current[item]
+        ...     else:
+        ...         while current.get(reference[0][1]) != reference[0][0]:
+        ...             _ = heapq.heappop(reference)
+        ...         key, item = heapq.heappop(reference)
+        ...         node = heap.extract_min()
+        ...         mismatches += node.key != key
+        ...         if item != node.data:    # 关键值相同的不同元素
+        ...             heapq.heappush(reference, (key, item))
+        ...         del nodes[node.data], current[node.data]
+        ...     mismatches += heap.heap_size != len(nodes)
+        >>> mismatches
+        0
     """
-    
+
     def __init__(self):
-        self.min: Node = None    # 最小节点
+        self.min: FibonacciHeapNode = None    # 最小节点
         self.heap_size = 0
+        self.degree_table = []    # consolidate中使用的度数表，第k项为度数为k的根节点
+        self.degree_table_limit = 0    # 度数表可以容纳的堆的大小的上界
+        self.grow_degree_table(32)
             
     def create(self):
         pass
@@ -62,13 +136,20 @@ class FibonacciHeap:
         """
         node = self.min
         if node != None:
-            if node.child != None:
-                # 将node的所有孩子添加到根链表中
-                node.child.left.right = node.right
-                node.child.left = node.left
+            # 将node的所有孩子添加到根链表中
+            child = node.child
             for i in range(node.degree):
-                node.child.parent = None
-                node.child = node.child.left
+                next_child = child.right
+                child.parent = None
+                child.left = self.min.left
+                child.right = self.min
+                self.min.left.right = child
+                self.min.left = child
+                child = next_child
+            node.child = None
+            # 将node从根链表中移除
+            node.left.right = node.right
+            node.right.left = node.left
             if node == node.right:    # 处理只有一个节点的情况
                 self.min = None
             else:
@@ -82,49 +163,65 @@ class FibonacciHeap:
     def get_max_degree(self):
         """计算具备size个节点的堆中，单个节点的最大度数(度数上界)
         """
-        golden_ratio = (1+math.sqrt(5))/2
-        return int(math.log(self.heap_size, golden_ratio))
-            
+        return int(math.log(max(self.heap_size, 1), GOLDEN_RATIO)) + 1
+
+    def grow_degree_table(self, length):
+        """将度数表扩充到length项
+
+        度数为k的节点的子树至少有 :math:`F_{k+2} \\ge \\phi^k` 个节点，
+        因此length项的度数表可以容纳大小小于 :math:`\\phi^{length-1}` 的堆
+        """
+        self.degree_table.extend([None] * (length - len(self.degree_table)))
+        self.degree_table_limit = GOLDEN_RATIO ** (length - 1)
+
     def consolidate(self):
         """合并根链表
-        
+
         如果发现根链表中两个节点的度相等，那么就进行合并直到根链表中的节点的度两两不相等
+
+        合并过程中根链表会发生变化，因此先将根链表中的所有节点取出，再逐个处理
         """
-        max_degree = self.get_max_degree()
-        # 记录degree的数值
-        degree_record = [None for i in range(max_degree+1)]
+        if self.heap_size >= self.degree_table_limit:
+            self.grow_degree_table(self.get_max_degree() + 2)
+        degree_record = self.degree_table
         # 对根链表进行遍历
-        node = self.min
-        while node.right != self.min:
+        roots = [self.min]
+        node = self.min.right
+        while node is not self.min:
+            roots.append(node)
+            node = node.right
+        max_degree = 0
+        for node in roots:
             the_degree = node.degree
-            while degree_record[the_degree] != None:
+            while degree_record[the_degree] is not None:
                 the_node = degree_record[the_degree]
                 # 将key值高的节点从根节点移除并作为key值低的节点的子节点
-                if node.key < the_node.key:
-                    self.link(the_node, node)
-                else:
-                    self.link(node, the_node)
+                if the_node.key < node.key:
+                    node, the_node = the_node, node
+                self.link(the_node, node)
                 degree_record[the_degree] = None
                 the_degree += 1
             degree_record[the_degree] = node
-            node = node.right
+            if the_degree > max_degree:
+                max_degree = the_degree
+        # 由度数表重建根链表并重置min node，同时清空度数表供下次使用
         self.min = None
-        # 重置min node
-        for i in range(max_degree+1):
-            if degree_record[i] != None:
-                if self.min == None:
-                    self.min = degree_record[i]
-                    self.min.left = self.min
-                    self.min.right = self.min
+        for i in range(max_degree + 1):
+            node = degree_record[i]
+            if node is not None:
+                degree_record[i] = None
+                if self.min is None:
+                    self.min = node
+                    node.left = node
+                    node.right = node
                 else:
-                    node = degree_record[i]
                     node.right = self.min
                     node.left = self.min.left
                     self.min.left.right = node
                     self.min.left = node
                     if node.key < self.min.key:
                         self.min = node
-        
+
     def link(self, x: FibonacciHeapNode, y: FibonacciHeapNode):
         """链接两个斐波那契堆
         
@@ -147,7 +244,7 @@ class FibonacciHeap:
             y.child = x
             x.left = x
             x.right = x
-        x.parnet = y
+        x.parent = y
         y.degree += 1
         # 3. ···
         x.mark = False
@@ -170,11 +267,14 @@ class FibonacciHeap:
         
         将node节点从当前子堆中剔除，并将node节点放入根链表作为一个根节点
         """
-        # 
+        # 将node从parent的孩子链表中移除
         if node.left == node:
             parent.child = None
         else:
-            parent.child = node.left
+            node.left.right = node.right
+            node.right.left = node.left
+            if parent.child == node:
+                parent.child = node.left
         parent.degree -= 1
         # 
         node.parent = None
@@ -186,48 +286,149 @@ class FibonacciHeap:
     
     def cascading_cut(self, node):
         """级联切断剪枝
-        
-        判断node节点是否已经是第二次失去子节点(如果mark==True)，如果是那么就要对它进行剪枝
+
+        判断node节点是否已经是第二次失去子节点(如果mark==True)，如果是那么就要对它进行剪枝，并继续判断它的父节点。
+        这里使用循环代替递归
         """
-        if node.parent != None:    
-            if node.mark == False:
+        parent = node.parent
+        while parent is not None:
+            if node.mark is False:
                 node.mark = True
-            else:
-                self.cut(node, node.parent)
-                self.cascading_cut(node.parent)
-                
+                return
+            self.cut(node, parent)
+            node, parent = parent, parent.parent
+
     def delete(self, node: FibonacciHeapNode):
         """从堆中删除一个节点
+
+        先将node剪下放入根链表(与decrease_key相同，需要级联剪枝)，再把它当作最小节点弹出，不修改node的关键值
         """
-        self.decrease_key(node, -math.inf)
+        parent = node.parent
+        if parent is not None:
+            self.cut(node, parent)
+            self.cascading_cut(parent)
+        self.min = node
         self.extract_min()
-    
+
     def union(self, heap):
         """合并两个FibonacciHeap为新的FibonacciHeap
         """
-        return union(self, heap)
- 
+        return union(self, heap) 
  
+class FibonacciPriorityQueue:
+    """基于斐波那契堆的优先队列
+
+    与`IndexedPriorityQueue`的接口相同，可作为单源最短路径算法中的优先队列使用。
+    使用一个字典记录每个元素对应的堆节点(handle)，权重减小时直接对节点进行decrease-key，摊还运行时间为 :math:`O(1)`
+
+    Example:
+        >>> queue = FibonacciPriorityQueue()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.put("c", 0)
+        >>> queue.put("a", 9)
+        >>> queue.delete("b")
+        >>> other = FibonacciPriorityQueue()
+        >>> other.put("e", 2)
+        >>> queue.merge(other)
+        >>> [queue.get() for _ in range(queue.size())], other.empty()
+        ([(0, 'c'), (1, 'd'), (2, 'e'), (9, 'a')], True)
+    """
+
+    def __init__(self):
+        self.heap = FibonacciHeap()
+        self.nodes = {}    # 元素 -> 堆节点
+
+    def put(self, item, priority):
+        """插入元素，元素已存在时则更新其权重值
+        """
+        node = self.nodes.get(item)
+        if node is None:
+            node = FibonacciHeapNode(priority, item)
+            self.nodes[item] = node
+            self.heap.insert(node)
+        elif priority < node.key:
+            self.heap.decrease_key(node, priority)
+        elif priority > node.key:
+            # 增大权重值：先删除再重新插入
+            self.heap.delete(node)
+            node.key = priority
+            self.heap.insert(node)
+
+    def get(self):
+        """弹出权重值最小的元素，返回 `(priority, item)`
+        """
+        if self.heap.min is None:
+            raise IndexError("get from an empty priority queue")
+        node = self.heap.extract_min()
+        del self.nodes[node.data]
+        return node.key, node.data
+
+    def decrease_key(self, item, priority):
+        self.heap.decrease_key(self.nodes[item], priority)
+
+    def delete(self, item):
+        """从队列中删除元素
+        """
+        self.heap.delete(self.nodes.pop(item))
+
+    def merge(self, other):
+        """将other中的所有元素移入当前队列，other变为空队列。堆的合并为 :math:`O(1)` ，元素字典的合并为 :math:`O(m)`
+
+        两个队列中不能有相同的元素
+        """
+        self.heap = union(self.heap, other.heap)
+        self.nodes.update(other.nodes)
+        other.heap = FibonacciHeap()
+        other.nodes = {}
+
+    def priority(self, item):
+        return self.nodes[item].key
+
+    def contains(self, item):
+        return item in self.nodes
+
+    __contains__ = contains
+
+    def empty(self):
+        return len(self.nodes) == 0
+
+    def size(self):
+        return len(self.nodes)
+
+    __len__ = size
+
+
 def union(h1: FibonacciHeap, h2: FibonacciHeap) -> FibonacciHeap:
     """合并斐波那契堆
+
+    将两个根链表首尾拼接成一个环，并取两个最小节点中关键值较小的作为新的最小节点，运行时间为 :math:`O(1)` 。
+    合并之后h1和h2不应再被使用
     """
-    heap = FibonacciHeap()    
+    heap = FibonacciHeap()
+    heap.heap_size = h1.heap_size + h2.heap_size
+    if h1.min is None or h2.min is None:
+        heap.min = h2.min if h1.min is None else h1.min
+        return heap
     heap.min = h1.min
-     
-    temp_right = heap.min.right
-    temp_left = h2.min.left
-     
-    temp_right.left = temp_left
-    temp_left.right = temp_right
-     
-    heap.min.right = h2.min
-    h2.min.left = heap.min
-     
-    if h2.min > h1.min:
+
+    # h1: ... -> a -> h1.min -> ...    h2: ... -> b -> h2.min -> ...
+    # 拼接后：... -> a -> h2.min -> ... -> b -> h1.min -> ...
+    a, b = h1.min.left, h2.min.left
+    a.right = h2.min
+    h2.min.left = a
+    b.right = h1.min
+    h1.min.left = b
+
+    if h2.min.key < h1.min.key:
         heap.min = h2.min
-    heap.heap_size = h1.heap_size + h2.heap_size
     return heap
 
 
 class HeapUnderflowError(BaseException):
     pass
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
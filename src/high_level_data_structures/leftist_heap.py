@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+from collections import deque
+
+
+class LeftistHeapNode:
+    """左偏树节点(不可变)
+
+    rank为该节点到最近的空孩子的距离(右路径的长度)，左偏性质要求左孩子的rank不小于右孩子的rank
+    """
+
+    __slots__ = ("key", "data", "left", "right", "rank")
+
+    def __init__(self, key, data=None, left=None, right=None):
+        self.key = key
+        self.data = data
+        # 保证左偏性质：rank较大的子树放在左边
+        if left is None or (right is not None and left.rank < right.rank):
+            left, right = right, left
+        self.left = left
+        self.right = right
+        self.rank = 1 if right is None else right.rank + 1
+
+
+def meld(a, b):
+    """合并两棵左偏树，返回新的根，不修改a和b
+
+    沿两棵树的右路径合并，只复制右路径上的节点(路径复制)，其余子树在新旧两棵树之间共享。
+    左偏树的右路径长度不超过 :math:`\\lg(n+1)` ，因此合并的运行时间和新分配的节点数都是 :math:`O(\\lg n)`
+    """
+    spine = []
+    while a is not None and b is not None:
+        if b.key < a.key:
+            a, b = b, a
+        spine.append(a)
+        a = a.right
+    node = b if a is None else a
+    for top in reversed(spine):
+        node = LeftistHeapNode(top.key, top.data, top.left, node)
+    return node
+
+
+class LeftistHeap:
+    """可持久化左偏树(左偏堆)
+
+    LeftistHeap是不可变的：insert、union、extract_min都返回一个新的堆，原来的堆保持不变，仍然可以继续使用。
+    新旧两个版本共享大部分节点，每个操作只新分配 :math:`O(\\lg n)` 个节点。
+    适用于需要保留多个版本、或者需要频繁合并的场景(例如回溯搜索中每个分支各自的待处理队列)。
+
+    各操作的运行时间：
+        - minmum: :math:`O(1)`
+        - insert / union / extract_min: :math:`O(\\lg n)` (最坏情况)
+        - from_items: :math:`O(n)`
+
+    Example:
+        >>> heap = LeftistHeap.from_items([(5, "a"), (2, "b"), (7, "c")])
+        >>> heap2 = heap.insert(1, "d")
+        >>> node, heap3 = heap2.extract_min()
+        >>> node.key, node.data, len(heap), len(heap2), len(heap3)
+        (1, 'd', 3, 4, 3)
+        >>> merged = heap3.union(LeftistHeap().insert(3, "e"))
+        >>> [node.key for node in merged], [node.key for node in heap]
+        ([2, 3, 5, 7], [2, 5, 7])
+    """
+
+    __slots__ = ("root", "heap_size")
+
+    def __init__(self, root=None, heap_size=0):
+        self.root = root
+        self.heap_size = heap_size
+
+    @classmethod
+    def from_items(cls, items):
+        """由 `[(key, data), ...]` 建堆：先将每个元素作为单节点树放入队列，再不断取出队首的两棵树合并后放回队尾
+        """
+        trees = deque(LeftistHeapNode(key, data) for key, data in items)
+        size = len(trees)
+        while len(trees) > 1:
+            trees.append(meld(trees.popleft(), trees.popleft()))
+        return cls(trees[0] if trees else None, size)
+
+    def insert(self, key, data=None):
+        return LeftistHeap(meld(self.root, LeftistHeapNode(key, data)), self.heap_size + 1)
+
+    def union(self, heap):
+        return LeftistHeap(meld(self.root, heap.root), self.heap_size + heap.heap_size)
+
+    def minmum(self):
+        return self.root
+
+    def extract_min(self):
+        """返回 `(最小节点, 弹出最小节点后的新堆)`
+        """
+        if self.root is None:
+            raise IndexError("extract from an empty heap")
+        return self.root, LeftistHeap(meld(self.root.left, self.root.right), self.heap_size - 1)
+
+    def empty(self):
+        return self.root is None
+
+    def __len__(self):
+        return self.heap_size
+
+    def __iter__(self):
+        """按关键值从小到大遍历堆中的节点，不修改堆
+        """
+        heap = self
+        while heap.root is not None:
+            node, heap = heap.extract_min()
+            yield node
+
+
+class LeftistPriorityQueue:
+    """基于可持久化左偏树的优先队列
+
+    与`IndexedPriorityQueue`、`FibonacciPriorityQueue`的接口相同。左偏树的节点不可变，无法直接修改某个节点的关键值，
+    因此decrease-key采用延迟删除：插入一个新的节点，并在current中记录每个元素当前的权重值，
+    get时跳过权重值与current不一致(或者元素已被删除)的过期节点。过期节点多于有效元素时，由current重新建堆。
+
+    `snapshot()` 返回当前状态的一个副本，只需要拷贝current字典，堆本身是共享的。
+
+    Example:
+        >>> queue = LeftistPriorityQueue()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.put("c", 0)
+        >>> queue.put("a", 9)
+        >>> queue.delete("b")
+        >>> other = LeftistPriorityQueue()
+        >>> other.put("e", 2)
+        >>> queue.merge(other)
+        >>> saved = queue.snapshot()
+        >>> [queue.get() for _ in range(queue.size())], other.empty()
+        ([(0, 'c'), (1, 'd'), (2, 'e'), (9, 'a')], True)
+        >>> saved.get(), len(saved)
+        ((0, 'c'), 3)
+    """
+
+    def __init__(self):
+        self.heap = LeftistHeap()
+        self.current = {}    # 元素 -> 当前的权重值
+
+    def put(self, item, priority):
+        """插入元素，元素已存在时则更新其权重值
+        """
+        if item in self.current and self.current[item] == priority:
+            return
+        self.current[item] = priority
+        self.heap = self.heap.insert(priority, item)
+        if len(self.heap) > 2 * len(self.current) + 16:
+            self.compact()
+
+    def get(self):
+        """弹出权重值最小的元素，返回 `(priority, item)`
+        """
+        current = self.current
+        if not current:
+            raise IndexError("get from an empty priority queue")
+        heap = self.heap
+        while True:
+            node, heap = heap.extract_min()
+            if node.data in current and current[node.data] == node.key:
+                break
+        self.heap = heap
+        del current[node.data]
+        return node.key, node.data
+
+    def decrease_key(self, item, priority):
+        if priority > self.current[item]:
+            raise ValueError("New priority is greater than current priority")
+        self.put(item, priority)
+
+    def delete(self, item):
+        """从队列中删除元素，对应的节点留在堆中，之后被当作过期节点跳过
+        """
+        del self.current[item]
+
+    def merge(self, other):
+        """将other中的所有元素移入当前队列，other变为空队列，两个队列中不能有相同的元素
+        """
+        self.heap = self.heap.union(other.heap)
+        self.current.update(other.current)
+        other.heap = LeftistHeap()
+        other.current = {}
+
+    def compact(self):
+        """丢弃所有过期节点，由current重新建堆
+        """
+        self.heap = LeftistHeap.from_items((priority, item) for item, priority in self.current.items())
+
+    def snapshot(self):
+        queue = LeftistPriorityQueue()
+        queue.heap = self.heap
+        queue.current = dict(self.current)
+        return queue
+
+    def priority(self, item):
+        return self.current[item]
+
+    def contains(self, item):
+        return item in self.current
+
+    __contains__ = contains
+
+    def empty(self):
+        return len(self.current) == 0
+
+    def size(self):
+        return len(self.current)
+
+    __len__ = size
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+import os
+import sys
+sys.path.insert(0, "../")
+sys.path.insert(0, "../graphs/")
+sys.path.insert(0, "../greedy_algorithm/")
+
+import random
+import time
+
+from data_structures.queues.indexed_priority_queue import IndexedPriorityQueue
+from high_level_data_structures.fibonacci_heap import FibonacciPriorityQueue
+from high_level_data_structures.leftist_heap import LeftistPriorityQueue
+from high_level_data_structures.pairing_heap import PairingPriorityQueue
+from high_level_data_structures.skew_heap import SkewPriorityQueue
+from hoffman_code import huffman_code
+from mst_prim import PrimMST
+from ssp_dijkstra import DijkstraSSP
+from ssp_dijkstra_benchmark import random_graph
+
+
+QUEUE_CLASSES = {
+    "binary": IndexedPriorityQueue,
+    "fibonacci": FibonacciPriorityQueue,
+    "pairing": PairingPriorityQueue,
+    "skew": SkewPriorityQueue,
+    "leftist": LeftistPriorityQueue,
+}
+
+
+def random_undirected_graph(vertex_count, edge_count, seed=0):
+    """生成随机的连通无向图(字典形式)，先生成一条经过所有顶点的路径，其余的边随机生成
+    """
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(vertex_count)}
+    edges = [(i, i + 1) for i in range(vertex_count - 1)]
+    edges += [(rng.randrange(vertex_count), rng.randrange(vertex_count)) for _ in range(edge_count - len(edges))]
+    for u, v in edges:
+        w = rng.randint(1, 10**6)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    return graph
+
+
+def merge_workload(queue_class, operation_count, queue_count=16, seed=0):
+    """合并密集的操作序列：在queue_count个队列上随机地put、decrease-key、get，并不断将两个队列合并
+
+    只有提供merge方法的优先队列才能运行这个负载，返回所有get得到的权重值之和。
+    权重值为随机浮点数，不会出现相同的权重值，因此各实现的操作序列和结果完全相同
+    """
+    rng = random.Random(seed)
+    queues = [queue_class() for _ in range(queue_count)]
+    total = 0
+    for step in range(operation_count):
+        queue = queues[rng.randrange(queue_count)]
+        op = rng.random()
+        if op < 0.5 or queue.empty():
+            queue.put(step, rng.random())
+        elif op < 0.7:
+            item = step - 1
+            if item in queue:
+                queue.decrease_key(item, queue.priority(item) / 2)
+        elif op < 0.95:
+            total += queue.get()[0]
+        else:
+            i, j = rng.sample(range(queue_count), 2)
+            queues[i].merge(queues[j])
+    return total
+
+
+def benchmark(vertex_count=10000, edge_count=50000, repeat=3, queue_classes=None):
+    """按照本仓库中优先队列的调用场景比较各优先队列实现的运行时间
+
+    负载：
+        - dijkstra: `DijkstraSSP` ，大量的decrease-key
+        - prim: `PrimMST` ，大量的decrease-key
+        - huffman: `huffman_code` ，vertex_count个字符，只有insert和extract-min
+        - merge: `merge_workload` ，edge_count次操作，包含合并，只运行提供merge方法的实现
+
+    每个负载对每种优先队列运行repeat次，取最短时间，并检查所有实现得到的结果相同
+
+    Returns:
+        list: `[(负载, 优先队列, 秒数), ...]`
+    """
+    queue_classes = queue_classes or QUEUE_CLASSES
+    directed_graph = random_graph(vertex_count, edge_count, lambda rng: rng.randint(1, 10**6))
+    undirected_graph = random_undirected_graph(vertex_count, edge_count)
+    rng = random.Random(0)
+    characters = [(i, rng.randint(1, 10**6)) for i in range(vertex_count)]
+
+    def huffman_cost(queue_class):
+        # 霍夫曼树的总代价(所有内部节点的频率之和)与频率相同时的选择无关
+        root = huffman_code(characters, queue_class)
+        cost, stack = 0, [root]
+        while stack:
+            node = stack.pop()
+            if node.left is not None:
+                cost += node.freq
+                stack.extend((node.left, node.right))
+        return cost
+
+    def dijkstra_distances(queue_class):
+        dijkstra = DijkstraSSP(directed_graph, 0, queue_class=queue_class)
+        return [dijkstra.get_shortest_weight(v) for v in directed_graph.keys()]
+
+    workloads = {
+        "dijkstra": dijkstra_distances,
+        "prim": lambda queue_class: PrimMST(undirected_graph, 0, queue_class).minmum_weight,
+        "huffman": huffman_cost,
+        "merge": lambda queue_class: merge_workload(queue_class, edge_count),
+    }
+    results = []
+    for workload, run in workloads.items():
+        expected = None
+        for name, queue_class in queue_classes.items():
+            if workload == "merge" and not hasattr(queue_class, "merge"):
+                continue
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = run(queue_class)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            if expected is None:
+                expected = result
+            elif result != expected:
+                raise AssertionError("{} returns a different result on {}".format(name, workload))
+            results.append((workload, name, best))
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Mergeable priority queue benchmark")
+    parser.add_argument("--vertices", type=int, default=10000)
+    parser.add_argument("--edges", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("{:<12}{:<12}{:>10}".format("workload", "queue", "seconds"))
+    for workload, name, seconds in benchmark(args.vertices, args.edges, args.repeat):
+        print("{:<12}{:<12}{:>10.4f}".format(workload, name, seconds))
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+
+
+class PairingHeapNode:
+    """配对堆节点
+
+    每个节点只记录第一个孩子(child)，孩子之间使用兄弟指针(sibling)串成单链表，
+    prev指向前一个兄弟，如果是第一个孩子，则指向父节点，便于在decrease-key时将节点从树中剪下
+    """
+
+    def __init__(self, key, data=None):
+        self.key = key
+        self.data = data
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+
+class PairingHeap:
+    """配对堆
+
+    配对堆是一棵满足最小堆性质的多叉树，所有操作都基于一个简单的合并(meld)操作：比较两棵树的根，将根较大的树作为根较小的树的第一个孩子。
+        - insert: 将新节点作为一棵单节点树与堆合并， :math:`O(1)`
+        - decrease_key: 将节点连同它的子树从原位置剪下，减小关键字后再与根合并， :math:`O(1)` (摊还时间的上界为 :math:`o(\\lg n)` )
+        - extract_min: 删除根后，对根的所有孩子进行两趟合并(two-pass)：先从左到右两两合并，再从右到左依次合并， 摊还 :math:`O(\\lg n)`
+
+    虽然配对堆的理论界不如斐波那契堆，但它的结构简单、常数很小，实际运行中通常比斐波那契堆更快。
+
+    Example:
+        >>> heap = PairingHeap()
+        >>> nodes = [PairingHeapNode(key) for key in [5, 2, 7, 1, 8, 10, 3]]
+        >>> for node in nodes:
+        ...     heap.insert(node)
+        >>> heap.decrease_key(nodes[5], 0)
+        >>> [heap.extract_min().key for _ in range(len(nodes))]
+        [0, 1, 2, 3, 5, 7, 8]
+    """
+
+    def __init__(self):
+        self.root = None
+        self.heap_size = 0
+
+    def meld(self, a, b):
+        """合并两棵树，返回新的根
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        # 将b作为a的第一个孩子
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        a.prev = None
+        return a
+
+    def insert(self, node):
+        node.child = node.sibling = node.prev = None
+        self.root = self.meld(self.root, node)
+        self.heap_size += 1
+
+    def minmum(self):
+        return self.root
+
+    def extract_min(self):
+        """弹出最小节点
+        """
+        node = self.root
+        if node is not None:
+            self.root = self.merge_pairs(node.child)
+            node.child = None
+            self.heap_size -= 1
+        return node
+
+    def merge_pairs(self, first):
+        """两趟合并：第一趟从左到右两两合并，第二趟从右到左依次合并到最后一棵树上
+
+        这里没有使用递归，而是用一个列表保存第一趟合并得到的树
+        """
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = node.sibling
+            if b is None:
+                node = None
+            else:
+                node = b.sibling
+                b.sibling = b.prev = None
+            a.sibling = a.prev = None
+            pairs.append(self.meld(a, b))
+        root = None
+        for tree in reversed(pairs):
+            root = self.meld(tree, root)
+        return root
+
+    def cut(self, node):
+        """将以node为根的子树从树中剪下
+        """
+        if node.prev.child is node:    # node是第一个孩子，prev是父节点
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+    def decrease_key(self, node, key):
+        """减小node节点的关键值
+        """
+        if key > node.key:
+            raise Exception("New key is greater than current key")
+        node.key = key
+        if node is not self.root:
+            self.cut(node)
+            self.root = self.meld(self.root, node)
+
+    def delete(self, node):
+        """从堆中删除一个节点
+        """
+        if node is self.root:
+            self.extract_min()
+            return
+        self.cut(node)
+        subtree = self.merge_pairs(node.child)
+        node.child = None
+        self.root = self.meld(self.root, subtree)
+        self.heap_size -= 1
+
+    def union(self, heap):
+        """合并两个PairingHeap为新的PairingHeap，运行时间为 :math:`O(1)` ，合并之后原来的两个堆不应再被使用
+        """
+        new_heap = PairingHeap()
+        new_heap.root = self.meld(self.root, heap.root)
+        new_heap.heap_size = self.heap_size + heap.heap_size
+        return new_heap
+
+
+class PairingPriorityQueue:
+    """基于配对堆的优先队列
+
+    与`IndexedPriorityQueue`的接口相同，可作为单源最短路径算法中的优先队列使用
+
+    Example:
+        >>> queue = PairingPriorityQueue()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.put("c", 0)
+        >>> queue.put("a", 9)
+        >>> queue.delete("b")
+        >>> other = PairingPriorityQueue()
+        >>> other.put("e", 2)
+        >>> queue.merge(other)
+        >>> [queue.get() for _ in range(queue.size())], other.empty()
+        ([(0, 'c'), (1, 'd'), (2, 'e'), (9, 'a')], True)
+    """
+
+    def __init__(self):
+        self.heap = PairingHeap()
+        self.nodes = {}    # 元素 -> 堆节点
+
+    def put(self, item, priority):
+        """插入元素，元素已存在时则更新其权重值
+        """
+        node = self.nodes.get(item)
+        if node is None:
+            node = PairingHeapNode(priority, item)
+            self.nodes[item] = node
+            self.heap.insert(node)
+        elif priority < node.key:
+            self.heap.decrease_key(node, priority)
+        elif priority > node.key:
+            self.heap.delete(node)
+            node.key = priority
+            self.heap.insert(node)
+
+    def get(self):
+        """弹出权重值最小的元素，返回 `(priority, item)`
+        """
+        if self.heap.root is None:
+            raise IndexError("get from an empty priority queue")
+        node = self.heap.extract_min()
+        del self.nodes[node.data]
+        return node.key, node.data
+
+    def decrease_key(self, item, priority):
+        self.heap.decrease_key(self.nodes[item], priority)
+
+    def delete(self, item):
+        """从队列中删除元素
+        """
+        self.heap.delete(self.nodes.pop(item))
+
+    def merge(self, other):
+        """将other中的所有元素移入当前队列，other变为空队列，两个队列中不能有相同的元素
+        """
+        self.heap = self.heap.union(other.heap)
+        self.nodes.update(other.nodes)
+        other.heap = PairingHeap()
+        other.nodes = {}
+
+    def priority(self, item):
+        return self.nodes[item].key
+
+    def contains(self, item):
+        return item in self.nodes
+
+    __contains__ = contains
+
+    def empty(self):
+        return len(self.nodes) == 0
+
+    def size(self):
+        return len(self.nodes)
+
+    __len__ = size
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+
+
+class RadixHeap:
+    """基数堆(单调整数优先队列)
+
+    Dijkstra算法中依次取出的最小距离是单调不减的，且边的权重为非负整数时距离也是整数，基数堆正是利用了这两个性质：
+        - 记录上一次弹出的关键字last，新插入的关键字必须不小于last
+        - 关键字为key的元素放入编号为 `bit_length(key ^ last)` 的桶中，即按key与last的二进制表示最高的不同位进行分桶，0号桶中的关键字都等于last
+        - 弹出时如果0号桶为空，那么找到第一个非空的桶，取其中的最小关键字作为新的last，并将该桶中的元素重新分配到更小编号的桶中
+
+    每个元素只会向更小编号的桶移动，因此对于关键字不超过C的情况，每个元素最多被移动 :math:`O(\\lg C)` 次。
+    每个桶使用字典存储，decrease-key时可以 :math:`O(1)` 地将元素从原来的桶中取出再放入新桶。
+
+    接口与`IndexedPriorityQueue`相同。关键字可以是取整数值的浮点数(如 `SSPResult` 中 `array('d')` 保存的距离)，分桶时会先转换为整数；
+    分桶只对整数有意义，因此带小数部分的关键字(以及inf、nan)会引发ValueError，这类情况应使用 `IndexedPriorityQueue` 。
+
+    Example:
+        >>> queue = RadixHeap()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.get()
+        (1, 'd')
+        >>> queue.put("c", 0)
+        Traceback (most recent call last):
+            ...
+        ValueError: Priority 0 is smaller than the last extracted priority 1
+        >>> queue.put("c", 4)
+        >>> [queue.get() for _ in range(queue.size())]
+        [(3, 'b'), (4, 'c'), (5, 'a')]
+        >>> queue.put("e", 6.0)
+        >>> queue.put("f", 6.5)
+        Traceback (most recent call last):
+            ...
+        ValueError: Priority 6.5 is not an integer
+    """
+
+    def __init__(self, bits=64):
+        """
+        Args:
+            bits: 关键字的最大二进制位数
+        """
+        self.buckets = [{} for _ in range(bits + 1)]    # 桶：元素 -> 关键字
+        self.bucket_of = {}    # 元素 -> 所在的桶编号
+        self.last = 0
+
+    def put(self, item, priority):
+        """插入元素，元素已存在时则更新其权重值
+        """
+        if priority % 1:    # inf、nan对1取余的结果为nan，同样会被拒绝
+            raise ValueError("Priority {} is not an integer".format(priority))
+        if priority < self.last:
+            raise ValueError(
+                "Priority {} is smaller than the last extracted priority {}".format(priority, self.last)
+            )
+        if item in self.bucket_of:
+            del self.buckets[self.bucket_of[item]][item]
+        b = (int(priority) ^ self.last).bit_length()
+        self.buckets[b][item] = priority
+        self.bucket_of[item] = b
+
+    decrease_key = put
+
+    def get(self):
+        """弹出权重值最小的元素，返回 `(priority, item)`
+        """
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while i < len(buckets) and not buckets[i]:
+                i += 1
+            if i == len(buckets):
+                raise IndexError("get from an empty priority queue")
+            bucket = buckets[i]
+            buckets[i] = {}
+            last = self.last = int(min(bucket.values()))
+            # 重新分配到更小编号的桶中
+            for item, priority in bucket.items():
+                b = (int(priority) ^ last).bit_length()
+                buckets[b][item] = priority
+                self.bucket_of[item] = b
+        item, priority = buckets[0].popitem()
+        del self.bucket_of[item]
+        return priority, item
+
+    def priority(self, item):
+        return self.buckets[self.bucket_of[item]][item]
+
+    def contains(self, item):
+        return item in self.bucket_of
+
+    __contains__ = contains
+
+    def empty(self):
+        return len(self.bucket_of) == 0
+
+    def size(self):
+        return len(self.bucket_of)
+
+    __len__ = size
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
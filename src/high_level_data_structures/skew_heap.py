@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# Author: Luo-Songtao
+# Email: ryomawithlst@gmail/outlook.com
+
+
+class SkewHeapNode:
+    """斜堆节点
+
+    parent指向父节点，便于在decrease-key和delete时将节点连同它的子树从树中剪下
+    """
+
+    __slots__ = ("key", "data", "left", "right", "parent")
+
+    def __init__(self, key, data=None):
+        self.key = key
+        self.data = data
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+class SkewHeap:
+    """斜堆(自调整的左偏树)
+
+    斜堆是一棵满足最小堆性质的二叉树，所有操作都基于合并(meld)：沿两棵树的右路径自顶向下合并，
+    每经过一个节点就交换它的左右孩子。斜堆不需要记录任何平衡信息，合并的摊还运行时间为 :math:`O(\\lg n)` ：
+        - insert: 将新节点作为一棵单节点树与堆合并
+        - extract_min: 删除根后合并它的左右子树
+        - decrease_key / delete: 将节点连同它的子树从父节点剪下，减小关键字后(或删除节点、合并它的两棵子树后)再与根合并
+        - union: 合并两个堆的根
+
+    右路径在最坏情况下可能很长，这里的合并使用循环实现，不会超出递归深度。
+
+    Example:
+        >>> heap = SkewHeap()
+        >>> nodes = [SkewHeapNode(key) for key in [5, 2, 7, 1, 8, 10, 3]]
+        >>> for node in nodes:
+        ...     heap.insert(node)
+        >>> heap.decrease_key(nodes[5], 0)
+        >>> heap.delete(nodes[2])
+        >>> other = SkewHeap()
+        >>> other.insert(SkewHeapNode(4))
+        >>> heap = heap.union(other)
+        >>> [heap.extract_min().key for _ in range(heap.heap_size)]
+        [0, 1, 2, 3, 4, 5, 8]
+    """
+
+    def __init__(self):
+        self.root = None
+        self.heap_size = 0
+
+    @staticmethod
+    def meld(a, b):
+        """合并两棵树，返回新的根
+
+        自顶向下：当前节点a的关键值较小，它的新的左子树为(原右子树与b合并的结果)，新的右子树为原左子树
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        root = a
+        root.parent = None
+        while True:
+            right = a.right
+            a.right = a.left
+            if right is None:
+                a.left = b
+                b.parent = a
+                return root
+            if b.key < right.key:
+                right, b = b, right
+            a.left = right
+            right.parent = a
+            a = right
+
+    def insert(self, node):
+        node.left = node.right = node.parent = None
+        self.root = self.meld(self.root, node)
+        self.heap_size += 1
+
+    def minmum(self):
+        return self.root
+
+    def extract_min(self):
+        """弹出最小节点
+        """
+        node = self.root
+        if node is not None:
+            self.root = self.detach_children(node)
+            self.heap_size -= 1
+        return node
+
+    def detach_children(self, node):
+        """将node的两棵子树取下并合并，返回合并后的根
+        """
+        left, right = node.left, node.right
+        node.left = node.right = None
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+        return self.meld(left, right)
+
+    def cut(self, node):
+        """将以node为根的子树从树中剪下
+        """
+        parent = node.parent
+        if parent.left is node:
+            parent.left = None
+        else:
+            parent.right = None
+        node.parent = None
+
+    def decrease_key(self, node, key):
+        """减小node节点的关键值
+        """
+        if key > node.key:
+            raise Exception("New key is greater than current key")
+        node.key = key
+        if node is not self.root and key < node.parent.key:
+            self.cut(node)
+            self.root = self.meld(self.root, node)
+
+    def delete(self, node):
+        """从堆中删除一个节点
+        """
+        if node is self.root:
+            self.extract_min()
+            return
+        self.cut(node)
+        self.root = self.meld(self.root, self.detach_children(node))
+        self.heap_size -= 1
+
+    def union(self, heap):
+        """合并两个SkewHeap为新的SkewHeap，合并之后原来的两个堆不应再被使用
+        """
+        new_heap = SkewHeap()
+        new_heap.root = self.meld(self.root, heap.root)
+        new_heap.heap_size = self.heap_size + heap.heap_size
+        return new_heap
+
+
+class SkewPriorityQueue:
+    """基于斜堆的优先队列
+
+    与`IndexedPriorityQueue`、`FibonacciPriorityQueue`的接口相同，可作为单源最短路径、Prim、霍夫曼编码等算法中的优先队列使用
+
+    Example:
+        >>> queue = SkewPriorityQueue()
+        >>> for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        ...     queue.put(item, priority)
+        >>> queue.put("c", 0)
+        >>> queue.put("a", 9)
+        >>> queue.delete("b")
+        >>> other = SkewPriorityQueue()
+        >>> other.put("e", 2)
+        >>> queue.merge(other)
+        >>> [queue.get() for _ in range(queue.size())], other.empty()
+        ([(0, 'c'), (1, 'd'), (2, 'e'), (9, 'a')], True)
+    """
+
+    def __init__(self):
+        self.heap = SkewHeap()
+        self.nodes = {}    # 元素 -> 堆节点
+
+    def put(self, item, priority):
+        """插入元素，元素已存在时则更新其权重值
+        """
+        node = self.nodes.get(item)
+        if node is None:
+            node = SkewHeapNode(priority, item)
+            self.nodes[item] = node
+            self.heap.insert(node)
+        elif priority < node.key:
+            self.heap.decrease_key(node, priority)
+        elif priority > node.key:
+            self.heap.delete(node)
+            node.key = priority
+            self.heap.insert(node)
+
+    def get(self):
+        """弹出权重值最小的元素，返回 `(priority, item)`
+        """
+        if self.heap.root is None:
+            raise IndexError("get from an empty priority queue")
+        node = self.heap.extract_min()
+        del self.nodes[node.data]
+        return node.key, node.data
+
+    def decrease_key(self, item, priority):
+        self.heap.decrease_key(self.nodes[item], priority)
+
+    def delete(self, item):
+        """从队列中删除元素
+        """
+        self.heap.delete(self.nodes.pop(item))
+
+    def merge(self, other):
+        """将other中的所有元素移入当前队列，other变为空队列，两个队列中不能有相同的元素
+        """
+        self.heap = self.heap.union(other.heap)
+        self.nodes.update(other.nodes)
+        other.heap = SkewHeap()
+        other.nodes = {}
+
+    def priority(self, item):
+        return self.nodes[item].key
+
+    def contains(self, item):
+        return item in self.nodes
+
+    __contains__ = contains
+
+    def empty(self):
+        return len(self.nodes) == 0
+
+    def size(self):
+        return len(self.nodes)
+
+    __len__ = size
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
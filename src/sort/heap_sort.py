@@ -3,7 +3,11 @@
 # Author: Luo-Songtao
 # Email: ryomawithlst@gmail/outlook.com
 
-import math
+import os
+import sys
+sys.path.insert(0, "../")
+
+from data_structures.heaps.binary_max_heap import BinaryMaxHeap
 
 
 def heap_sort(array: list):
@@ -29,7 +33,7 @@ def heap_sort(array: list):
     
     Example:
         >>> the_array = [41, 22, 36, 7, 21, 27, 18, 3, 79, 8, 43, 27, 45, 36, 84, 7, 47]
-        >>> heap_sort(the_array, max(the_array))
+        >>> heap_sort(the_array)
         >>> the_array
         [3, 7, 7, 8, 18, 21, 22, 27, 27, 36, 36, 41, 43, 45, 47, 79, 84]
     """
@@ -43,11 +47,6 @@ def heap_sort(array: list):
 
 
 if __name__ == '__main__':
-    import os
-    import sys
-    sys.path.insert(0, os.path.abspath('../data_structures/heaps/'))
-    from binary_max_heap import BinaryMaxHeap
-    
     the_array = [41,22,36,7,21,27,18,3,79,8,43,27,45,36,84,7,47]
     heap_sort(the_array)
     print(the_array)
\ No newline at end of file